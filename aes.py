@@ -0,0 +1,179 @@
+import io
+import os
+import time
+
+import streamlit as st
+
+import sessao
+from desempenho import mostrar_vazao
+from educasec import perf
+
+try:
+    import numpy as np
+    from educasec.aes import (
+        MODOS, TAMANHOS_CHAVE, cifrar_bytes, cifrar_fluxo, decifrar_fluxo, gerar_chave, medir_vazao
+    )
+except ImportError:
+    st.error("""
+    ⚠️ Esta página requer as bibliotecas `pycryptodome` e `numpy`.
+    Por favor, instale-as usando o seguinte comando no seu terminal:
+    ```
+    pip install pycryptodome numpy
+    ```
+    """)
+    st.stop()
+
+# Tamanho cifrado na memória em cada medição de vazão
+TAMANHO_MEDICAO = 16 << 20
+
+DESCRICAO_MODOS = {
+    "CBC": "CBC: cada bloco é misturado com o bloco cifrado anterior. Precisa de preenchimento e não paraleliza a cifragem.",
+    "CTR": "CTR: o AES cifra um contador e o resultado é combinado (XOR) com os dados. Cada bloco é independente, então dá para usar várias threads.",
+    "GCM": "GCM: o CTR com uma etiqueta de autenticação. Detecta qualquer alteração no arquivo ou chave errada.",
+}
+
+def desenhar_cadeado(lado=256):
+    """
+    Imagem em tons de cinza (um byte por pixel) de um cadeado, com grandes
+    áreas de uma cor só: o tipo de imagem em que o ECB mais vaza.
+    """
+    linhas, colunas = np.mgrid[0:lado, 0:lado]
+    escala = lado / 256
+    imagem = np.full((lado, lado), 235, dtype=np.uint8)
+    distancia = np.hypot(linhas - 110 * escala, colunas - 128 * escala)
+    imagem[(distancia >= 40 * escala) & (distancia <= 60 * escala) & (linhas <= 120 * escala)] = 90
+    imagem[(linhas >= 110 * escala) & (linhas <= 225 * escala) & (abs(colunas - 128 * escala) <= 80 * escala)] = 30
+    buraco = np.hypot(linhas - 155 * escala, colunas - 128 * escala) <= 14 * escala
+    fenda = (linhas >= 155 * escala) & (linhas <= 195 * escala) & (abs(colunas - 128 * escala) <= 5 * escala)
+    imagem[buraco | fenda] = 235
+    return imagem
+
+def processar_arquivo(arquivo, chave, operacao, modo, threads):
+    """
+    Cifra ou decifra o arquivo enviado, em blocos, e guarda o resultado.
+    """
+    arquivo.seek(0)
+    saida = io.BytesIO()
+    inicio = time.perf_counter()
+    with perf.medir(f"aes.{operacao.lower()}.{modo}"):
+        if operacao == "Cifrar":
+            total = cifrar_fluxo(arquivo, saida, chave, modo, threads=threads)
+        else:
+            total = decifrar_fluxo(arquivo, saida, chave, modo, threads=threads)
+    segundos = time.perf_counter() - inicio
+
+    nome = f"{arquivo.name}.aes" if operacao == "Cifrar" else arquivo.name.removesuffix(".aes")
+    sessao.guardar("aes_saida", saida.getvalue(), descartavel=True)
+    st.session_state["aes_resultado"] = (nome, total, segundos)
+
+def tabela_vazao(threads):
+    """
+    Mede a vazão de cada modo com cada tamanho de chave.
+    """
+    linhas = []
+    barra = st.progress(0.0, text="Medindo...")
+    passos = len(MODOS) * len(TAMANHOS_CHAVE) + 1
+    for numero, (modo, bits) in enumerate(((modo, bits) for modo in MODOS for bits in TAMANHOS_CHAVE), start=1):
+        barra.progress(numero / passos, text=f"Medindo AES-{bits} {modo}...")
+        linhas.append({"Modo": modo, "Chave": f"{bits} bits", "MB/s": round(medir_vazao(modo, bits, TAMANHO_MEDICAO)[0])})
+    barra.progress(1.0, text=f"Medindo AES-256 CTR com {threads} threads...")
+    linhas.append({"Modo": f"CTR ({threads} threads)", "Chave": "256 bits",
+                   "MB/s": round(medir_vazao("CTR", 256, TAMANHO_MEDICAO, threads)[0])})
+    barra.empty()
+    return linhas
+
+# O código para a cifra AES deve estar dentro de uma função.
+# A função será importada pelo arquivo principal (app.py).
+def app():
+    """
+    Exibe a página do AES (criptografia simétrica).
+    """
+    st.title("🧱 AES - Criptografia Simétrica")
+    st.write(
+        "O **AES** (Advanced Encryption Standard) usa a **mesma chave** para cifrar e decifrar. "
+        "Ele cifra blocos de 16 bytes; o **modo de operação** define como os blocos de um arquivo "
+        "inteiro são encadeados. É o AES que protege o Wi-Fi, o HTTPS e os arquivos do celular."
+    )
+    st.markdown("---")
+
+    ## Chave
+    st.header("🔑 Chave")
+    col1, col2 = st.columns([1, 3])
+    with col1:
+        bits = st.selectbox("Tamanho:", TAMANHOS_CHAVE, index=2, format_func=lambda bits: f"{bits} bits")
+        if st.button("🎲 Gerar chave") or "aes_chave" not in st.session_state:
+            st.session_state["aes_chave"] = gerar_chave(bits).hex()
+    with col2:
+        chave_hex = st.text_input("Chave (hexadecimal; guarde-a para decifrar):", key="aes_chave")
+    try:
+        chave = bytes.fromhex(chave_hex)
+        if len(chave) * 8 not in TAMANHOS_CHAVE:
+            raise ValueError
+    except ValueError:
+        st.error("❌ A chave deve ter 32, 48 ou 64 dígitos hexadecimais (128, 192 ou 256 bits).")
+        return
+    st.markdown("---")
+
+    ## Arquivos
+    st.header("Cifrar ou Decifrar um Arquivo")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        operacao = st.radio("Operação:", ("Cifrar", "Decifrar"), horizontal=True)
+    with col2:
+        modo = st.selectbox("Modo:", MODOS, index=2)
+    with col3:
+        threads = st.slider("Threads (só CTR):", min_value=1, max_value=max(8, os.cpu_count() or 1), value=1,
+                            disabled=modo != "CTR")
+    st.caption(DESCRICAO_MODOS[modo])
+
+    arquivo = st.file_uploader("Arquivo:", key="aes_arquivo")
+    if arquivo is not None and st.button(f"⚙️ {operacao}"):
+        try:
+            processar_arquivo(arquivo, chave, operacao, modo, threads)
+        except ValueError as erro:
+            st.session_state.pop("aes_resultado", None)
+            st.error(f"❌ {erro}")
+
+    resultado = st.session_state.get("aes_resultado")
+    if resultado:
+        nome, total, segundos = resultado
+        mostrar_vazao(total, segundos)
+        st.download_button("📥 Baixar resultado", data=sessao.ler("aes_saida", b""),
+                           file_name=nome, mime="application/octet-stream")
+    st.markdown("---")
+
+    ## Vazão
+    st.header("📈 Vazão por Modo e Tamanho de Chave")
+    st.write(
+        f"Cifra {TAMANHO_MEDICAO >> 20} MB na memória com cada combinação, escrevendo direto em um "
+        "buffer já alocado. Chaves maiores fazem mais rodadas (10, 12 ou 14); o CTR com várias "
+        "threads só acelera se o servidor tiver vários núcleos."
+    )
+    threads_medicao = os.cpu_count() or 1
+    if st.button("⏱️ Medir"):
+        st.session_state["aes_vazao"] = tabela_vazao(max(2, threads_medicao))
+    if "aes_vazao" in st.session_state:
+        linhas = st.session_state["aes_vazao"]
+        st.bar_chart(linhas, x="Modo", y="MB/s", color="Chave", stack=False)
+        st.dataframe(linhas, hide_index=True, use_container_width=True)
+    st.markdown("---")
+
+    ## ECB
+    st.header("🧩 Por que Não Usar o Modo ECB")
+    st.write(
+        "No modo ECB cada bloco de 16 bytes é cifrado sozinho: blocos iguais viram blocos cifrados "
+        "iguais. Na imagem abaixo, cada linha de 16 pixels de uma mesma cor vira sempre o mesmo "
+        "\"ruído\", e o desenho continua aparecendo. Nos modos CBC, CTR e GCM o resultado parece "
+        "aleatório."
+    )
+    imagem = desenhar_cadeado()
+    modo_comparado = st.selectbox("Comparar com:", MODOS, index=1)
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.image(imagem, caption="Original", use_container_width=True)
+    with col2:
+        ecb = np.frombuffer(cifrar_bytes(imagem.tobytes(), chave, "ECB"), dtype=np.uint8).reshape(imagem.shape)
+        st.image(ecb, caption="ECB", use_container_width=True)
+    with col3:
+        outro = np.frombuffer(cifrar_bytes(imagem.tobytes(), chave, modo_comparado), dtype=np.uint8)
+        st.image(outro.reshape(imagem.shape), caption=modo_comparado, use_container_width=True)
@@ -2,12 +2,9 @@
 
 import streamlit as st
 
-# Importa as funções que contêm as lógicas de cada cifra
-from cesar import app as cesar_app
-from vigenere import app as vigenere_app
-from enigma import app as enigma_app
-from rsa import app as rsa_app
-from hash import app as hash_app
+# Páginas (importadas só quando escolhidas) e painéis da barra lateral
+from desempenho import executar_pagina, painel_lateral
+from sessao import painel_memoria
 
 # Configuração da página principal
 st.set_page_config(
@@ -19,20 +16,13 @@ st.set_page_config(
 st.sidebar.title("Navegação")
 opcao_selecionada = st.sidebar.radio(
     "Escolha a cifra:",
-    ("Cifra de César", "Cifra de Vigenère", "Enigma", "RSA", "Hash")
+    ("Cifra de César", "Cifra de Vigenère", "Substituição", "Análise de Frequência", "Enigma", "XOR / One-Time Pad", "AES", "RSA", "Hash")
 )
 
 # Lógica para exibir a página correta
-if opcao_selecionada == "Cifra de César":
-    cesar_app()
-elif opcao_selecionada == "Cifra de Vigenère":
-    vigenere_app()
-elif opcao_selecionada == "Enigma":
-    enigma_app()
-elif opcao_selecionada == "RSA":
-    rsa_app()
-elif opcao_selecionada == "Hash":
-    hash_app()
+executar_pagina(opcao_selecionada)
 
 st.sidebar.markdown("---")
 st.sidebar.info("Escolha uma cifra no menu acima para começar.")
+painel_lateral()
+painel_memoria()
@@ -0,0 +1,78 @@
+# bench_incremental.py
+# Compara, por edição, a cifragem completa do texto com a cifragem incremental
+# do modo ao vivo (educasec.incremental), em documentos de vários tamanhos:
+#   fim    - digitar uma letra no fim do texto (o caso mais comum)
+#   meio   - digitar uma letra no meio do texto
+#   meio*  - inserir no meio uma palavra do tamanho da chave (a fase do
+#            sufixo não muda, então a Vigenère também o reaproveita)
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_incremental
+#   python -m benchmarks.bench_incremental --tamanhos 10000 1000000 --edicoes 50
+
+import argparse
+import time
+
+from educasec.cesar import criptografar_cesar
+from educasec.incremental import CifraIncremental, cifra_cesar, cifra_vigenere
+from educasec.vigenere import criptografar_vigenere
+
+CHAVE_VIGENERE = "LIMAO"
+CHAVE_CESAR = 3
+
+FRASE = "Atacar ao amanhecer na ponte norte, manter silencio de radio. "
+
+def edicoes(texto, tipo, quantidade):
+    """
+    Sequência de versões do texto, cada uma com uma edição a mais.
+    """
+    versoes = []
+    for i in range(quantidade):
+        if tipo == "fim":
+            texto = texto + "a"
+        else:
+            meio = len(texto) // 2 + i
+            texto = texto[:meio] + ("a" if tipo == "meio" else "x" * len(CHAVE_VIGENERE)) + texto[meio:]
+        versoes.append(texto)
+    return versoes
+
+def cronometrar(atualizar, versoes):
+    """
+    Tempo médio (ms) de uma atualização.
+    """
+    inicio = time.perf_counter()
+    for versao in versoes:
+        atualizar(versao)
+    return (time.perf_counter() - inicio) * 1000 / len(versoes)
+
+def main():
+    parser = argparse.ArgumentParser(description="Cifragem completa x incremental, por edição.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                        help="Tamanhos dos documentos (caracteres)")
+    parser.add_argument("--edicoes", type=int, default=20, help="Edições medidas em cada caso")
+    args = parser.parse_args()
+
+    cifras = {
+        "César": (lambda texto: criptografar_cesar(texto, CHAVE_CESAR), lambda: cifra_cesar(CHAVE_CESAR)),
+        "Vigenère": (lambda texto: criptografar_vigenere(texto, CHAVE_VIGENERE), lambda: cifra_vigenere(CHAVE_VIGENERE)),
+    }
+
+    print(f"{'cifra':<10} {'tamanho':>10} {'edição':>7} {'completa (ms)':>14} {'incremental (ms)':>17} {'ganho':>7}")
+    for tamanho in args.tamanhos:
+        texto = (FRASE * (tamanho // len(FRASE) + 1))[:tamanho]
+        for nome, (completa, criar) in cifras.items():
+            for tipo in ("fim", "meio", "meio*"):
+                versoes = edicoes(texto, tipo, args.edicoes)
+                tempo_completo = cronometrar(completa, versoes)
+
+                viva = CifraIncremental(*criar())
+                viva.atualizar(texto)
+                tempo_incremental = cronometrar(viva.atualizar, versoes)
+                esperado = completa(versoes[-1])
+                assert viva.cifrado == (esperado if nome == "César" else esperado[0])
+
+                print(f"{nome:<10} {tamanho:>10} {tipo:>7} {tempo_completo:14.3f} {tempo_incremental:17.3f} "
+                      f"{tempo_completo / tempo_incremental:6.0f}x")
+
+if __name__ == "__main__":
+    main()
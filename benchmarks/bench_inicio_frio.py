@@ -0,0 +1,81 @@
+# bench_inicio_frio.py
+# Mede o início a frio do aplicativo: cada medição roda em um processo Python
+# novo, que executa app3.py uma vez (primeira pintura da página) e depois
+# troca para a página pedida.
+#
+# O modo "ansioso" importa todas as páginas antes de rodar o app, como as
+# versões antigas de app2.py/app3.py faziam; o modo "sob-demanda" deixa o
+# registro de páginas (paginas.py) importar só o que for aberto.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_inicio_frio
+#   python -m benchmarks.bench_inicio_frio --pagina RSA --repeticoes 10
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Script executado em cada processo novo; imprime os tempos em JSON
+MEDICAO = r"""
+import json, sys, time
+inicio = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+import paginas
+if sys.argv[1] == "ansioso":
+    import importlib
+    for modulo in paginas.PAGINAS.values():
+        importlib.import_module(modulo)
+pronto = time.perf_counter()
+at = AppTest.from_file(sys.argv[3], default_timeout=120)
+at.run()
+primeira_pintura = time.perf_counter()
+if sys.argv[2] != at.sidebar.radio[0].value:
+    at.sidebar.radio[0].set_value(sys.argv[2]).run()
+pagina = time.perf_counter()
+print(json.dumps({
+    "importacao": pronto - inicio,
+    "primeira_pintura": primeira_pintura - inicio,
+    "pagina": pagina - primeira_pintura,
+    "modulos": len(sys.modules),
+    "erro": bool(at.exception),
+}))
+"""
+
+def medir(modo, pagina, app):
+    """
+    Roda uma medição em um processo Python novo e devolve os tempos.
+    """
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ)
+    resultado = subprocess.run(
+        [sys.executable, "-c", MEDICAO, modo, pagina, os.path.join(RAIZ, app)],
+        cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True
+    )
+    return json.loads(resultado.stdout.strip().splitlines()[-1])
+
+def main():
+    parser = argparse.ArgumentParser(description="Mede o início a frio do aplicativo de cifras.")
+    parser.add_argument("--app", default="app3.py", help="Script do aplicativo (app2.py ou app3.py)")
+    parser.add_argument("--pagina", default="Cifra de César", help="Página aberta depois da primeira pintura")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{args.app} | página: {args.pagina} | {args.repeticoes} processos por modo")
+    print(f"{'modo':<12} {'importação':>11} {'1ª pintura':>11} {'página':>9} {'módulos':>8}")
+    for modo in ("ansioso", "sob-demanda"):
+        medicoes = [medir(modo, args.pagina, args.app) for _ in range(args.repeticoes)]
+        if any(m["erro"] for m in medicoes):
+            print(f"{modo}: o aplicativo terminou com erro")
+            return 1
+        def mediana(chave):
+            return statistics.median(m[chave] for m in medicoes)
+        print(f"{modo:<12} {mediana('importacao') * 1000:9.0f} ms {mediana('primeira_pintura') * 1000:9.0f} ms "
+              f"{mediana('pagina') * 1000:7.0f} ms {mediana('modulos'):8.0f}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
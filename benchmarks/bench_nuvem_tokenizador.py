@@ -0,0 +1,96 @@
+# bench_nuvem_tokenizador.py
+# Compara os dois modos de análise da nuvem de palavras no mesmo texto:
+# o modo rápido (regex + stop words + sufixos de verbos) e o modo preciso
+# (spaCy). Mede o tempo de cada um e a qualidade do modo rápido, usando as
+# palavras mais frequentes do spaCy como referência.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.bench_nuvem_tokenizador
+#   python -m benchmarks.bench_nuvem_tokenizador --arquivo livro.txt --top 100
+
+import argparse
+import sys
+import time
+
+import nuvem
+
+# Texto de exemplo, repetido para formar um corpus maior
+AMOSTRA = """
+A criptografia é a arte de proteger mensagens. Desde a Roma antiga, quando Júlio
+César deslocava as letras do alfabeto, até as cifras modernas usadas na internet,
+os povos procuraram esconder segredos dos inimigos. Durante a Segunda Guerra
+Mundial, os alemães usavam a máquina Enigma, e os matemáticos britânicos
+trabalharam durante anos para quebrar os códigos. Hoje, cada compra online
+depende de chaves públicas, certificados digitais e funções de hash. Os alunos
+aprendem que a segurança de um sistema não depende do segredo do algoritmo, mas
+do segredo da chave. Uma senha fraca continua sendo o ponto mais vulnerável da
+rede, e os ataques de força bruta testam milhões de combinações por segundo.
+"""
+
+def cronometrar(funcao, texto, repeticoes):
+    """
+    Executa a contagem algumas vezes e devolve (melhor tempo, contagem).
+    """
+    melhor = float("inf")
+    contagem = None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        contagem = funcao(texto)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, contagem
+
+def main():
+    parser = argparse.ArgumentParser(description="Compara os modos rápido e preciso da nuvem de palavras.")
+    parser.add_argument("--arquivo", help="Arquivo .txt usado como corpus (padrão: texto de exemplo)")
+    parser.add_argument("--repeticoes-amostra", type=int, default=200,
+                        help="Quantas vezes o texto de exemplo é repetido")
+    parser.add_argument("--repeticoes", type=int, default=3, help="Execuções de cada modo (vale a melhor)")
+    parser.add_argument("--top", type=int, default=50, help="Quantas palavras mais frequentes comparar")
+    args = parser.parse_args()
+
+    if args.arquivo:
+        with open(args.arquivo, encoding="utf-8", errors="replace") as f:
+            texto = f.read()
+    else:
+        texto = AMOSTRA * args.repeticoes_amostra
+    tamanho_kb = len(texto.encode("utf-8")) / 1024
+
+    print(f"Corpus: {tamanho_kb:.0f} KB")
+    tempo_rapido, rapido = cronometrar(nuvem.contar_palavras_rapido, texto, args.repeticoes)
+    print(f"{nuvem.MODO_RAPIDO:<20} {tempo_rapido * 1000:9.1f} ms  ({tamanho_kb / tempo_rapido:9.0f} KB/s)")
+
+    if nuvem.spacy is None:
+        print("spaCy não está instalado: comparação de qualidade ignorada.")
+        return 0
+    try:
+        nlp, _, _ = nuvem.carregar_modelo()
+    except OSError:
+        print("Modelo 'pt_core_news_sm' não encontrado: comparação de qualidade ignorada.")
+        return 0
+
+    # O spaCy tem limite de tamanho por documento; o texto vai em blocos, como no modo corpus
+    def contar_preciso(texto):
+        contagem = nuvem.Counter()
+        blocos = (nuvem.normalizar_texto(texto[i:i + nuvem.TAMANHO_BLOCO])
+                  for i in range(0, len(texto), nuvem.TAMANHO_BLOCO))
+        for doc in nlp.pipe(blocos):
+            contagem.update(nuvem.contar_palavras(doc, nlp.Defaults.stop_words))
+        return contagem
+
+    tempo_preciso, preciso = cronometrar(contar_preciso, texto, args.repeticoes)
+    print(f"{nuvem.MODO_PRECISO:<20} {tempo_preciso * 1000:9.1f} ms  ({tamanho_kb / tempo_preciso:9.0f} KB/s)")
+    print(f"Modo rápido é {tempo_preciso / tempo_rapido:.1f}x mais rápido")
+
+    # Qualidade: quanto das palavras mais frequentes do spaCy o modo rápido também encontra
+    top_rapido = {palavra for palavra, _ in rapido.most_common(args.top)}
+    top_preciso = {palavra for palavra, _ in preciso.most_common(args.top)}
+    comuns = top_rapido & top_preciso
+    precisao = len(comuns) / max(len(top_rapido), 1)
+    jaccard = len(comuns) / max(len(top_rapido | top_preciso), 1)
+    print(f"Top {args.top}: {len(comuns)} palavras em comum | precisão {precisao:.0%} | Jaccard {jaccard:.2f}")
+    print("Só no modo rápido:", ", ".join(sorted(top_rapido - top_preciso)[:15]) or "-")
+    print("Só no modo preciso:", ", ".join(sorted(top_preciso - top_rapido)[:15]) or "-")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+# carga_api.py
+# Teste de carga da API (educasec/api.py): vários clientes simultâneos fazem
+# requisições e o script mostra a latência p50/p99 e as requisições por
+# segundo de cada cenário, incluindo operações pesadas uma a uma e em lote.
+# No fim, confere que um lote grande de operações "leves" (Enigma de 1000
+# letras, no limite do corpo) não trava a API: enquanto ele roda, outras
+# requisições continuam sendo atendidas. Se alguma esperar mais que
+# --espera-maxima, o script termina com código 1.
+#
+# Por padrão o aplicativo ASGI é chamado direto neste processo (sem rede);
+# com --url as requisições vão por HTTP para um servidor já em execução:
+#   uvicorn educasec.api:app --port 8000
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.carga_api
+#   python -m benchmarks.carga_api --clientes 32 --requisicoes 2000
+#   python -m benchmarks.carga_api --url http://localhost:8000
+
+import argparse
+import asyncio
+import http.client
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+from educasec import api
+
+TEXTO = "Ataque ao amanhecer na ponte norte. " * 20
+
+def percentil(valores, p):
+    """
+    Percentil p (0 a 100) de uma lista de valores, pelo vizinho mais próximo.
+    """
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+async def chamar_asgi(caminho, corpo):
+    """
+    Faz uma requisição POST direto no aplicativo ASGI e devolve (status, JSON).
+    """
+    dados = json.dumps(corpo).encode("utf-8")
+    recebido = False
+    resposta = {}
+
+    async def receive():
+        nonlocal recebido
+        if recebido:
+            await asyncio.sleep(3600)
+        recebido = True
+        return {"type": "http.request", "body": dados, "more_body": False}
+
+    async def send(mensagem):
+        if mensagem["type"] == "http.response.start":
+            resposta["status"] = mensagem["status"]
+        else:
+            resposta["corpo"] = json.loads(mensagem["body"])
+
+    await api.app({"type": "http", "method": "POST", "path": "/" + caminho}, receive, send)
+    return resposta["status"], resposta["corpo"]
+
+def cliente_http(url):
+    """
+    Cria uma função que faz requisições POST para o servidor em `url`.
+    Cada thread mantém a sua própria conexão aberta (keep-alive).
+    """
+    endereco = urlparse(url)
+    local = threading.local()
+
+    def chamar(caminho, corpo):
+        if not hasattr(local, "conexao"):
+            local.conexao = http.client.HTTPConnection(endereco.hostname, endereco.port or 80, timeout=120)
+        local.conexao.request("POST", "/" + caminho, body=json.dumps(corpo),
+                              headers={"Content-Type": "application/json"})
+        resposta = local.conexao.getresponse()
+        return resposta.status, json.loads(resposta.read())
+
+    return chamar
+
+async def rodar_cenario(chamar, caminho, corpo, requisicoes, clientes, executor):
+    """
+    Dispara `requisicoes` chamadas com no máximo `clientes` ao mesmo tempo e
+    devolve (latências em segundos, duração total, erros).
+    """
+    semaforo = asyncio.Semaphore(clientes)
+    latencias = []
+    erros = 0
+
+    async def uma():
+        nonlocal erros
+        async with semaforo:
+            inicio = time.perf_counter()
+            if executor is None:
+                status, _ = await chamar_asgi(caminho, corpo)
+            else:
+                status, _ = await asyncio.get_running_loop().run_in_executor(executor, chamar, caminho, corpo)
+            latencias.append(time.perf_counter() - inicio)
+            if status != 200:
+                erros += 1
+
+    inicio = time.perf_counter()
+    await asyncio.gather(*(uma() for _ in range(requisicoes)))
+    return latencias, time.perf_counter() - inicio, erros
+
+async def verificar_lote_grande(uma_vez):
+    """
+    Envia um lote com o maior número de operações Enigma de 1000 letras que
+    cabe no corpo e, enquanto ele roda, faz requisições de hash com um
+    intervalo de 5 ms. Devolve (maior espera, duração do lote, operações no
+    lote). A espera conta a requisição e o atraso do intervalo: se o laço de
+    eventos travar, quem chegasse nesse meio tempo esperaria o mesmo tanto.
+    """
+    operacao = {"op": "enigma", "params": {"texto": "A" * 1000}}
+    quantidade = min(api.TAMANHO_MAXIMO_LOTE, api.TAMANHO_MAXIMO_CORPO // (len(json.dumps(operacao)) + 2))
+    lote = {"operacoes": [operacao] * quantidade}
+    intervalo = 0.005
+
+    inicio = time.perf_counter()
+    # O lote só começa na primeira pausa do laço abaixo, que já é medida
+    tarefa = asyncio.ensure_future(uma_vez("lote", lote))
+    esperas = [0.0]
+    while not tarefa.done():
+        antes = time.perf_counter()
+        await uma_vez("hash", {"texto": "abc"})
+        await asyncio.sleep(intervalo)
+        esperas.append(time.perf_counter() - antes - intervalo)
+    status, _ = await tarefa
+    if status != 200:
+        raise RuntimeError(f"O lote grande falhou com status {status}")
+    return max(esperas), time.perf_counter() - inicio, quantidade
+
+async def principal(args):
+    executor = None
+    chamar = chamar_asgi
+    if args.url:
+        executor = ThreadPoolExecutor(max_workers=args.clientes)
+        chamar = cliente_http(args.url)
+
+    async def uma_vez(caminho, corpo):
+        if executor is None:
+            return await chamar_asgi(caminho, corpo)
+        return await asyncio.get_running_loop().run_in_executor(executor, chamar, caminho, corpo)
+
+    # Chaves usadas nos cenários de RSA e ECC (e aquecimento do pool de processos)
+    _, chaves_rsa = await uma_vez("rsa/gerar", {"bits": 2048})
+    _, cifrado = await uma_vez("rsa/cifrar", {"public_key_pem": chaves_rsa["public_key_pem"], "texto": "segredo"})
+    decifrar = {"private_key_pem": chaves_rsa["private_key_pem"], "texto": cifrado["resultado"]}
+    await uma_vez("rsa/decifrar", decifrar)
+    lote = {"operacoes": [{"op": "rsa/decifrar", "params": decifrar}] * args.tamanho_lote}
+
+    cenarios = [
+        ("cesar", {"texto": TEXTO, "chave": 3}, args.requisicoes),
+        ("vigenere", {"texto": TEXTO, "chave": "LIMAO"}, args.requisicoes),
+        ("hash", {"texto": TEXTO, "algoritmo": "sha256"}, args.requisicoes),
+        ("rsa/decifrar", decifrar, args.requisicoes_pesadas),
+        ("lote", lote, max(args.requisicoes_pesadas // args.tamanho_lote, 1)),
+    ]
+
+    destino = args.url or "ASGI no mesmo processo"
+    print(f"Destino: {destino} | {args.clientes} clientes simultâneos | {api.PROCESSOS} processos no pool")
+    print(f"{'cenário':<22} {'req.':>6} {'p50 (ms)':>9} {'p99 (ms)':>9} {'req/s':>8} {'ops/s':>8} {'erros':>6}")
+    for caminho, corpo, requisicoes in cenarios:
+        latencias, duracao, erros = await rodar_cenario(chamar, caminho, corpo, requisicoes, args.clientes, executor)
+        ops = requisicoes * (args.tamanho_lote if caminho == "lote" else 1)
+        nome = f"lote ({args.tamanho_lote}× rsa)" if caminho == "lote" else caminho
+        print(f"{nome:<22} {requisicoes:6d} {statistics.median(latencias) * 1000:9.2f} "
+              f"{percentil(latencias, 99) * 1000:9.2f} {requisicoes / duracao:8.0f} {ops / duracao:8.0f} {erros:6d}")
+
+    maior_espera, duracao, quantidade = await verificar_lote_grande(uma_vez)
+    print(f"Lote de {quantidade}× enigma (1000 letras) em {duracao:.1f} s; "
+          f"maior espera de um hash enquanto ele rodava: {maior_espera * 1000:.0f} ms")
+    api.encerrar_pool()
+    if maior_espera * 1000 > args.espera_maxima:
+        print(f"⚠️ O lote travou as outras requisições (limite: {args.espera_maxima:.0f} ms)")
+        return 1
+    return 0
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de carga da API do EducaSec.")
+    parser.add_argument("--url", help="Servidor HTTP já em execução (padrão: chamar o ASGI neste processo)")
+    parser.add_argument("--clientes", type=int, default=16, help="Requisições simultâneas")
+    parser.add_argument("--requisicoes", type=int, default=2000, help="Requisições por cenário leve")
+    parser.add_argument("--requisicoes-pesadas", type=int, default=400, help="Operações RSA por cenário pesado")
+    parser.add_argument("--tamanho-lote", type=int, default=50, help="Operações por requisição em /lote")
+    parser.add_argument("--espera-maxima", type=float, default=250,
+                        help="Maior latência (ms) aceita para uma requisição durante um lote grande")
+    return asyncio.run(principal(parser.parse_args()))
+
+if __name__ == "__main__":
+    sys.exit(main())
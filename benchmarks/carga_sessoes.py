@@ -0,0 +1,376 @@
+# carga_sessoes.py
+# Teste de carga das páginas do Streamlit: simula N alunos usando o
+# aplicativo ao mesmo tempo, cada um em uma sessão própria (AppTest), com
+# fluxos realistas:
+#   rsa    - gerar um par de chaves RSA 2048 e criptografar uma mensagem
+#   ecc    - gerar chaves, assinar um documento e verificar a assinatura
+#   enigma - criptografar um texto longo na máquina Enigma
+#   nuvem  - gerar a nuvem de palavras de um texto
+#
+# Para cada passo (cada rerun do script) são medidos os percentis de
+# latência; para as sessões, o uso de CPU e o crescimento da memória.
+#
+# O AppTest não pode executar dois reruns ao mesmo tempo no mesmo processo
+# (ele troca o runtime global do Streamlit a cada execução), então cada sessão
+# roda em um processo próprio (contexto "spawn", como no pool da API). Depois
+# de uma sessão de aquecimento, que importa os módulos e preenche os caches,
+# todos os processos são liberados juntos: as sessões se sobrepõem e disputam
+# os núcleos da máquina.
+#
+# Isto NÃO é um servidor do Streamlit: lá as sessões dividem um processo, o
+# GIL, o st.cache_resource/st.cache_data e a memória. Aqui cada processo tem
+# os seus, então a vazão fica otimista e a memória é a de N processos, não a
+# de N sessões em um servidor. O teste serve para comparar a latência de cada
+# passo entre versões, não para dizer quantos alunos um servidor aguenta.
+#
+# As assinaturas do fluxo ecc vão para um registro em uma pasta temporária
+# (EDUCASEC_CACHE e EDUCASEC_REGISTRO), não para o do usuário.
+#
+# O resultado é salvo em JSON para servir de referência e pode ser comparado
+# com uma execução anterior (--comparar).
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.carga_sessoes --sessoes 8
+#   python -m benchmarks.carga_sessoes --sessoes 16 --fluxos enigma nuvem --saida base.json
+#   python -m benchmarks.carga_sessoes --sessoes 16 --comparar base.json
+
+import argparse
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import statistics
+import sys
+import tempfile
+import time
+import traceback
+from collections import defaultdict
+from datetime import datetime
+
+from streamlit.testing.v1 import AppTest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Tempo máximo de um rerun (a geração de chaves RSA 4096 pode demorar)
+TEMPO_MAXIMO = 300
+
+# Tempo máximo para todos os processos terminarem o aquecimento e, depois, a
+# sessão medida
+TEMPO_MAXIMO_ETAPA = 1800
+
+TEXTO_ENIGMA = "Atacar ao amanhecer na ponte norte e manter silencio de radio " * 150
+
+TEXTO_NUVEM = """
+A criptografia protege mensagens desde a Roma antiga. Os alunos aprendem que a
+segurança depende do segredo da chave e não do segredo do algoritmo. Senhas
+fracas, ataques de força bruta, certificados digitais e funções de hash fazem
+parte do dia a dia da internet, dos bancos e das escolas.
+""" * 20
+
+# --- Ferramentas ---
+
+def memoria_residente_mb():
+    """
+    Memória residente do processo em MB (Linux), ou None.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+def percentil(valores, p):
+    """
+    Percentil p (0 a 100) de uma lista de valores, pelo vizinho mais próximo.
+    """
+    ordenados = sorted(valores)
+    indice = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+def botao(at, inicio):
+    """
+    Primeiro botão cujo rótulo começa com `inicio`.
+    """
+    return next(b for b in at.button if b.label.startswith(inicio))
+
+def area_texto(at, inicio):
+    """
+    Primeira área de texto cujo rótulo começa com `inicio`.
+    """
+    return next(t for t in at.text_area if t.label.startswith(inicio))
+
+def abrir_pagina(modulo):
+    """
+    Sessão de teste para a página `modulo` (o mesmo app() chamado pelo menu).
+    """
+    return AppTest.from_string(f"import {modulo}\n{modulo}.app()", default_timeout=TEMPO_MAXIMO)
+
+# --- Fluxos ---
+# Cada fluxo recebe a função `passo(nome, acao)`, que executa a ação (que
+# termina em um rerun) e mede quanto tempo ela levou.
+
+def fluxo_rsa(passo):
+    at = abrir_pagina("rsa")
+    passo("abrir", at.run)
+    passo("gerar chaves 2048", lambda: botao(at, "🔄 Gerar Novo Par de Chaves").click().run())
+    passo("digitar mensagem", lambda: area_texto(at, "Digite a mensagem").set_value("Prova amanhã às 8h").run())
+    passo("criptografar", lambda: botao(at, "🔒 Criptografar Mensagem").click().run())
+    return at
+
+def fluxo_ecc(passo):
+    at = abrir_pagina("ecc")
+    passo("abrir", at.run)
+    passo("gerar chaves", lambda: botao(at, "🎲 Gerar Par de Chaves").click().run())
+    passo("digitar documento", lambda: area_texto(at, "Digite o texto do documento").set_value("Contrato de teste").run())
+    passo("assinar", lambda: botao(at, "✍️ Assinar").click().run())
+    passo("verificar", lambda: botao(at, "🔍 Verificar").click().run())
+    return at
+
+def fluxo_enigma(passo):
+    at = abrir_pagina("enigma")
+    passo("abrir", at.run)
+    passo("digitar texto longo", lambda: area_texto(at, "Digite o texto").set_value(TEXTO_ENIGMA).run())
+    passo("criptografar", lambda: botao(at, "Criptografar").click().run())
+    return at
+
+def fluxo_nuvem(passo):
+    at = abrir_pagina("nuvem")
+    passo("abrir", at.run)
+    passo("digitar texto", lambda: at.text_area[0].set_value(TEXTO_NUVEM).run())
+    passo("gerar nuvem", lambda: at.button[0].click().run())
+    return at
+
+FLUXOS = {
+    "rsa": fluxo_rsa,
+    "ecc": fluxo_ecc,
+    "enigma": fluxo_enigma,
+    "nuvem": fluxo_nuvem,
+}
+
+# --- Execução ---
+
+def simular_sessao(fluxos, repeticoes, latencias, erros):
+    """
+    Uma sessão de aluno: percorre os fluxos `repeticoes` vezes, guardando a
+    duração de cada passo em `latencias[(fluxo, passo)]`.
+    """
+    for _ in range(repeticoes):
+        for nome_fluxo in fluxos:
+            def passo(nome, acao):
+                inicio = time.perf_counter()
+                acao()
+                latencias[(nome_fluxo, nome)].append(time.perf_counter() - inicio)
+
+            try:
+                at = FLUXOS[nome_fluxo](passo)
+                if at.exception:
+                    raise RuntimeError(at.exception[0].message)
+            except Exception as erro:
+                erros[nome_fluxo].append(f"{type(erro).__name__}: {erro}")
+
+def processo_sessao(indice, fluxos, repeticoes, largada, mensagens):
+    """
+    Corpo de cada processo: aquece, avisa que está pronto, espera a largada,
+    roda a sessão e manda as latências, os erros, o tempo de CPU e o
+    crescimento da memória. Uma exceção vira uma mensagem de falha.
+    """
+    try:
+        simular_sessao(fluxos, 1, defaultdict(list), defaultdict(list))
+        gc.collect()
+        memoria_inicial = memoria_residente_mb()
+        latencias = defaultdict(list)
+        erros = defaultdict(list)
+        mensagens.put(("pronto", indice, None))
+        if not largada.wait(TEMPO_MAXIMO_ETAPA):
+            return
+        cpu_inicial = time.process_time()
+        simular_sessao(fluxos, repeticoes, latencias, erros)
+        cpu = time.process_time() - cpu_inicial
+        gc.collect()
+        memoria_final = memoria_residente_mb()
+        crescimento = None
+        if memoria_inicial is not None and memoria_final is not None:
+            crescimento = memoria_final - memoria_inicial
+        mensagens.put(("resultado", indice, {
+            "latencias": dict(latencias),
+            "erros": dict(erros),
+            "cpu_s": cpu,
+            "memoria_inicial_mb": memoria_inicial,
+            "memoria_final_mb": memoria_final,
+            "crescimento_mb": crescimento,
+        }))
+    except BaseException:
+        mensagens.put(("falha", indice, traceback.format_exc(limit=5)))
+        raise
+
+def receber(mensagens, processos, prazo):
+    """
+    Espera uma mensagem de cada processo, por no máximo `prazo` segundos, e
+    devolve os dados na ordem dos processos. Levanta RuntimeError se algum
+    processo falhar, terminar sem responder ou o prazo acabar.
+    """
+    recebidos = {}
+    limite = time.monotonic() + prazo
+    while len(recebidos) < len(processos):
+        try:
+            tipo, indice, dados = mensagens.get(timeout=1)
+        except queue.Empty:
+            for indice, processo in enumerate(processos):
+                if indice not in recebidos and processo.exitcode is not None:
+                    raise RuntimeError(f"{processo.name} terminou com código {processo.exitcode} sem responder")
+            if time.monotonic() > limite:
+                raise RuntimeError(f"{len(processos) - len(recebidos)} processo(s) não responderam em {prazo} s")
+            continue
+        if tipo == "falha":
+            raise RuntimeError(f"{processos[indice].name} falhou:\n{dados}")
+        recebidos[indice] = dados
+    return [recebidos[i] for i in range(len(processos))]
+
+def medir(sessoes, fluxos, repeticoes):
+    """
+    Roda `sessoes` sessões simultâneas, uma por processo, e devolve o resumo
+    da medição. A duração conta a partir da largada (o aquecimento fica de
+    fora). Levanta RuntimeError se um processo falhar ou não responder.
+    """
+    contexto = multiprocessing.get_context("spawn")
+    largada = contexto.Event()
+    mensagens = contexto.Queue()
+    processos = [
+        contexto.Process(target=processo_sessao, args=(i, fluxos, repeticoes, largada, mensagens),
+                         name=f"aluno-{i}", daemon=True)
+        for i in range(sessoes)
+    ]
+    ambiente = {nome: os.environ.get(nome) for nome in ("EDUCASEC_CACHE", "EDUCASEC_REGISTRO")}
+    with tempfile.TemporaryDirectory(prefix="educasec-carga-") as pasta:
+        try:
+            # Os processos herdam o ambiente: o registro de assinaturas fica na pasta temporária
+            os.environ["EDUCASEC_CACHE"] = pasta
+            os.environ["EDUCASEC_REGISTRO"] = os.path.join(pasta, "assinaturas.sqlite3")
+            for processo in processos:
+                processo.start()
+            receber(mensagens, processos, TEMPO_MAXIMO_ETAPA)
+            largada.set()
+            inicio = time.perf_counter()
+            # Lê antes do join(): um processo só termina depois que a fila esvazia
+            por_processo = receber(mensagens, processos, TEMPO_MAXIMO_ETAPA)
+            duracao = time.perf_counter() - inicio
+            for processo in processos:
+                processo.join(timeout=10)
+        finally:
+            for processo in processos:
+                if processo.is_alive():
+                    processo.terminate()
+            for nome, valor in ambiente.items():
+                if valor is None:
+                    os.environ.pop(nome, None)
+                else:
+                    os.environ[nome] = valor
+
+    latencias = defaultdict(list)
+    erros = defaultdict(list)
+    for parcial in por_processo:
+        for chave, medicoes in parcial["latencias"].items():
+            latencias[chave].extend(medicoes)
+        for nome, mensagens_erro in parcial["erros"].items():
+            erros[nome].extend(mensagens_erro)
+
+    passos = {}
+    for (nome_fluxo, nome_passo), medicoes in latencias.items():
+        passos[f"{nome_fluxo}/{nome_passo}"] = {
+            "amostras": len(medicoes),
+            "p50_ms": statistics.median(medicoes) * 1000,
+            "p90_ms": percentil(medicoes, 90) * 1000,
+            "p99_ms": percentil(medicoes, 99) * 1000,
+            "max_ms": max(medicoes) * 1000,
+        }
+
+    cpu = sum(parcial["cpu_s"] for parcial in por_processo)
+    crescimentos = [parcial["crescimento_mb"] for parcial in por_processo]
+    memoria_processos = memoria_por_processo = None
+    if None not in crescimentos:
+        # Cada processo carrega o seu interpretador e os seus caches: a soma é a
+        # memória destes N processos, não a de N sessões em um servidor
+        memoria_processos = sum(parcial["memoria_final_mb"] for parcial in por_processo)
+        memoria_por_processo = statistics.mean(crescimentos)
+
+    return {
+        "data": datetime.now().isoformat(timespec="seconds"),
+        "maquina": {"python": platform.python_version(), "sistema": platform.platform(), "nucleos": os.cpu_count()},
+        "modelo": "um processo por sessão (não é um servidor do Streamlit)",
+        "sessoes": sessoes,
+        "processos": sessoes,
+        "fluxos": fluxos,
+        "repeticoes": repeticoes,
+        "duracao_s": duracao,
+        "cpu_s": cpu,
+        "cpu_percentual": 100 * cpu / duracao,
+        "memoria_processos_mb": memoria_processos,
+        "crescimento_por_processo_mb": memoria_por_processo,
+        "passos": passos,
+        "erros": {nome: mensagens_erro[:5] for nome, mensagens_erro in erros.items()},
+    }
+
+def mostrar(resultado, referencia=None):
+    """
+    Mostra a tabela de latências; com uma referência, mostra também a variação do p99.
+    """
+    print(f"{resultado['sessoes']} sessões simultâneas em processos separados (não é um servidor) | "
+          f"{resultado['maquina']['nucleos']} núcleo(s) | fluxos: {', '.join(resultado['fluxos'])} | "
+          f"{resultado['duracao_s']:.1f} s")
+    cabecalho = f"{'passo':<30} {'n':>4} {'p50 (ms)':>10} {'p90 (ms)':>10} {'p99 (ms)':>10} {'max (ms)':>10}"
+    if referencia:
+        cabecalho += f" {'p99 ref.':>10} {'variação':>9}"
+    print(cabecalho)
+    for nome, passo in resultado["passos"].items():
+        linha = (f"{nome:<30} {passo['amostras']:4d} {passo['p50_ms']:10.1f} "
+                 f"{passo['p90_ms']:10.1f} {passo['p99_ms']:10.1f} {passo['max_ms']:10.1f}")
+        anterior = (referencia or {}).get("passos", {}).get(nome)
+        if anterior:
+            linha += f" {anterior['p99_ms']:10.1f} {passo['p99_ms'] / anterior['p99_ms'] - 1:+9.0%}"
+        print(linha)
+
+    print(f"CPU: {resultado['cpu_s']:.1f} s somando os processos ({resultado['cpu_percentual']:.0f}% de um núcleo)")
+    if resultado["crescimento_por_processo_mb"] is not None:
+        print(f"Memória dos {resultado['processos']} processos: {resultado['memoria_processos_mb']:.0f} MB "
+              f"({resultado['crescimento_por_processo_mb']:+.1f} MB por processo durante a sessão medida)")
+    print("ℹ️ Cada sessão tem o seu processo, GIL e caches: a vazão e a memória não equivalem às de um "
+          "servidor do Streamlit com o mesmo número de alunos. Compare as latências entre versões.")
+    for nome, mensagens in resultado["erros"].items():
+        print(f"⚠️ {nome}: {len(mensagens)} erro(s), ex.: {mensagens[0]}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Simula vários alunos usando as páginas ao mesmo tempo, uma sessão por processo "
+                    "(não reproduz um servidor do Streamlit, que divide o processo entre as sessões)."
+    )
+    parser.add_argument("--sessoes", type=int, default=4, help="Sessões simultâneas")
+    parser.add_argument("--fluxos", nargs="+", choices=list(FLUXOS), default=list(FLUXOS))
+    parser.add_argument("--repeticoes", type=int, default=1, help="Quantas vezes cada sessão percorre os fluxos")
+    parser.add_argument("--saida", default="carga_sessoes.json", help="Arquivo JSON com o resultado")
+    parser.add_argument("--comparar", help="JSON de uma execução anterior, para comparar")
+    args = parser.parse_args()
+
+    # As páginas importam os módulos da raiz do projeto (cesar, nuvem, educasec...)
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+
+    referencia = None
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as f:
+            referencia = json.load(f)
+
+    try:
+        resultado = medir(args.sessoes, args.fluxos, args.repeticoes)
+    except RuntimeError as erro:
+        print(f"❌ {erro}")
+        return 1
+    mostrar(resultado, referencia)
+    with open(args.saida, "w", encoding="utf-8") as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"Resultado salvo em {args.saida}")
+    return 1 if resultado["erros"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
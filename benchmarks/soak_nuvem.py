@@ -0,0 +1,103 @@
+# soak_nuvem.py
+# Teste de resistência (soak) da renderização da nuvem de palavras.
+#
+# Desenha milhares de nuvens com tabelas de frequência sempre diferentes
+# (para não cair no cache de imagens) e acompanha a memória residente do
+# processo. A memória deve ficar estável; se crescer mais que o limite, o
+# script termina com código de saída 1.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.soak_nuvem --renders 2000
+#   python -m benchmarks.soak_nuvem --modo matplotlib   # caminho antigo, para comparação
+
+import argparse
+import gc
+import io
+import random
+import sys
+import time
+
+import nuvem
+
+# Vocabulário usado para montar as tabelas de frequência aleatórias
+VOCABULARIO = [
+    "segurança", "criptografia", "chave", "cifra", "mensagem", "senha", "rede",
+    "hash", "assinatura", "certificado", "protocolo", "servidor", "cliente",
+    "ataque", "defesa", "firewall", "vírus", "backup", "privacidade", "dados",
+    "escola", "aluno", "professor", "internet", "computador", "algoritmo",
+    "enigma", "césar", "vigenère", "curva", "elíptica", "primo", "módulo",
+    "autenticação", "integridade", "confidencialidade", "token", "sessão",
+]
+
+def tabela_aleatoria(gerador):
+    """
+    Monta uma tabela de frequências diferente a cada chamada.
+    """
+    palavras = gerador.sample(VOCABULARIO, k=gerador.randint(10, len(VOCABULARIO)))
+    return {palavra: gerador.randint(1, 50) for palavra in palavras}
+
+def renderizar_fila(frequencias):
+    """
+    Caminho atual: fila de renderização e imagem PIL, sem figuras.
+    """
+    return nuvem.executor_renderizacao().submit(nuvem.gerar_png_nuvem, frequencias).result()
+
+def renderizar_matplotlib(frequencias):
+    """
+    Caminho antigo: figura do Matplotlib criada a cada nuvem e nunca fechada.
+    """
+    import matplotlib.pyplot as plt
+    wordcloud = nuvem.WordCloud(width=800, height=400, background_color='white')
+    wordcloud.generate_from_frequencies(frequencias)
+    fig, ax = plt.subplots(figsize=(10, 5))
+    ax.imshow(wordcloud, interpolation='bilinear')
+    ax.axis("off")
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png")
+    return buf.getvalue()
+
+def main():
+    parser = argparse.ArgumentParser(description="Teste de resistência da renderização da nuvem de palavras.")
+    parser.add_argument("--renders", type=int, default=2000, help="Quantidade de nuvens desenhadas")
+    parser.add_argument("--aquecimento", type=int, default=50, help="Nuvens desenhadas antes da medição inicial")
+    parser.add_argument("--amostras", type=int, default=10, help="Quantas vezes a memória é medida")
+    parser.add_argument("--limite-mb", type=float, default=25.0, help="Crescimento máximo aceito (MB)")
+    parser.add_argument("--modo", choices=["fila", "matplotlib"], default="fila")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args()
+
+    renderizar = renderizar_fila if args.modo == "fila" else renderizar_matplotlib
+    gerador = random.Random(args.semente)
+
+    # Aquecimento: fontes, alocador e threads da fila já criados
+    for _ in range(args.aquecimento):
+        renderizar(tabela_aleatoria(gerador))
+    gc.collect()
+    memoria_inicial = nuvem.memoria_residente_mb()
+    if memoria_inicial is None:
+        print("Não foi possível medir a memória residente neste sistema.")
+        return 2
+
+    print(f"Modo: {args.modo} | memória após aquecimento: {memoria_inicial:.1f} MB")
+    intervalo = max(args.renders // args.amostras, 1)
+    inicio = time.perf_counter()
+    memoria = memoria_inicial
+    for i in range(1, args.renders + 1):
+        renderizar(tabela_aleatoria(gerador))
+        if i % intervalo == 0 or i == args.renders:
+            gc.collect()
+            memoria = nuvem.memoria_residente_mb()
+            decorrido = time.perf_counter() - inicio
+            print(f"{i:6d} nuvens | {i / decorrido:6.1f} nuvens/s | RSS {memoria:8.1f} MB "
+                  f"({memoria - memoria_inicial:+.1f} MB)")
+
+    crescimento = memoria - memoria_inicial
+    print(f"Crescimento total: {crescimento:+.1f} MB (limite {args.limite_mb:.1f} MB)")
+    if crescimento > args.limite_mb:
+        print("FALHOU: a memória cresceu além do limite.")
+        return 1
+    print("OK: memória estável.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
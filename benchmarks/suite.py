@@ -0,0 +1,404 @@
+# suite.py
+# Suíte de benchmarks de todos os motores de cifra, com detecção de regressões.
+#
+# Casos medidos:
+#   cesar/*, vigenere/*   criptografar textos de 1 KB a 10 MB
+#   enigma/encrypt_char   vazão da máquina Enigma, letra por letra
+#   rsa/<bits>/*          gerar chaves, criptografar e descriptografar (1024, 2048, 4096)
+#   ecc/<curva>/*         assinar e verificar em cada curva de assinatura
+#   hash/<algoritmo>      vazão de cada algoritmo de hash em 1 MB
+#   nuvem/*               processamento do spaCy e desenho do WordCloud
+#
+# As entradas são fixas (mesmo texto, mesma semente), e cada caso é medido em
+# algumas rodadas; vale a mediana do tempo por operação. O resultado é salvo
+# em benchmarks/resultados/<máquina>.json. Se esse arquivo já existir, ele é
+# a referência: um caso que ficar mais lento que o limite (padrão 25%) é uma
+# regressão e o programa termina com código 1. Use --atualizar para gravar a
+# execução atual como a nova referência.
+#
+# Casos cujas dependências não estão instaladas (por exemplo, o modelo do
+# spaCy) aparecem como ignorados.
+#
+# Uso (a partir da raiz do projeto):
+#   python -m benchmarks.suite
+#   python -m benchmarks.suite --rapido --filtro cesar vigenere
+#   python -m benchmarks.suite --limite 0.10 --atualizar
+
+import argparse
+import json
+import os
+import platform
+import random
+import re
+import statistics
+import sys
+import time
+from datetime import datetime
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PASTA_RESULTADOS = os.path.join(RAIZ, "benchmarks", "resultados")
+
+# Tamanhos dos textos das cifras clássicas (o modo rápido para em 100 KB)
+TAMANHOS = (1 << 10, 10 << 10, 100 << 10, 1 << 20, 10 << 20)
+TAMANHOS_RAPIDO = TAMANHOS[:3]
+
+# Curvas de assinatura (educasec.ecc.SIGNING_CURVES) e algoritmos de hash
+# (educasec.hash.ALGORITMOS), repetidos aqui para montar e listar os casos sem
+# importar os módulos: sem a dependência, só os casos dela ficam "ignorado"
+CURVAS_ASSINATURA = ("SECP256R1", "SECP384R1", "SECP521R1", "Ed25519")
+ALGORITMOS_HASH = ("md5", "sha1", "sha256", "sha512")
+
+# Semente usada nos textos gerados, para que toda execução use a mesma entrada
+SEMENTE = 2024
+
+PALAVRAS = ("criptografia chave segredo mensagem alfabeto cifra rotor escola aluno "
+            "senha ataque defesa rede internet assinatura certificado").split()
+
+# --- Casos ---
+
+class Caso:
+    """
+    Um benchmark. `preparar()` faz o trabalho que não deve ser medido (gerar
+    chaves, carregar modelos...) e devolve a operação a ser cronometrada;
+    `unidades` é quanto cada operação processa (bytes, letras), para calcular
+    a vazão.
+    """
+    def __init__(self, nome, preparar, unidades=None, unidade=None, tempo_minimo=0.2):
+        self.nome = nome
+        self.preparar = preparar
+        self.unidades = unidades
+        self.unidade = unidade
+        self.tempo_minimo = tempo_minimo
+
+def texto_amostra(tamanho):
+    """
+    Texto em português de `tamanho` caracteres, sempre o mesmo para o mesmo tamanho.
+    """
+    gerador = random.Random(SEMENTE)
+    palavras = []
+    total = 0
+    while total < tamanho:
+        palavra = gerador.choice(PALAVRAS)
+        palavras.append(palavra.capitalize() if gerador.random() < 0.1 else palavra)
+        total += len(palavra) + 1
+    return " ".join(palavras)[:tamanho]
+
+def rotulo_tamanho(tamanho):
+    return f"{tamanho >> 20}MB" if tamanho >= 1 << 20 else f"{tamanho >> 10}KB"
+
+def casos_cifras_classicas(tamanhos):
+    def cesar(texto):
+        from educasec.cesar import criptografar_cesar
+        return lambda: criptografar_cesar(texto, 3)
+
+    def vigenere(texto):
+        from educasec.vigenere import criptografar_vigenere
+        return lambda: criptografar_vigenere(texto, "LIMAO")
+
+    for tamanho in tamanhos:
+        texto = texto_amostra(tamanho)
+        yield Caso(f"cesar/{rotulo_tamanho(tamanho)}", lambda texto=texto: cesar(texto), tamanho, "B")
+        yield Caso(f"vigenere/{rotulo_tamanho(tamanho)}", lambda texto=texto: vigenere(texto), tamanho, "B")
+
+def caso_enigma():
+    letras = 10_000
+
+    def preparar():
+        from educasec.enigma import EnigmaMachine
+        texto = texto_amostra(letras * 2).upper().replace(" ", "")[:letras]
+
+        def operacao():
+            maquina = EnigmaMachine("I", "II", "III", "A", "A", "A")
+            for letra in texto:
+                maquina.encrypt_char(letra)
+        return operacao
+
+    yield Caso("enigma/encrypt_char", preparar, letras, "letras")
+
+def casos_rsa(bits_testados):
+    mensagem = "Prova de matemática amanhã às 8h"
+
+    def gerar(bits):
+        from educasec.rsa import generate_key_pair
+        return lambda: generate_key_pair(bits)
+
+    def criptografar(bits):
+        from educasec.rsa import generate_key_pair, key_to_pem, encrypt_message
+        _, public_key, _ = generate_key_pair(bits)
+        public_pem = key_to_pem(public_key, False)
+        return lambda: encrypt_message(public_pem, mensagem)
+
+    def descriptografar(bits):
+        from educasec.rsa import generate_key_pair, key_to_pem, encrypt_message, decrypt_message
+        private_key, public_key, _ = generate_key_pair(bits)
+        private_pem = key_to_pem(private_key, True)
+        cifrada = encrypt_message(key_to_pem(public_key, False), mensagem)
+        return lambda: decrypt_message(private_pem, cifrada)
+
+    for bits in bits_testados:
+        # A geração de chaves varia muito de uma chamada para outra: mais tempo por rodada
+        yield Caso(f"rsa/{bits}/gerar_chaves", lambda bits=bits: gerar(bits), tempo_minimo=2.0 if bits < 4096 else 5.0)
+        yield Caso(f"rsa/{bits}/criptografar", lambda bits=bits: criptografar(bits))
+        yield Caso(f"rsa/{bits}/descriptografar", lambda bits=bits: descriptografar(bits))
+
+def casos_ecc():
+    mensagem = "Contrato de prestação de serviços escolares"
+
+    def assinar(curva):
+        from educasec.ecc import generate_ecc_keypair, sign_message
+        private_key, _ = generate_ecc_keypair(curva)
+        return lambda: sign_message(private_key, mensagem)
+
+    def verificar(curva):
+        from educasec.ecc import generate_ecc_keypair, sign_message, verify_signature
+        private_key, public_key = generate_ecc_keypair(curva)
+        assinatura = sign_message(private_key, mensagem)
+        return lambda: verify_signature(public_key, mensagem, assinatura)
+
+    for curva in CURVAS_ASSINATURA:
+        yield Caso(f"ecc/{curva}/assinar", lambda curva=curva: assinar(curva))
+        yield Caso(f"ecc/{curva}/verificar", lambda curva=curva: verificar(curva))
+
+def casos_hash():
+    tamanho = 1 << 20
+    texto = texto_amostra(tamanho)
+
+    def preparar(algoritmo):
+        from educasec.hash import gerar_hash
+        return lambda: gerar_hash(texto, algoritmo)
+
+    for algoritmo in ALGORITMOS_HASH:
+        yield Caso(f"hash/{algoritmo}", lambda algoritmo=algoritmo: preparar(algoritmo), tamanho, "B")
+
+def casos_xor():
+    tamanho = 16 << 20
+
+    def preparar(chave_em_arquivo):
+        import io
+        import os
+        from educasec.xor import xor_fluxo
+        dados = os.urandom(tamanho)
+        chave = os.urandom(tamanho) if chave_em_arquivo else b"LIMAO"
+
+        class Descarte:
+            def write(self, bloco):
+                return len(bloco)
+
+        def operacao():
+            xor_fluxo(io.BytesIO(dados), io.BytesIO(chave) if chave_em_arquivo else chave, Descarte())
+        return operacao
+
+    yield Caso("xor/one-time-pad", lambda: preparar(True), tamanho, "B")
+    yield Caso("xor/chave-repetida", lambda: preparar(False), tamanho, "B")
+
+def casos_aes():
+    tamanho = 16 << 20
+
+    def preparar(modo, bits):
+        import io
+        import os
+        from educasec.aes import cifrar_fluxo
+        dados = os.urandom(tamanho)
+        chave = bytes(bits // 8)
+
+        class Descarte:
+            def write(self, bloco):
+                return len(bloco)
+
+        return lambda: cifrar_fluxo(io.BytesIO(dados), Descarte(), chave, modo)
+
+    for modo in ("CBC", "CTR", "GCM"):
+        for bits in (128, 256):
+            yield Caso(f"aes/{modo}-{bits}", lambda modo=modo, bits=bits: preparar(modo, bits), tamanho, "B")
+
+def casos_nuvem():
+    texto = texto_amostra(20 << 10)
+
+    def spacy_processar():
+        import spacy
+        from nuvem import COMPONENTES_EXCLUIDOS
+        nlp = spacy.load("pt_core_news_sm", exclude=COMPONENTES_EXCLUIDOS)
+        return lambda: nlp(texto)
+
+    def wordcloud_desenhar():
+        from nuvem import contar_palavras_rapido, gerar_png_nuvem
+        frequencias = dict(contar_palavras_rapido(texto).most_common(200))
+        return lambda: gerar_png_nuvem(frequencias)
+
+    yield Caso("nuvem/spacy_20KB", spacy_processar, len(texto), "B")
+    yield Caso("nuvem/wordcloud", wordcloud_desenhar)
+
+def todos_os_casos(rapido):
+    yield from casos_cifras_classicas(TAMANHOS_RAPIDO if rapido else TAMANHOS)
+    yield from caso_enigma()
+    yield from casos_rsa((1024, 2048) if rapido else (1024, 2048, 4096))
+    yield from casos_ecc()
+    yield from casos_hash()
+    yield from casos_xor()
+    yield from casos_aes()
+    yield from casos_nuvem()
+
+# --- Medição ---
+
+def cronometrar(operacao, tempo_minimo, rodadas):
+    """
+    Executa a operação em `rodadas` rodadas de pelo menos `tempo_minimo`
+    segundos cada e devolve o tempo por operação (s) de cada rodada.
+    """
+    operacao()  # aquecimento (caches, importações tardias)
+    tempos = []
+    for _ in range(rodadas):
+        quantidade = 0
+        inicio = time.perf_counter()
+        decorrido = 0.0
+        while decorrido < tempo_minimo or quantidade == 0:
+            operacao()
+            quantidade += 1
+            decorrido = time.perf_counter() - inicio
+        tempos.append(decorrido / quantidade)
+    return tempos
+
+def executar_caso(caso, rodadas, escala_tempo):
+    """
+    Prepara e mede um caso. Devolve o resultado ou None se uma dependência
+    estiver faltando (o motivo vai em `ignorados`).
+    """
+    try:
+        operacao = caso.preparar()
+    except (ImportError, OSError) as erro:
+        return {"ignorado": f"{type(erro).__name__}: {erro}"}
+    tempos = cronometrar(operacao, caso.tempo_minimo * escala_tempo, rodadas)
+    resultado = {
+        "s_por_op": statistics.median(tempos),
+        "melhor_s": min(tempos),
+        "rodadas": len(tempos),
+    }
+    if caso.unidades:
+        resultado["vazao"] = caso.unidades / resultado["s_por_op"]
+        resultado["unidade"] = f"{caso.unidade}/s"
+    return resultado
+
+def nome_maquina():
+    """
+    Nome do arquivo de resultados desta máquina (hostname sem caracteres especiais).
+    """
+    return re.sub(r"[^\w.-]+", "_", platform.node() or "maquina")
+
+def descrever_maquina():
+    return {
+        "nome": platform.node(),
+        "python": platform.python_version(),
+        "sistema": platform.platform(),
+        "processador": platform.processor() or platform.machine(),
+        "nucleos": os.cpu_count(),
+    }
+
+def formatar_tempo(segundos):
+    if segundos >= 1:
+        return f"{segundos:.2f} s"
+    if segundos >= 1e-3:
+        return f"{segundos * 1e3:.2f} ms"
+    return f"{segundos * 1e6:.1f} µs"
+
+def formatar_vazao(resultado):
+    if "vazao" not in resultado:
+        return ""
+    vazao = resultado["vazao"]
+    if resultado["unidade"] == "B/s":
+        return f"{vazao / (1 << 20):.1f} MB/s"
+    return f"{vazao:,.0f} {resultado['unidade']}".replace(",", ".")
+
+def comparar(resultados, referencia, limite):
+    """
+    Casos mais lentos que a referência além do limite: lista de
+    (nome, tempo de referência, tempo atual, variação).
+    """
+    regressoes = []
+    for nome, resultado in resultados.items():
+        anterior = referencia.get(nome)
+        if not anterior or "s_por_op" not in anterior or "s_por_op" not in resultado:
+            continue
+        variacao = resultado["s_por_op"] / anterior["s_por_op"] - 1
+        if variacao > limite:
+            regressoes.append((nome, anterior["s_por_op"], resultado["s_por_op"], variacao))
+    return regressoes
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de todas as cifras, com detecção de regressões.")
+    parser.add_argument("--filtro", nargs="+", help="Só os casos cujo nome começa com um destes prefixos")
+    parser.add_argument("--rapido", action="store_true", help="Textos até 100 KB, sem RSA 4096 e rodadas mais curtas")
+    parser.add_argument("--rodadas", type=int, default=5, help="Rodadas por caso (vale a mediana)")
+    parser.add_argument("--limite", type=float, default=0.25,
+                        help="Variação tolerada antes de acusar regressão (0.25 = 25%% mais lento)")
+    parser.add_argument("--maquina", default=nome_maquina(), help="Nome do arquivo de resultados desta máquina")
+    parser.add_argument("--referencia", help="JSON de referência (padrão: benchmarks/resultados/<máquina>.json)")
+    parser.add_argument("--atualizar", action="store_true",
+                        help="Grava esta execução como a referência da máquina, mesmo se houver regressão")
+    parser.add_argument("--listar", action="store_true", help="Só lista os casos")
+    args = parser.parse_args()
+
+    # Os casos da nuvem importam o módulo nuvem.py da raiz do projeto
+    if RAIZ not in sys.path:
+        sys.path.insert(0, RAIZ)
+
+    casos = [
+        caso for caso in todos_os_casos(args.rapido)
+        if not args.filtro or any(caso.nome.startswith(prefixo) for prefixo in args.filtro)
+    ]
+    if args.listar:
+        for caso in casos:
+            print(caso.nome)
+        return 0
+
+    caminho = os.path.join(PASTA_RESULTADOS, f"{args.maquina}.json")
+    caminho_referencia = args.referencia or caminho
+    referencia = {}
+    if os.path.exists(caminho_referencia):
+        with open(caminho_referencia, encoding="utf-8") as f:
+            referencia = json.load(f)["resultados"]
+
+    escala_tempo = 0.25 if args.rapido else 1.0
+    resultados = {}
+    print(f"{'caso':<32} {'tempo/op':>11} {'vazão':>16} {'referência':>11} {'variação':>9}")
+    for caso in casos:
+        resultado = executar_caso(caso, args.rodadas, escala_tempo)
+        resultados[caso.nome] = resultado
+        if "ignorado" in resultado:
+            print(f"{caso.nome:<32} {'ignorado':>11}  ({resultado['ignorado']})")
+            continue
+        linha = f"{caso.nome:<32} {formatar_tempo(resultado['s_por_op']):>11} {formatar_vazao(resultado):>16}"
+        anterior = referencia.get(caso.nome, {})
+        if "s_por_op" in anterior:
+            variacao = resultado["s_por_op"] / anterior["s_por_op"] - 1
+            alerta = " ⚠️" if variacao > args.limite else ""
+            linha += f" {formatar_tempo(anterior['s_por_op']):>11} {variacao:+9.0%}{alerta}"
+        print(linha, flush=True)
+
+    regressoes = comparar(resultados, referencia, args.limite)
+    if regressoes:
+        print(f"\n❌ {len(regressoes)} regressão(ões) acima de {args.limite:.0%}:")
+        for nome, antes, depois, variacao in regressoes:
+            print(f"   {nome}: {formatar_tempo(antes)} -> {formatar_tempo(depois)} ({variacao:+.0%})")
+    elif referencia:
+        print(f"\n✅ Nenhuma regressão acima de {args.limite:.0%}.")
+
+    # Sem referência (primeira execução) ou com --atualizar, esta execução vira a referência
+    if args.atualizar or not os.path.exists(caminho):
+        os.makedirs(PASTA_RESULTADOS, exist_ok=True)
+        anteriores = {}
+        if os.path.exists(caminho):
+            with open(caminho, encoding="utf-8") as f:
+                anteriores = json.load(f)["resultados"]
+        with open(caminho, "w", encoding="utf-8") as f:
+            json.dump({
+                "data": datetime.now().isoformat(timespec="seconds"),
+                "maquina": descrever_maquina(),
+                "rapido": args.rapido,
+                # Casos que não rodaram agora (filtro, --rapido) mantêm o valor anterior
+                "resultados": {**anteriores, **resultados},
+            }, f, ensure_ascii=False, indent=2)
+        print(f"Referência gravada em {os.path.relpath(caminho)}")
+    return 1 if regressoes else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
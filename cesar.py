@@ -1,5 +1,10 @@
 import streamlit as st
 
+import sessao
+from educasec import memo
+from educasec.cesar import criptografar_cesar
+from educasec.incremental import CifraIncremental, cifra_cesar
+
 # O código para a cifra de César deve estar dentro de uma função.
 # A função será importada pelo arquivo principal (app.py).
 def app():
@@ -22,20 +27,27 @@ def app():
         step=1
     )
 
+    ao_vivo = st.toggle("⚡ Modo ao vivo", help="O resultado é atualizado a cada edição do texto (Ctrl+Enter ou ao sair da caixa), cifrando de novo só o trecho alterado.")
+    if not ao_vivo:
+        st.session_state.pop("cesar_ao_vivo", None)
+
     # Processamento e exibição do resultado
     if texto_original:
-        def criptografar_cesar(texto, chave):
-            resultado = ""
-            for char in texto:
-                if 'a' <= char <= 'z':
-                    resultado += chr((ord(char) - ord('a') + chave) % 26 + ord('a'))
-                elif 'A' <= char <= 'Z':
-                    resultado += chr((ord(char) - ord('A') + chave) % 26 + ord('A'))
-                else:
-                    resultado += char
-            return resultado
-
-        texto_criptografado = criptografar_cesar(texto_original, deslocamento)
-        
+        if ao_vivo:
+            # Guarda o texto cifrado da edição anterior; recomeça se a chave mudar
+            estado = st.session_state.get("cesar_ao_vivo")
+            if estado is None or estado[0] != deslocamento:
+                estado = (deslocamento, CifraIncremental(*cifra_cesar(deslocamento)))
+                st.session_state["cesar_ao_vivo"] = estado
+            texto_criptografado = estado[1].atualizar(texto_original)
+            st.caption(f"⚡ {estado[1].recifrados} de {len(texto_original)} caracteres cifrados nesta atualização")
+        else:
+            # Mexer em outro controle não recalcula a cifra do mesmo texto
+            texto_criptografado = memo.memorizar("cesar", criptografar_cesar, texto_original, deslocamento)
+
+        # Disponível para a página de Análise de Frequência
+        sessao.guardar("ultima_saida", texto_criptografado, descartavel=True)
+        st.session_state["ultima_saida_origem"] = "Cifra de César"
+
         st.subheader("Resultado")
         st.success(f"Texto Criptografado: **{texto_criptografado}**")
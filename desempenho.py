@@ -0,0 +1,143 @@
+# desempenho.py
+# Painel de desempenho na barra lateral (opcional): mostra quanto tempo cada
+# página e cada operação levou, exporta as medições em JSON lines e permite
+# perfilar uma execução inteira com o cProfile. Também mostra quanto o cache
+# de resultados (educasec.memo) está sendo reaproveitado.
+import uuid
+
+import streamlit as st
+
+import sessao
+from educasec import memo, perf
+from paginas import exibir_pagina
+
+def rotulo_sessao():
+    """
+    Identificador curto da sessão, usado para separar as medições de cada aluno.
+    """
+    if "perf_sessao" not in st.session_state:
+        st.session_state["perf_sessao"] = uuid.uuid4().hex[:8]
+    return st.session_state["perf_sessao"]
+
+def executar_pagina(nome):
+    """
+    Executa a página escolhida. Se o usuário pediu, esta execução roda sob o
+    cProfile e o relatório fica guardado para o painel.
+    """
+    reruns = st.session_state.get("perf_reruns", 0) + 1
+    st.session_state["perf_reruns"] = reruns
+    perf.definir_rotulo(f"{rotulo_sessao()}#{reruns}")
+
+    if not st.session_state.pop("perf_perfilar", False):
+        exibir_pagina(nome)
+        return
+    try:
+        _, relatorio = perf.perfilar(exibir_pagina, nome)
+    except BaseException as excecao:
+        # st.stop() e st.rerun() usam exceções; o relatório vem junto com elas
+        relatorio = getattr(excecao, "relatorio_perfil", None)
+        raise
+    finally:
+        st.session_state["perf_relatorio"] = (nome, relatorio)
+
+def tabela_memo():
+    """
+    Acertos do cache de resultados por operação (contados sempre, mesmo com a
+    medição de tempos desligada).
+    """
+    linhas = memo.estatisticas()
+    if not linhas:
+        return
+    usados, limite = memo.uso()
+    st.caption(f"Cache de resultados: {usados / 1024:.0f} KB de {limite / 1024:.0f} KB")
+    st.dataframe(
+        [
+            {
+                "Operação": linha["operacao"],
+                "Acertos": f"{linha['taxa_acerto']:.0%}",
+                "Chamadas": linha["acertos"] + linha["faltas"],
+                "Guardados": linha["entradas"],
+                "Descartes": linha["descartes"],
+            }
+            for linha in linhas
+        ],
+        hide_index=True,
+        use_container_width=True
+    )
+
+def mostrar_vazao(total, segundos):
+    """
+    Tamanho processado, tempo e vazão (MB/s) de uma operação sobre arquivos.
+    """
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Processado", sessao.formatar_bytes(total))
+    with col2:
+        st.metric("Tempo", f"{segundos * 1000:.1f} ms")
+    with col3:
+        st.metric("Vazão", f"{total / (1 << 20) / max(segundos, 1e-9):,.0f} MB/s".replace(",", "."))
+
+def painel_lateral():
+    """
+    Mostra o painel de desempenho na barra lateral.
+    """
+    with st.sidebar.expander("⏱️ Desempenho"):
+        ligado = st.toggle(
+            "Medir tempos",
+            value=perf.ativo(),
+            help="Vale para o servidor inteiro. Desligado, as medições não custam quase nada."
+        )
+        if ligado != perf.ativo():
+            perf.ativar(ligado)
+            st.rerun()
+        tabela_memo()
+        if not ligado:
+            st.caption("Ligue para medir as páginas e as operações (chaves, assinaturas, nuvem...).")
+            return
+
+        so_esta_sessao = st.checkbox("Só esta sessão", value=True)
+        medicoes = perf.registros()
+        if so_esta_sessao:
+            prefixo = rotulo_sessao() + "#"
+            medicoes = [m for m in medicoes if (m["rotulo"] or "").startswith(prefixo)]
+
+        if medicoes:
+            st.dataframe(
+                [
+                    {
+                        "Operação": linha["operacao"],
+                        "Chamadas": linha["chamadas"],
+                        "p50 (ms)": round(linha["p50_ms"], 1),
+                        "p95 (ms)": round(linha["p95_ms"], 1),
+                        "Máx. (ms)": round(linha["max_ms"], 1),
+                    }
+                    for linha in perf.resumo(medicoes)
+                ],
+                hide_index=True,
+                use_container_width=True
+            )
+            st.caption(f"{len(medicoes)} medições (o buffer guarda as últimas {perf.TAMANHO_BUFFER}).")
+            st.download_button(
+                "📥 Exportar (JSON lines)",
+                data=perf.exportar_jsonl(medicoes),
+                file_name="desempenho.jsonl",
+                mime="application/jsonl"
+            )
+        else:
+            st.caption("Nenhuma medição ainda. Use a página para gerar algumas.")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔬 Perfilar", help="Roda a próxima execução da página sob o cProfile"):
+                st.session_state["perf_perfilar"] = True
+                st.rerun()
+        with col2:
+            if st.button("🧹 Limpar"):
+                perf.limpar()
+                st.session_state.pop("perf_relatorio", None)
+                st.rerun()
+
+        if st.session_state.get("perf_relatorio"):
+            nome, relatorio = st.session_state["perf_relatorio"]
+            st.caption(f"cProfile de uma execução de: {nome}")
+            st.code(relatorio or "Relatório indisponível.", language="text")
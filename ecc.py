@@ -1,15 +1,21 @@
 # ecc.py
 import streamlit as st
-import hashlib
 import json
+import time
 from datetime import datetime
 
+import sessao
+from educasec.registro import Registro, RegistroAssinaturas
+
 # Verificação de bibliotecas
 try:
-    from cryptography.hazmat.primitives.asymmetric import ec
-    from cryptography.hazmat.primitives import hashes, serialization
-    from cryptography.hazmat.backends import default_backend
-    from cryptography.exceptions import InvalidSignature
+    from educasec.ecc import (
+        ECDH_CURVES, KEY_POOL,
+        deserialize_private_key, deserialize_public_key, serialize_public_key, public_key_fingerprint,
+        key_curve_name, signature_algorithm_for_curve, signature_algorithm,
+        sign_message, verify_signature, verify_signature_digest, derive_shared_secret, hash_message
+    )
+    from educasec.ecc import benchmark_curves as measure_curves
 except ImportError:
     st.error("""
     ⚠️ A biblioteca `cryptography` não foi encontrada.
@@ -22,99 +28,118 @@ except ImportError:
 
 # --- Funções Auxiliares ---
 
-def generate_ecc_keypair(curve_name="SECP256R1"):
+@st.cache_data(show_spinner="Medindo o desempenho das curvas...")
+def benchmark_curves():
     """
-    Gera um par de chaves ECC (pública e privada).
+    Operações por segundo em cada curva. O resultado é medido uma vez por
+    processo e reaproveitado por todas as sessões.
     """
-    # Mapeia os nomes das curvas
-    curves = {
-        "SECP256R1": ec.SECP256R1(),
-        "SECP384R1": ec.SECP384R1(),
-        "SECP521R1": ec.SECP521R1()
-    }
-    
-    curve = curves.get(curve_name, ec.SECP256R1())
-    
-    # Gera a chave privada
-    private_key = ec.generate_private_key(curve, default_backend())
-    
-    # Obtém a chave pública
-    public_key = private_key.public_key()
-    
-    return private_key, public_key
+    return measure_curves()
 
-def serialize_private_key(private_key):
+def show_speed_table(operations, highlight=None):
     """
-    Serializa a chave privada para formato PEM.
+    Mostra a tabela de operações por segundo medidas em cada curva.
     """
-    pem = private_key.private_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
-    )
-    return pem.decode('utf-8')
+    results = benchmark_curves()
+    rows = []
+    for curve_name, row in results.items():
+        if not any(op in row for op in operations):
+            continue
+        line = {"Curva": ("👉 " if curve_name == highlight else "") + curve_name}
+        for op in operations:
+            line[f"{op} (ops/s)"] = f"{row[op]:,.0f}".replace(",", ".") if op in row else "—"
+        rows.append(line)
+    st.dataframe(rows, hide_index=True, use_container_width=True)
 
-def serialize_public_key(public_key):
+@st.cache_resource
+def registro_assinaturas():
     """
-    Serializa a chave pública para formato PEM.
+    Registro local (SQLite) das assinaturas, compartilhado por todas as sessões.
     """
-    pem = public_key.public_bytes(
-        encoding=serialization.Encoding.PEM,
-        format=serialization.PublicFormat.SubjectPublicKeyInfo
-    )
-    return pem.decode('utf-8')
+    return RegistroAssinaturas()
 
-def deserialize_private_key(pem_string):
+def registro_do_pacote(pacote, documento=None):
     """
-    Deserializa uma chave privada do formato PEM.
+    Confere um pacote de assinatura (o JSON mostrado ao assinar) e o converte
+    em um Registro. A assinatura é verificada com a chave pública do pacote:
+    com o documento, se ele for informado (obrigatório no Ed25519), ou só com
+    o hash (ECDSA). A impressão digital é sempre recalculada da chave.
+    Arquivo, algoritmo e momento não fazem parte da assinatura: só o tipo
+    deles é conferido. Levanta ValueError se alguma conferência falhar.
     """
-    return serialization.load_pem_private_key(
-        pem_string.encode('utf-8'),
-        password=None,
-        backend=default_backend()
-    )
+    for campo in ("hash", "assinatura", "chave_publica"):
+        if not isinstance(pacote[campo], str):
+            raise ValueError(f"o campo '{campo}' deve ser um texto")
+    for campo in ("arquivo", "algoritmo", "timestamp", "documento"):
+        if not isinstance(pacote.get(campo), (str, type(None))):
+            raise ValueError(f"o campo '{campo}' deve ser um texto ou ficar ausente")
+    if pacote.get("timestamp"):
+        try:
+            datetime.fromisoformat(pacote["timestamp"])
+        except ValueError:
+            raise ValueError("o campo 'timestamp' deve ser uma data ISO 8601") from None
 
-def deserialize_public_key(pem_string):
-    """
-    Deserializa uma chave pública do formato PEM.
-    """
-    return serialization.load_pem_public_key(
-        pem_string.encode('utf-8'),
-        backend=default_backend()
-    )
+    public_key = deserialize_public_key(pacote["chave_publica"])
+    impressao = public_key_fingerprint(public_key)
+    if pacote.get("impressao_chave") not in (None, "", impressao):
+        raise ValueError("a impressão digital não corresponde à chave pública")
 
-def sign_message(private_key, message):
-    """
-    Assina uma mensagem usando a chave privada ECC.
-    """
-    signature = private_key.sign(
-        message.encode('utf-8'),
-        ec.ECDSA(hashes.SHA256())
+    documento = documento if documento is not None else pacote.get("documento")
+    if documento is not None:
+        if hash_message(documento) != pacote["hash"]:
+            raise ValueError("o hash não corresponde ao documento")
+        valida = verify_signature(public_key, documento, pacote["assinatura"])
+    else:
+        valida = verify_signature_digest(public_key, pacote["hash"], pacote["assinatura"])
+    if not valida:
+        raise ValueError("a assinatura não confere com o hash e a chave pública")
+
+    return Registro(
+        pacote["hash"], pacote["assinatura"], impressao, pacote.get("timestamp"),
+        pacote.get("arquivo"), pacote.get("algoritmo"), pacote["chave_publica"]
     )
-    return signature.hex()
 
-def verify_signature(public_key, message, signature_hex):
+def importar_pacotes(registro, linhas):
     """
-    Verifica a assinatura de uma mensagem usando a chave pública ECC.
+    Confere e registra pacotes de assinatura (um JSON por linha). Pacotes
+    inválidos são recusados; devolve (inseridos, [(linha, motivo), ...]).
     """
-    try:
-        signature = bytes.fromhex(signature_hex)
-        public_key.verify(
-            signature,
-            message.encode('utf-8'),
-            ec.ECDSA(hashes.SHA256())
-        )
-        return True
-    except InvalidSignature:
-        return False
-    except Exception:
-        return False
+    recusados = []
+
+    def conferidos():
+        for numero, linha in enumerate(linhas, start=1):
+            if not linha.strip():
+                continue
+            try:
+                pacote = json.loads(linha)
+                if not isinstance(pacote, dict):
+                    raise ValueError("a linha não é um objeto JSON")
+                yield registro_do_pacote(pacote)
+            except KeyError as e:
+                recusados.append((numero, f"campo ausente: {e.args[0]}"))
+            except (ValueError, TypeError, AttributeError) as e:
+                recusados.append((numero, str(e) or type(e).__name__))
 
-def hash_message(message):
+    inseridos = registro.registrar_lote(conferidos())
+    return inseridos, recusados
+
+def show_registry_rows(registros):
     """
-    Gera o hash SHA-256 de uma mensagem.
+    Mostra as assinaturas encontradas no registro.
     """
-    return hashlib.sha256(message.encode('utf-8')).hexdigest()
+    st.dataframe(
+        [
+            {
+                "Arquivo": registro.arquivo or "—",
+                "Assinado em": registro.momento,
+                "Algoritmo": registro.algoritmo or "—",
+                "Impressão da chave": registro.impressao[:16] + "…",
+            }
+            for registro in registros
+        ],
+        hide_index=True,
+        use_container_width=True
+    )
 
 # --- Interface Streamlit ---
 
@@ -123,11 +148,12 @@ def app():
     st.markdown("---")
     
     # Tabs principais
-    tab1, tab2, tab3, tab4 = st.tabs([
+    tab1, tab2, tab3, tab4, tab5 = st.tabs([
         "📚 O que é ECC?", 
         "🔑 Gerar Chaves", 
         "✍️ Assinar Documentos",
-        "✅ Verificar Assinatura"
+        "✅ Verificar Assinatura",
+        "🗄️ Registro"
     ])
     
     # ===== TAB 1: Teoria =====
@@ -195,6 +221,8 @@ def app():
         - **SECP256R1** (P-256): Padrão NIST, 256 bits, amplamente usado
         - **SECP384R1** (P-384): Padrão NIST, 384 bits, segurança aumentada
         - **SECP521R1** (P-521): Padrão NIST, 521 bits, máxima segurança
+        - **Ed25519**: Curva de Edwards (Curve25519), assinaturas rápidas e determinísticas
+        - **X25519**: Curve25519 na forma de Montgomery, usada para troca de chaves (ECDH)
         
         Nesta aplicação, usamos **SECP256R1** por ser o padrão mais comum e equilibrado.
         """)
@@ -217,42 +245,65 @@ def app():
         col1, col2 = st.columns([2, 1])
         
         with col1:
-            curve_option = st.selectbox(
-                "Escolha a curva elíptica:",
-                ["SECP256R1 (P-256) - Recomendado", "SECP384R1 (P-384)", "SECP521R1 (P-521)"],
-                help="Curvas maiores oferecem mais segurança, mas são mais lentas"
-            )
-        
-        with col2:
             curve_map = {
                 "SECP256R1 (P-256) - Recomendado": "SECP256R1",
                 "SECP384R1 (P-384)": "SECP384R1",
-                "SECP521R1 (P-521)": "SECP521R1"
+                "SECP521R1 (P-521)": "SECP521R1",
+                "Ed25519 (assinaturas rápidas)": "Ed25519",
+                "X25519 (troca de chaves ECDH)": "X25519"
             }
+            curve_option = st.selectbox(
+                "Escolha a curva elíptica:",
+                list(curve_map.keys()),
+                help="Curvas maiores oferecem mais segurança, mas são mais lentas"
+            )
             curve_name = curve_map[curve_option]
             
+            st.write("**⚡ Velocidade medida neste servidor**")
+            show_speed_table(["Gerar chaves", "Assinar", "Verificar", "ECDH"], highlight=curve_name)
+        
+        with col2:
             security_level = {
                 "SECP256R1": "128 bits",
                 "SECP384R1": "192 bits",
-                "SECP521R1": "256 bits"
+                "SECP521R1": "256 bits",
+                "Ed25519": "128 bits",
+                "X25519": "128 bits"
             }
             
             st.metric("Segurança", security_level[curve_name])
+            
+            if curve_name == "Ed25519":
+                st.info("Ed25519 é determinística: a mesma chave e mensagem sempre geram a mesma assinatura.")
+            elif curve_name == "X25519":
+                st.info("X25519 serve apenas para combinar um segredo compartilhado (ECDH), não para assinar.")
+        
+        # Começa a abastecer o estoque assim que a aba é exibida
+        KEY_POOL.start()
         
         if st.button("🎲 Gerar Par de Chaves", type="primary"):
             with st.spinner("Gerando chaves ECC..."):
-                private_key, public_key = generate_ecc_keypair(curve_name)
-                
-                private_pem = serialize_private_key(private_key)
-                public_pem = serialize_public_key(public_key)
+                # Retira um par já gerado e serializado do estoque da curva
+                keypair = KEY_POOL.take(curve_name)
                 
                 # Armazena no session_state
-                st.session_state['ecc_private_key'] = private_pem
-                st.session_state['ecc_public_key'] = public_pem
+                st.session_state['ecc_private_key'] = keypair.private_pem
+                st.session_state['ecc_public_key'] = keypair.public_pem
                 st.session_state['ecc_curve'] = curve_name
                 
                 st.success("✅ Chaves ECC geradas com sucesso!")
         
+        with st.expander("📦 Estoque de chaves pré-geradas"):
+            depths = KEY_POOL.depths()
+            cols = st.columns(len(depths))
+            for col, (name, depth) in zip(cols, depths.items()):
+                with col:
+                    st.metric(name, f"{depth}/{KEY_POOL.depth}")
+            st.caption(
+                f"Entregues do estoque: {KEY_POOL.served_from_pool} | "
+                f"Geradas na hora: {KEY_POOL.served_inline}"
+            )
+        
         if 'ecc_public_key' in st.session_state:
             st.markdown("---")
             
@@ -294,6 +345,36 @@ def app():
             - Use a **chave privada** para assinar documentos (Tab "Assinar Documentos")
             - Compartilhe a **chave pública** com outros para que possam verificar suas assinaturas
             """)
+            
+            if st.session_state['ecc_curve'] in ECDH_CURVES:
+                st.markdown("---")
+                st.subheader("🤝 Troca de Chaves (ECDH)")
+                st.write("""
+                Com ECDH, duas pessoas combinam um **segredo compartilhado** trocando apenas chaves públicas.
+                Simulamos a outra parte (Bob) com um par de chaves novo na mesma curva.
+                """)
+                
+                if st.button("🔗 Combinar Segredo com Bob"):
+                    try:
+                        my_private_key = deserialize_private_key(st.session_state['ecc_private_key'])
+                        bob = KEY_POOL.take(st.session_state['ecc_curve'])
+                        
+                        # Cada lado usa a própria chave privada e a chave pública do outro
+                        my_secret = derive_shared_secret(my_private_key, bob.public_key)
+                        bob_secret = derive_shared_secret(bob.private_key, my_private_key.public_key())
+                        
+                        col1, col2 = st.columns(2)
+                        with col1:
+                            st.write("**Segredo calculado por você**")
+                            st.code(my_secret, language="text")
+                        with col2:
+                            st.write("**Segredo calculado por Bob**")
+                            st.code(bob_secret, language="text")
+                        
+                        if my_secret == bob_secret:
+                            st.success("✅ Os dois lados chegaram ao mesmo segredo sem nunca enviá-lo!")
+                    except Exception as e:
+                        st.error(f"❌ Erro na troca de chaves: {str(e)}")
     
     # ===== TAB 3: Assinar Documentos =====
     with tab3:
@@ -336,6 +417,22 @@ def app():
                 private_key_to_sign = private_key_input
                 st.success("✅ Chave privada fornecida")
         
+        # O algoritmo de assinatura é definido pelo tipo da chave
+        signing_curve = None
+        if private_key_to_sign:
+            try:
+                signing_curve = key_curve_name(deserialize_private_key(private_key_to_sign))
+            except Exception:
+                st.error("❌ Não foi possível ler a chave privada (formato PEM esperado).")
+        
+        if signing_curve:
+            st.metric("Algoritmo de Assinatura", signature_algorithm_for_curve(signing_curve))
+            if signing_curve == "X25519":
+                st.warning("⚠️ Chaves X25519 não assinam documentos. Gere uma chave Ed25519 ou de uma curva NIST.")
+        
+        with st.expander("⚡ Velocidade de assinatura por curva"):
+            show_speed_table(["Assinar"], highlight=signing_curve)
+        
         st.markdown("---")
         
         # Documento para assinar
@@ -388,7 +485,8 @@ def app():
                     signature = sign_message(private_key, documento)
                     
                     # Armazena no session_state
-                    st.session_state['signed_document'] = documento
+                    # (o documento pode ser grande: fica em disco se passar do limite)
+                    sessao.guardar('signed_document', documento, descartavel=True)
                     st.session_state['signature'] = signature
                     st.session_state['doc_hash'] = doc_hash
                     st.session_state['doc_name'] = nome_arquivo
@@ -408,7 +506,7 @@ def app():
                         st.metric("Tamanho", f"{len(documento)} caracteres")
                     
                     with col2:
-                        st.metric("Algoritmo", "ECDSA-SHA256")
+                        st.metric("Algoritmo", signature_algorithm(private_key))
                         st.metric("Tamanho Assinatura", f"{len(signature)} caracteres")
                     
                     st.write("**🔐 Hash do Documento (SHA-256)**")
@@ -421,21 +519,27 @@ def app():
                         st.toast("✅ Assinatura copiada!", icon="📋")
                     
                     # Pacote completo para compartilhar
+                    # (sem o documento: o hash basta para conferir qual arquivo foi assinado)
                     st.markdown("---")
                     st.subheader("📤 Pacote Completo de Assinatura")
                     
+                    public_key = private_key.public_key()
                     pacote = {
-                        "documento": documento,
                         "assinatura": signature,
                         "hash": doc_hash,
                         "arquivo": nome_arquivo,
                         "timestamp": st.session_state['sign_timestamp'],
-                        "algoritmo": "ECDSA-SHA256",
-                        "chave_publica": st.session_state.get('ecc_public_key', 'Não disponível')
+                        "algoritmo": signature_algorithm(private_key),
+                        "impressao_chave": public_key_fingerprint(public_key),
+                        "chave_publica": serialize_public_key(public_key)
                     }
                     
                     st.json(pacote)
                     
+                    # Guarda o pacote no registro local
+                    registro_assinaturas().registrar_lote([registro_do_pacote(pacote, documento)])
+                    st.caption("🗄️ Assinatura guardada no registro local (aba Registro).")
+                    
                     st.info("""
                     💡 **Para verificar a assinatura**:
                     1. Compartilhe este pacote (ou apenas a assinatura) com o destinatário
@@ -470,7 +574,7 @@ def app():
         
         if origem == "📦 Documento assinado nesta sessão":
             if 'signed_document' in st.session_state:
-                documento_verificar = st.session_state['signed_document']
+                documento_verificar = sessao.ler('signed_document', "")
                 assinatura_verificar = st.session_state['signature']
                 
                 if 'ecc_public_key' in st.session_state:
@@ -529,6 +633,18 @@ def app():
                 chave_publica_verificar = chave_input
                 st.success("✅ Chave pública fornecida")
         
+        # O algoritmo de verificação é definido pelo tipo da chave pública
+        verifying_curve = None
+        if chave_publica_verificar:
+            try:
+                verifying_curve = key_curve_name(deserialize_public_key(chave_publica_verificar))
+                st.metric("Algoritmo de Verificação", signature_algorithm_for_curve(verifying_curve))
+            except Exception:
+                pass
+        
+        with st.expander("⚡ Velocidade de verificação por curva"):
+            show_speed_table(["Verificar"], highlight=verifying_curve)
+        
         # Botão de verificar
         st.markdown("---")
         
@@ -577,6 +693,16 @@ def app():
                         
                         st.info(f"🔐 **Hash do Documento**: `{doc_hash}`")
                         
+                        # Só as entradas da chave que acabou de ser verificada
+                        impressao_verificada = public_key_fingerprint(public_key)
+                        registrados = [
+                            registrado for registrado in registro_assinaturas().buscar_por_hash(doc_hash)
+                            if registrado.impressao == impressao_verificada
+                        ]
+                        if registrados:
+                            st.write(f"🗄️ No registro local, este documento aparece {len(registrados)} vez(es) assinado por esta chave:")
+                            show_registry_rows(registrados)
+                        
                     else:
                         st.error("❌ **ASSINATURA INVÁLIDA!**")
                         
@@ -616,6 +742,93 @@ def app():
         3. Se coincidirem, a assinatura é válida
         4. Qualquer alteração no documento invalida a assinatura
         """)
+    
+    # ===== TAB 5: Registro de Assinaturas =====
+    with tab5:
+        st.header("🗄️ Registro de Documentos Assinados")
+        
+        st.write("""
+        Cada documento assinado nesta página fica registrado em um banco de dados local (SQLite):
+        o **hash** do documento, a **assinatura**, a **impressão digital** da chave de quem assinou
+        e o **momento** da assinatura. O documento em si não é guardado.
+        """)
+        
+        registro = registro_assinaturas()
+        total_assinaturas, total_chaves = registro.contar()
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Assinaturas registradas", f"{total_assinaturas:,}".replace(",", "."))
+        with col2:
+            st.metric("Chaves diferentes", f"{total_chaves:,}".replace(",", "."))
+        
+        st.subheader("🔎 Este arquivo foi assinado? Por quem?")
+        
+        tipo_consulta = st.radio(
+            "Consultar por:",
+            ["📄 Upload de arquivo", "📝 Texto", "🔑 Impressão digital da chave"],
+            horizontal=True
+        )
+        
+        registros = None
+        if tipo_consulta == "🔑 Impressão digital da chave":
+            impressao = st.text_input("Impressão digital (SHA-256 da chave pública, em hexadecimal):").strip().lower()
+            if impressao:
+                registros = registro.buscar_por_impressao(impressao)
+        else:
+            if tipo_consulta == "📄 Upload de arquivo":
+                arquivo_consulta = st.file_uploader("Documento:", key="registro_arquivo")
+                # O hash é calculado como na assinatura (texto do arquivo em UTF-8)
+                documento_consulta = arquivo_consulta.read().decode('utf-8', errors='ignore') if arquivo_consulta else None
+            else:
+                documento_consulta = st.text_area("Texto do documento:", height=100, key="registro_texto")
+            if documento_consulta:
+                hash_consulta = hash_message(documento_consulta)
+                st.caption(f"Hash SHA-256: `{hash_consulta}`")
+                registros = registro.buscar_por_hash(hash_consulta)
+        
+        if registros is not None:
+            if registros:
+                st.success(f"✅ {len(registros)} assinatura(s) encontrada(s).")
+                show_registry_rows(registros)
+            else:
+                st.warning("⚠️ Nenhuma assinatura registrada para esta consulta.")
+        
+        with st.expander("⚙️ Como a busca é feita"):
+            st.write("""
+            O banco tem um **índice** no hash do documento e outro na impressão digital da chave.
+            Com eles, cada consulta é uma única busca no índice, em vez de ler o registro inteiro:
+            o tempo quase não muda com milhares ou milhões de assinaturas.
+            """)
+            st.write("**Plano da consulta por hash:**")
+            st.code("\n".join(registro.plano_consulta("hash")), language="text")
+            st.write("**Plano da consulta por impressão digital:**")
+            st.code("\n".join(registro.plano_consulta("impressao")), language="text")
+        
+        st.markdown("---")
+        st.subheader("📥 Importar Pacotes de Assinatura")
+        st.write("""
+        Envie um arquivo com vários pacotes de assinatura (um JSON por linha, no formato mostrado
+        na aba Assinar Documentos). Cada assinatura é verificada com a chave pública do pacote antes
+        de ser gravada; os pacotes válidos são gravados em lotes, cada lote em uma única transação.
+        Assinaturas Ed25519 só podem ser verificadas com o documento: inclua o campo `documento`.
+        """)
+        arquivo_pacotes = st.file_uploader("Pacotes (JSON lines):", type=['jsonl', 'json', 'txt'], key="registro_pacotes")
+        if arquivo_pacotes is not None and st.button("📥 Importar"):
+            try:
+                linhas = arquivo_pacotes.getvalue().decode('utf-8').splitlines()
+            except UnicodeDecodeError:
+                st.error("❌ O arquivo não está em UTF-8.")
+            else:
+                inicio = time.perf_counter()
+                inseridos, recusados = importar_pacotes(registro, linhas)
+                st.success(f"✅ {inseridos} assinatura(s) nova(s) registrada(s) em {time.perf_counter() - inicio:.2f} s.")
+                if recusados:
+                    st.warning(f"⚠️ {len(recusados)} pacote(s) recusado(s):")
+                    st.dataframe(
+                        [{"Linha": numero, "Motivo": motivo} for numero, motivo in recusados[:100]],
+                        hide_index=True,
+                        use_container_width=True
+                    )
 
 if __name__ == "__main__":
     app()
\ No newline at end of file
@@ -0,0 +1,10 @@
+# educasec/__init__.py
+# Núcleo das cifras do EducaSec, sem nenhuma dependência do Streamlit.
+#
+# As páginas do aplicativo (cesar.py, vigenere.py, enigma.py, rsa.py, ecc.py,
+# hash.py e pages/1_ECC.py) são apenas a interface; a lógica fica aqui, para
+# poder ser usada também em scripts e na linha de comando:
+#   python -m educasec --help
+#
+# Os módulos não são importados aqui: rsa e ecc dependem de pycryptodome e
+# cryptography, que só são carregadas por quem realmente usar essas cifras.
@@ -0,0 +1,7 @@
+# educasec/__main__.py
+# Permite executar a linha de comando com: python -m educasec
+import sys
+
+from educasec.cli import main
+
+sys.exit(main())
@@ -0,0 +1,247 @@
+# educasec/aes.py
+# Criptografia simétrica AES com PyCryptodome, nos modos CBC, CTR e GCM.
+# Requer: pip install pycryptodome
+#
+# Os arquivos são cifrados em blocos de tamanho fixo: os dados são lidos com
+# readinto() em um buffer reaproveitado e o AES escreve direto em um segundo
+# buffer, também reaproveitado (parâmetro output= do PyCryptodome), de onde o
+# resultado é escrito por uma memoryview. A memória usada não depende do
+# tamanho do arquivo.
+#
+# Formato do arquivo cifrado: IV ou nonce no início (16 bytes no CBC, 8 no
+# CTR, 12 no GCM), depois os dados cifrados e, no GCM, a etiqueta de
+# autenticação (16 bytes) no fim.
+#
+#   from educasec.aes import cifrar_fluxo
+#
+#   chave = os.urandom(32)  # AES-256
+#   with open("prova.pdf", "rb") as dados, open("prova.aes", "wb") as saida:
+#       cifrar_fluxo(dados, saida, chave, "GCM")
+import os
+import time
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+
+from educasec import perf
+
+MODOS = ("CBC", "CTR", "GCM")
+TAMANHOS_CHAVE = (128, 192, 256)
+
+# Tamanho dos blocos lidos dos arquivos (múltiplo de 16, o bloco do AES)
+TAMANHO_BLOCO = 1 << 20
+
+# Bytes do IV/nonce gravados no início do arquivo cifrado
+TAMANHO_NONCE = {"CBC": 16, "CTR": 8, "GCM": 12}
+TAMANHO_ETIQUETA = 16
+
+def gerar_chave(bits=256):
+    """
+    Chave aleatória de 128, 192 ou 256 bits.
+    """
+    if bits not in TAMANHOS_CHAVE:
+        raise ValueError(f"Tamanho de chave inválido: {bits} (use {', '.join(map(str, TAMANHOS_CHAVE))}).")
+    return os.urandom(bits // 8)
+
+def validar_chave(chave):
+    """
+    Confere o tamanho da chave (16, 24 ou 32 bytes).
+    """
+    if len(chave) * 8 not in TAMANHOS_CHAVE:
+        raise ValueError(f"A chave do AES deve ter 16, 24 ou 32 bytes (tem {len(chave)}).")
+
+def criar_cifra(chave, modo, nonce, contador=0):
+    """
+    Objeto do PyCryptodome para o modo. No CTR, `contador` é o número do
+    primeiro bloco de 16 bytes, o que permite cifrar trechos separados.
+    """
+    if modo == "CBC":
+        return AES.new(chave, AES.MODE_CBC, iv=nonce)
+    if modo == "CTR":
+        return AES.new(chave, AES.MODE_CTR, nonce=nonce, initial_value=contador)
+    if modo == "GCM":
+        return AES.new(chave, AES.MODE_GCM, nonce=nonce)
+    raise ValueError(f"Modo desconhecido: {modo} (use {', '.join(MODOS)}).")
+
+def _ler_completo(arquivo, visao):
+    """
+    Preenche a memoryview com readinto(), repetindo a leitura se o arquivo
+    devolver menos bytes (pipes, sockets). Devolve quantos bytes foram lidos.
+    """
+    lidos = 0
+    while lidos < len(visao):
+        n = arquivo.readinto(visao[lidos:])
+        if not n:
+            break
+        lidos += n
+    return lidos
+
+def _ctr_paralelo(chave, nonce, contador, origem, destino, executor, tamanho_parte):
+    """
+    Cifra (ou decifra) um trecho no modo CTR dividindo-o em partes, uma por
+    thread. Cada parte usa o contador do seu primeiro bloco, então o
+    resultado é idêntico ao de uma cifra só. O PyCryptodome libera o GIL
+    durante a cifra, então as threads rodam de fato ao mesmo tempo.
+    """
+    def cifrar_parte(inicio):
+        fim = min(inicio + tamanho_parte, len(origem))
+        cifra = criar_cifra(chave, "CTR", nonce, contador + inicio // 16)
+        cifra.encrypt(origem[inicio:fim], output=destino[inicio:fim])
+
+    # list() propaga a exceção de qualquer uma das threads
+    list(executor.map(cifrar_parte, range(0, len(origem), tamanho_parte)))
+
+def _preparar_buffers(tamanho):
+    entrada = bytearray(tamanho)
+    saida = bytearray(tamanho)
+    return memoryview(entrada), memoryview(saida)
+
+def cifrar_fluxo(entrada, saida, chave, modo="GCM", tamanho_bloco=TAMANHO_BLOCO, threads=1):
+    """
+    Cifra a entrada (arquivo binário) e escreve o resultado na saída, bloco a
+    bloco. Com `threads` > 1, o modo CTR cifra cada leitura em paralelo (os
+    modos CBC e GCM são sequenciais por natureza). Devolve o número de bytes
+    da entrada.
+    """
+    validar_chave(chave)
+    if tamanho_bloco % 16:
+        raise ValueError("O tamanho do bloco deve ser múltiplo de 16.")
+    nonce = os.urandom(TAMANHO_NONCE.get(modo, 16))
+    cifra = criar_cifra(chave, modo, nonce)
+    paralelo = modo == "CTR" and threads > 1
+    # No CTR paralelo, cada leitura tem um bloco por thread
+    leitura = tamanho_bloco * threads if paralelo else tamanho_bloco
+    visao, visao_saida = _preparar_buffers(leitura)
+
+    saida.write(nonce)
+    total = 0
+    with ThreadPoolExecutor(max_workers=threads) if paralelo else nullcontext() as executor:
+        while True:
+            n = _ler_completo(entrada, visao)
+            if modo == "CBC" and n < leitura:
+                # Último trecho: o preenchimento (PKCS#7) sempre acrescenta de 1 a 16 bytes
+                saida.write(cifra.encrypt(pad(bytes(visao[:n]), 16)))
+                total += n
+                break
+            if not n:
+                break
+            if paralelo:
+                _ctr_paralelo(chave, nonce, total // 16, visao[:n], visao_saida[:n], executor, tamanho_bloco)
+            else:
+                cifra.encrypt(visao[:n], output=visao_saida[:n])
+            saida.write(visao_saida[:n])
+            total += n
+    if modo == "GCM":
+        saida.write(cifra.digest())
+    return total
+
+def decifrar_fluxo(entrada, saida, chave, modo="GCM", tamanho_bloco=TAMANHO_BLOCO, threads=1):
+    """
+    Decifra um arquivo gerado por cifrar_fluxo() com o mesmo modo e a mesma
+    chave. No GCM, a etiqueta é conferida no fim: se o arquivo foi alterado ou
+    a chave está errada, ValueError é levantado e o que já foi escrito na
+    saída deve ser descartado. Devolve o número de bytes decifrados.
+    """
+    validar_chave(chave)
+    if tamanho_bloco % 16:
+        raise ValueError("O tamanho do bloco deve ser múltiplo de 16.")
+    nonce = bytearray(TAMANHO_NONCE.get(modo, 16))
+    if _ler_completo(entrada, memoryview(nonce)) < len(nonce):
+        raise ValueError("Arquivo cifrado incompleto: falta o IV/nonce do início.")
+    nonce = bytes(nonce)
+    cifra = criar_cifra(chave, modo, nonce)
+    paralelo = modo == "CTR" and threads > 1
+    leitura = tamanho_bloco * threads if paralelo else tamanho_bloco
+
+    # Os últimos 16 bytes lidos ficam sempre guardados no início do buffer até
+    # a leitura seguinte: no GCM podem ser a etiqueta e, no CBC, o bloco com o
+    # preenchimento, que só são tratados quando a entrada acaba.
+    reserva = 0 if modo == "CTR" else 16
+    visao, visao_saida = _preparar_buffers(leitura + reserva)
+    pendentes = 0
+    total = 0
+    with ThreadPoolExecutor(max_workers=threads) if paralelo else nullcontext() as executor:
+        while True:
+            n = _ler_completo(entrada, visao[pendentes:])
+            disponivel = pendentes + n
+            fim = disponivel < len(visao)
+            processar = disponivel if fim else disponivel - reserva
+            if modo == "GCM" and fim:
+                if disponivel < TAMANHO_ETIQUETA:
+                    raise ValueError("Arquivo cifrado incompleto: falta a etiqueta de autenticação.")
+                processar = disponivel - TAMANHO_ETIQUETA
+            if modo == "CBC" and processar % 16:
+                raise ValueError("Arquivo cifrado inválido: o tamanho não é múltiplo de 16 bytes.")
+
+            if paralelo:
+                _ctr_paralelo(chave, nonce, total // 16, visao[:processar], visao_saida[:processar],
+                              executor, tamanho_bloco)
+            else:
+                cifra.decrypt(visao[:processar], output=visao_saida[:processar])
+            if modo == "CBC" and fim:
+                if not processar:
+                    raise ValueError("Arquivo cifrado inválido: falta o último bloco.")
+                try:
+                    ultimo = unpad(visao_saida[max(0, processar - 16):processar], 16)
+                except ValueError:
+                    raise ValueError("Chave errada ou arquivo alterado (preenchimento inválido).") from None
+                saida.write(visao_saida[:max(0, processar - 16)])
+                saida.write(ultimo)
+                total += max(0, processar - 16) + len(ultimo)
+                break
+            saida.write(visao_saida[:processar])
+            total += processar
+            if fim:
+                break
+            visao[:reserva] = visao[processar:disponivel]
+            pendentes = reserva
+
+    if modo == "GCM":
+        try:
+            cifra.verify(bytes(visao[processar:disponivel]))
+        except ValueError:
+            raise ValueError("Falha na autenticação (GCM): chave errada ou arquivo alterado.") from None
+    return total
+
+# --- Medições e demonstrações ---
+
+@perf.medido("aes.vazao")
+def medir_vazao(modo, bits, tamanho=8 << 20, threads=1):
+    """
+    Vazão (MB/s) ao cifrar `tamanho` bytes na memória, escrevendo em um
+    buffer de saída já alocado. Devolve (MB/s, segundos).
+    """
+    chave = bytes(bits // 8)
+    dados = memoryview(bytearray(os.urandom(1 << 16)) * (tamanho >> 16))
+    destino = memoryview(bytearray(len(dados)))
+    nonce = bytes(TAMANHO_NONCE[modo])
+    inicio = time.perf_counter()
+    if modo == "CTR" and threads > 1:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            # Uma parte por thread, com tamanho múltiplo de 16
+            parte = (len(dados) // threads + 15) // 16 * 16
+            _ctr_paralelo(chave, nonce, 0, dados, destino, executor, parte)
+    else:
+        criar_cifra(chave, modo, nonce).encrypt(dados, output=destino)
+    segundos = time.perf_counter() - inicio
+    return len(dados) / (1 << 20) / max(segundos, 1e-9), segundos
+
+def cifrar_ecb(dados, chave):
+    """
+    Cifra no modo ECB (cada bloco de 16 bytes sozinho, sem IV). Usado só para
+    mostrar por que o ECB não deve ser usado: blocos iguais viram blocos
+    cifrados iguais. `dados` deve ter tamanho múltiplo de 16.
+    """
+    return AES.new(chave, AES.MODE_ECB).encrypt(dados)
+
+def cifrar_bytes(dados, chave, modo):
+    """
+    Cifra um bloco de bytes na memória (sem cabeçalho, preenchimento nem
+    etiqueta), no modo pedido ou em "ECB", com IV/nonce aleatório. Para as
+    demonstrações: `dados` deve ter tamanho múltiplo de 16.
+    """
+    if modo == "ECB":
+        return cifrar_ecb(dados, chave)
+    return criar_cifra(chave, modo, os.urandom(TAMANHO_NONCE[modo])).encrypt(dados)
@@ -0,0 +1,365 @@
+# educasec/api.py
+# API HTTP (JSON) das cifras, para outras ferramentas da sala de aula usarem
+# o EducaSec sem passar pela interface do Streamlit.
+#
+# É um aplicativo ASGI simples, sem framework. Para servir:
+#   pip install uvicorn
+#   uvicorn educasec.api:app --port 8000
+#
+# Exemplos:
+#   curl -X POST localhost:8000/cesar -d '{"texto": "Olá", "chave": 3}'
+#   curl -X POST localhost:8000/rsa/gerar -d '{"bits": 2048}'
+#   curl -X POST localhost:8000/lote -d '{"operacoes": [{"op": "hash", "params": {"texto": "abc"}}]}'
+#
+# As operações rápidas rodam direto no laço de eventos. As pesadas (gerar
+# chaves RSA, decifrar RSA, e Enigma e Vigenère com textos longos, que são
+# laços em Python puro) vão para um pool de processos, para não travar as
+# outras requisições enquanto o cálculo acontece. Cada requisição, inclusive
+# um lote, usa no máximo ORCAMENTO_LACO_MS de cálculo no laço: o que passar
+# disso também vai para o pool.
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+# Tamanho máximo do corpo de uma requisição (bytes)
+TAMANHO_MAXIMO_CORPO = 1 << 20
+
+# Quantidade máxima de operações em um único lote
+TAMANHO_MAXIMO_LOTE = 1000
+
+def processos_do_ambiente():
+    """
+    Processos do pool: EDUCASEC_API_PROCESSOS se for um número positivo,
+    senão um por núcleo.
+    """
+    try:
+        processos = int(os.environ.get("EDUCASEC_API_PROCESSOS", "0"))
+    except ValueError:
+        processos = 0
+    return processos if processos > 0 else os.cpu_count() or 1
+
+PROCESSOS = processos_do_ambiente()
+
+class ErroRequisicao(Exception):
+    """
+    Erro causado pela requisição (parâmetro ausente, valor inválido...).
+    Vira uma resposta 400 com a mensagem em JSON.
+    """
+
+def parametro(params, nome, tipo=str, padrao=None):
+    """
+    Lê um parâmetro do corpo JSON, conferindo o tipo.
+    """
+    if nome not in params:
+        if padrao is None:
+            raise ErroRequisicao(f"Parâmetro obrigatório ausente: '{nome}'")
+        return padrao
+    valor = params[nome]
+    if not isinstance(valor, tipo) or (tipo is int and isinstance(valor, bool)):
+        raise ErroRequisicao(f"Parâmetro '{nome}' deve ser do tipo {tipo.__name__}")
+    return valor
+
+# --- Operações ---
+# Funções de módulo (e não lambdas) para poderem ser enviadas ao pool de processos.
+
+def op_cesar(params):
+    from educasec.cesar import criptografar_cesar, decriptografar_cesar
+    operacao = decriptografar_cesar if parametro(params, "decifrar", bool, False) else criptografar_cesar
+    return {"resultado": operacao(parametro(params, "texto"), parametro(params, "chave", int))}
+
+def op_vigenere(params):
+    from educasec.vigenere import criptografar_vigenere, decriptografar_vigenere
+    operacao = decriptografar_vigenere if parametro(params, "decifrar", bool, False) else criptografar_vigenere
+    chave = parametro(params, "chave")
+    if not chave.strip():
+        raise ErroRequisicao("A chave não pode ser vazia")
+    resultado, _ = operacao(parametro(params, "texto"), chave)
+    return {"resultado": resultado}
+
+def op_enigma(params):
+    from educasec.enigma import ROTOR_WIRING, EnigmaMachine, limpar_texto, criptografar_enigma
+    rotores = parametro(params, "rotores", list, ["III", "II", "I"])
+    if len(rotores) != 3 or any(not isinstance(rotor, str) or rotor not in ROTOR_WIRING for rotor in rotores):
+        raise ErroRequisicao(f"'rotores' deve ter três rotores entre {', '.join(ROTOR_WIRING)}")
+    esquerda, meio, direita = rotores
+    posicoes = parametro(params, "posicoes", str, "AAA").upper()
+    if len(posicoes) != 3 or not all('A' <= letra <= 'Z' for letra in posicoes):
+        raise ErroRequisicao("'posicoes' deve ter três letras de A a Z")
+    maquina = EnigmaMachine(direita, meio, esquerda, posicoes[2], posicoes[1], posicoes[0])
+    return {"resultado": criptografar_enigma(maquina, limpar_texto(parametro(params, "texto")))}
+
+def op_hash(params):
+    from educasec.hash import ALGORITMOS, gerar_hash
+    algoritmo = parametro(params, "algoritmo", str, "sha256")
+    if algoritmo not in ALGORITMOS:
+        raise ErroRequisicao(f"'algoritmo' deve ser um de: {', '.join(ALGORITMOS)}")
+    return {"hash": gerar_hash(parametro(params, "texto"), algoritmo)}
+
+def op_rsa_gerar(params):
+    from educasec.rsa import generate_key_pair, key_to_pem
+    bits = parametro(params, "bits", int, 2048)
+    if bits not in (1024, 2048, 4096):
+        raise ErroRequisicao("'bits' deve ser 1024, 2048 ou 4096")
+    private_key, public_key, (e, n, d) = generate_key_pair(bits)
+    return {
+        "public_key_pem": key_to_pem(public_key, False),
+        "private_key_pem": key_to_pem(private_key, True),
+        "e": e,
+        "n": str(n),
+    }
+
+def op_rsa_cifrar(params):
+    from educasec.rsa import encrypt_message
+    try:
+        return {"resultado": encrypt_message(parametro(params, "public_key_pem"), parametro(params, "texto"))}
+    except ValueError as erro:
+        raise ErroRequisicao(str(erro))
+
+def op_rsa_decifrar(params):
+    from educasec.rsa import decrypt_message
+    try:
+        return {"resultado": decrypt_message(parametro(params, "private_key_pem"), parametro(params, "texto"))}
+    except (ValueError, TypeError):
+        raise ErroRequisicao("Chave privada inválida ou mensagem corrompida")
+
+def op_ecc_assinar(params):
+    from educasec.ecc import deserialize_private_key, sign_message, signature_algorithm
+    try:
+        private_key = deserialize_private_key(parametro(params, "private_key_pem"))
+        return {
+            "assinatura": sign_message(private_key, parametro(params, "mensagem")),
+            "algoritmo": signature_algorithm(private_key),
+        }
+    except (ValueError, TypeError) as erro:
+        raise ErroRequisicao(f"Chave privada inválida para assinatura ({erro})")
+
+def op_ecc_verificar(params):
+    from educasec.ecc import deserialize_public_key, verify_signature
+    try:
+        public_key = deserialize_public_key(parametro(params, "public_key_pem"))
+    except (ValueError, TypeError):
+        raise ErroRequisicao("Chave pública inválida")
+    return {"valida": verify_signature(public_key, parametro(params, "mensagem"), parametro(params, "assinatura"))}
+
+# Nome da operação -> (função, custo estimado no laço de eventos), com o custo
+# em (ms por operação, ms por KB de "texto"), medido em um núcleo comum.
+# None: sempre no pool de processos. Enigma e Vigenère são laços em Python
+# puro, com custo proporcional ao texto.
+OPERACOES = {
+    "cesar": (op_cesar, (0.01, 0.01)),
+    "vigenere": (op_vigenere, (0.01, 0.3)),
+    "enigma": (op_enigma, (0.01, 3.0)),
+    "hash": (op_hash, (0.01, 0.01)),
+    "rsa/gerar": (op_rsa_gerar, None),
+    "rsa/cifrar": (op_rsa_cifrar, (1.0, 0.0)),
+    "rsa/decifrar": (op_rsa_decifrar, None),
+    "ecc/assinar": (op_ecc_assinar, (0.2, 0.0)),
+    "ecc/verificar": (op_ecc_verificar, (0.2, 0.0)),
+}
+
+# Tempo máximo de cálculo (ms) que uma requisição pode ocupar o laço de
+# eventos; um Enigma de 1 KB ou um Vigenère de 16 KB cabem nele.
+ORCAMENTO_LACO_MS = 5.0
+
+def custo_estimado(nome, params):
+    """
+    Custo estimado (ms) da operação no laço de eventos, pelo tipo e pelo
+    tamanho do texto, ou None se ela deve sempre ir para o pool.
+    """
+    custo = OPERACOES[nome][1]
+    if custo is None:
+        return None
+    por_operacao, por_kb = custo
+    texto = params.get("texto") if isinstance(params, dict) else None
+    return por_operacao + (por_kb * len(texto) / 1024 if isinstance(texto, str) else 0)
+
+def vai_para_o_pool(nome, params, gasto=0.0):
+    """
+    Se a operação deve rodar no pool de processos: sempre as pesadas, e as
+    outras quando o custo dela somado ao `gasto` (o que a requisição já
+    calculou no laço) passaria do orçamento.
+    """
+    custo = custo_estimado(nome, params)
+    return custo is None or gasto + custo > ORCAMENTO_LACO_MS
+
+def executar(nome, params):
+    """
+    Executa uma operação e devolve (status HTTP, corpo da resposta). Nunca
+    levanta exceção: um erro em uma operação não derruba as outras do lote.
+    """
+    if not isinstance(params, dict):
+        return 400, {"erro": "O corpo deve ser um objeto JSON"}
+    try:
+        return 200, OPERACOES[nome][0](params)
+    except ErroRequisicao as erro:
+        return 400, {"erro": str(erro)}
+    except ImportError as erro:
+        return 503, {"erro": f"Dependência não instalada no servidor: {erro.name}"}
+    except (TypeError, ValueError, KeyError, AttributeError, IndexError) as erro:
+        # JSON bem formado, mas com valores que a operação não aceita
+        return 400, {"erro": f"Parâmetros inválidos: {type(erro).__name__}: {erro}"}
+    except Exception as erro:
+        return 500, {"erro": f"Erro interno: {type(erro).__name__}"}
+
+def executar_varias(itens):
+    """
+    Executa uma lista de (nome, params) no mesmo processo. É o que cada
+    processo do pool recebe em um lote, para pagar o custo de enviar os
+    dados entre processos uma vez só.
+    """
+    return [executar(nome, params) for nome, params in itens]
+
+# --- Pool de processos ---
+
+_pool = None
+
+def pool_processos():
+    """
+    Pool de processos compartilhado, criado na primeira operação pesada.
+    """
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PROCESSOS, mp_context=multiprocessing.get_context("spawn"))
+    return _pool
+
+def encerrar_pool():
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+async def executar_operacao(nome, params):
+    """
+    Executa uma operação: as leves no laço de eventos, as pesadas no pool.
+    """
+    if vai_para_o_pool(nome, params):
+        try:
+            return await asyncio.get_running_loop().run_in_executor(pool_processos(), executar, nome, params)
+        except Exception as erro:
+            # Falha do próprio pool (processo encerrado, dados que não passam entre processos)
+            return 500, {"erro": f"Erro interno: {type(erro).__name__}"}
+    return executar(nome, params)
+
+async def executar_lote(corpo):
+    """
+    Executa várias operações de uma vez. As leves rodam aqui mesmo enquanto
+    a soma dos custos cabe em ORCAMENTO_LACO_MS (muitas operações leves
+    também travariam o laço); as demais são divididas em fatias, uma por
+    processo do pool.
+    """
+    operacoes = corpo.get("operacoes") if isinstance(corpo, dict) else None
+    if not isinstance(operacoes, list):
+        return 400, {"erro": "Envie {\"operacoes\": [{\"op\": ..., \"params\": {...}}, ...]}"}
+    if len(operacoes) > TAMANHO_MAXIMO_LOTE:
+        return 413, {"erro": f"Máximo de {TAMANHO_MAXIMO_LOTE} operações por lote"}
+
+    resultados = [None] * len(operacoes)
+    pesadas = []
+    gasto = 0.0
+    for i, item in enumerate(operacoes):
+        nome = item.get("op") if isinstance(item, dict) else None
+        if nome not in OPERACOES:
+            resultados[i] = (404, {"erro": f"Operação desconhecida: {nome!r}"})
+            continue
+        params = item.get("params", {})
+        if vai_para_o_pool(nome, params, gasto):
+            pesadas.append((i, nome, params))
+        else:
+            gasto += custo_estimado(nome, params)
+            resultados[i] = executar(nome, params)
+
+    if pesadas:
+        loop = asyncio.get_running_loop()
+        fatias = [pesadas[k::PROCESSOS] for k in range(min(PROCESSOS, len(pesadas)))]
+        respostas = await asyncio.gather(*(
+            loop.run_in_executor(pool_processos(), executar_varias, [(nome, params) for _, nome, params in fatia])
+            for fatia in fatias
+        ), return_exceptions=True)
+        for fatia, resposta in zip(fatias, respostas):
+            if isinstance(resposta, BaseException):
+                # Só as operações desta fatia falham; as outras seguem normais
+                resposta = [(500, {"erro": f"Erro interno: {type(resposta).__name__}"})] * len(fatia)
+            for (i, _, _), resultado in zip(fatia, resposta):
+                resultados[i] = resultado
+
+    return 200, {"resultados": [{"status": status, **corpo} for status, corpo in resultados]}
+
+# --- ASGI ---
+
+async def ler_corpo(receive):
+    """
+    Lê o corpo da requisição (que pode chegar em várias partes). Retorna
+    None se o cliente desconectar antes do fim.
+    """
+    partes = []
+    tamanho = 0
+    while True:
+        mensagem = await receive()
+        if mensagem["type"] == "http.disconnect":
+            return None
+        parte = mensagem.get("body", b"")
+        tamanho += len(parte)
+        if tamanho > TAMANHO_MAXIMO_CORPO:
+            raise ErroRequisicao(f"Corpo maior que {TAMANHO_MAXIMO_CORPO} bytes")
+        partes.append(parte)
+        if not mensagem.get("more_body", False):
+            return b"".join(partes)
+
+async def responder(send, status, corpo):
+    dados = json.dumps(corpo, ensure_ascii=False).encode("utf-8")
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json; charset=utf-8"),
+            (b"content-length", str(len(dados)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": dados})
+
+async def lifespan(receive, send):
+    while True:
+        mensagem = await receive()
+        if mensagem["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif mensagem["type"] == "lifespan.shutdown":
+            encerrar_pool()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+async def app(scope, receive, send):
+    """
+    Aplicativo ASGI: GET / lista as operações; POST /<operação> executa uma
+    operação; POST /lote executa várias.
+    """
+    if scope["type"] == "lifespan":
+        return await lifespan(receive, send)
+    if scope["type"] != "http":
+        return
+
+    caminho = scope["path"].strip("/")
+    if scope["method"] == "GET" and caminho in ("", "saude"):
+        return await responder(send, 200, {"operacoes": sorted(OPERACOES) + ["lote"]})
+    if caminho != "lote" and caminho not in OPERACOES:
+        return await responder(send, 404, {"erro": f"Operação desconhecida: /{caminho}"})
+    if scope["method"] != "POST":
+        return await responder(send, 405, {"erro": "Use POST com um corpo JSON"})
+
+    try:
+        corpo = await ler_corpo(receive)
+    except ErroRequisicao as erro:
+        return await responder(send, 413, {"erro": str(erro)})
+    if corpo is None:
+        return
+    try:
+        params = json.loads(corpo or b"{}")
+    except ValueError:
+        return await responder(send, 400, {"erro": "JSON inválido"})
+
+    if caminho == "lote":
+        status, resposta = await executar_lote(params)
+    else:
+        status, resposta = await executar_operacao(caminho, params)
+    await responder(send, status, resposta)
@@ -0,0 +1,30 @@
+# educasec/cesar.py
+# Cifra de César: cada letra é deslocada um número fixo de posições no alfabeto.
+from functools import lru_cache
+
+MINUSCULAS = "abcdefghijklmnopqrstuvwxyz"
+MAIUSCULAS = MINUSCULAS.upper()
+
+@lru_cache(maxsize=64)
+def tabela_cesar(chave):
+    """
+    Tabela de tradução (str.translate) que desloca as letras de A-Z e a-z.
+    Os demais caracteres ficam como estão.
+    """
+    chave %= 26
+    return str.maketrans(
+        MINUSCULAS + MAIUSCULAS,
+        MINUSCULAS[chave:] + MINUSCULAS[:chave] + MAIUSCULAS[chave:] + MAIUSCULAS[:chave]
+    )
+
+def criptografar_cesar(texto, chave):
+    """
+    Criptografa o texto deslocando cada letra `chave` posições.
+    """
+    return texto.translate(tabela_cesar(chave))
+
+def decriptografar_cesar(texto, chave):
+    """
+    Desfaz a cifra de César (deslocamento no sentido contrário).
+    """
+    return texto.translate(tabela_cesar(-chave))
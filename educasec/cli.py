@@ -0,0 +1,325 @@
+# educasec/cli.py
+# Linha de comando do EducaSec: aplica as cifras sem navegador e sem Streamlit.
+#
+# O texto é lido da entrada padrão em blocos e cada bloco é escrito na saída
+# assim que fica pronto, então arquivos grandes não precisam caber na memória:
+#   python -m educasec cesar --chave 3 < livro.txt > livro.cesar.txt
+#   python -m educasec vigenere --chave LIMAO --decifrar < secreto.txt
+#   python -m educasec enigma --rotores III II I --posicoes AAA < mensagem.txt
+#   python -m educasec hash --algoritmo sha256 < imagem.iso
+#   python -m educasec xor --chave-arquivo chave.bin < foto.jpg > foto.xor
+#   python -m educasec aes cifrar --modo GCM --chave 00112233...eeff < prova.pdf > prova.aes
+#   python -m educasec rsa gerar --bits 2048 --privada chave.pem --publica chave.pub.pem
+#   python -m educasec rsa cifrar --chave chave.pub.pem < linhas.txt
+#   python -m educasec ecc assinar --chave ecc.pem < contrato.txt
+#   python -m educasec frequencia --top 10 < livro.txt
+#   python -m educasec quadgramas construir --saida pt.npy < corpus.txt
+#   python -m educasec quadgramas pontuar --idioma pt < candidato.txt
+import argparse
+import shutil
+import sys
+import tempfile
+
+from educasec.hash import ALGORITMOS
+
+# Tamanho padrão dos blocos lidos da entrada (em caracteres)
+TAMANHO_BLOCO = 64 * 1024
+
+def processar_fluxo(entrada, saida, transformar, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê a entrada em blocos, aplica `transformar` em cada um e escreve o
+    resultado imediatamente. Retorna a quantidade de caracteres lidos.
+    """
+    total = 0
+    for bloco in iter(lambda: entrada.read(tamanho_bloco), ""):
+        saida.write(transformar(bloco))
+        total += len(bloco)
+    saida.flush()
+    return total
+
+def ler_arquivo(caminho):
+    """
+    Lê um arquivo de texto (chaves PEM, por exemplo).
+    """
+    with open(caminho, encoding="utf-8") as f:
+        return f.read()
+
+def escrever_arquivo(caminho, conteudo):
+    """
+    Grava um arquivo de texto, ou escreve na saída padrão se o caminho for "-".
+    """
+    if caminho == "-":
+        sys.stdout.write(conteudo)
+        return
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(conteudo)
+
+# --- Comandos ---
+
+def comando_cesar(args, entrada, saida):
+    from educasec.cesar import criptografar_cesar, decriptografar_cesar
+    operacao = decriptografar_cesar if args.decifrar else criptografar_cesar
+    processar_fluxo(entrada, saida, lambda bloco: operacao(bloco, args.chave), args.bloco)
+    return 0
+
+def comando_vigenere(args, entrada, saida):
+    from educasec.vigenere import criptografar_vigenere, decriptografar_vigenere
+    operacao = decriptografar_vigenere if args.decifrar else criptografar_vigenere
+    posicao = 0
+
+    # A posição da chave continua de um bloco para o outro
+    def transformar(bloco):
+        nonlocal posicao
+        resultado, posicao = operacao(bloco, args.chave, posicao)
+        return resultado
+
+    processar_fluxo(entrada, saida, transformar, args.bloco)
+    return 0
+
+def comando_enigma(args, entrada, saida):
+    from educasec.enigma import ROTOR_WIRING, EnigmaMachine, limpar_texto, criptografar_enigma
+    posicoes = args.posicoes.upper()
+    if len(posicoes) != 3 or not all('A' <= letra <= 'Z' for letra in posicoes):
+        print("Erro: --posicoes deve ter exatamente três letras de A a Z (ex.: AAA).", file=sys.stderr)
+        return 2
+    invalidos = [rotor for rotor in args.rotores if rotor not in ROTOR_WIRING]
+    if invalidos:
+        print(f"Erro: rotor inválido {invalidos[0]} (use {', '.join(ROTOR_WIRING)}).", file=sys.stderr)
+        return 2
+
+    # Rotores e posições são informados da esquerda para a direita, como na página
+    esquerda, meio, direita = args.rotores
+    maquina = EnigmaMachine(direita, meio, esquerda, posicoes[2], posicoes[1], posicoes[0])
+    processar_fluxo(entrada, saida, lambda bloco: criptografar_enigma(maquina, limpar_texto(bloco)), args.bloco)
+    return 0
+
+def comando_hash(args, entrada, saida):
+    from educasec.hash import gerar_hash_fluxo
+    saida.write(gerar_hash_fluxo(entrada.buffer, args.algoritmo) + "\n")
+    return 0
+
+def comando_xor(args, entrada, saida):
+    from educasec.xor import xor_fluxo
+    if args.chave_arquivo:
+        with open(args.chave_arquivo, "rb") as chave:
+            xor_fluxo(entrada.buffer, chave, saida.buffer, args.bloco)
+    else:
+        xor_fluxo(entrada.buffer, args.chave.encode("utf-8"), saida.buffer, args.bloco)
+    saida.buffer.flush()
+    return 0
+
+def comando_aes(args, entrada, saida):
+    from educasec.aes import cifrar_fluxo, decifrar_fluxo
+    try:
+        chave = bytes.fromhex(args.chave)
+    except ValueError:
+        print("Erro: --chave deve estar em hexadecimal.", file=sys.stderr)
+        return 2
+    # Blocos de AES precisam ter tamanho múltiplo de 16
+    tamanho_bloco = max(16, args.bloco // 16 * 16)
+    if args.operacao == "cifrar":
+        cifrar_fluxo(entrada.buffer, saida.buffer, chave, args.modo, tamanho_bloco, args.threads)
+        saida.buffer.flush()
+        return 0
+
+    # O texto decifrado só é liberado depois de conferido (etiqueta do GCM,
+    # preenchimento do CBC): até lá ele fica em um arquivo temporário, que é
+    # apagado se a decifragem falhar. Nada de texto não autenticado na saída.
+    with tempfile.TemporaryFile() as temporario:
+        decifrar_fluxo(entrada.buffer, temporario, chave, args.modo, tamanho_bloco, args.threads)
+        temporario.seek(0)
+        shutil.copyfileobj(temporario, saida.buffer, tamanho_bloco)
+    saida.buffer.flush()
+    return 0
+
+def comando_rsa(args, entrada, saida):
+    from educasec.rsa import (
+        generate_key_pair, key_to_pem, oaep_cipher, max_message_size
+    )
+    import base64
+    import binascii
+
+    if args.operacao == "gerar":
+        private_key, public_key, _ = generate_key_pair(args.bits)
+        escrever_arquivo(args.privada, key_to_pem(private_key, True) + "\n")
+        escrever_arquivo(args.publica, key_to_pem(public_key, False) + "\n")
+        return 0
+
+    # O RSA só cifra mensagens curtas: cada linha da entrada vira uma mensagem
+    key, cipher = oaep_cipher(ler_arquivo(args.chave))
+    for numero, linha in enumerate(entrada, start=1):
+        linha = linha.rstrip("\r\n")
+        try:
+            if args.operacao == "cifrar":
+                mensagem = linha.encode("utf-8")
+                if len(mensagem) > max_message_size(key):
+                    raise ValueError(f"linha muito longa (máximo {max_message_size(key)} bytes)")
+                resultado = base64.b64encode(cipher.encrypt(mensagem)).decode("utf-8")
+            else:
+                resultado = cipher.decrypt(base64.b64decode(linha)).decode("utf-8")
+        except (ValueError, TypeError, binascii.Error) as erro:
+            print(f"Erro na linha {numero}: {erro}", file=sys.stderr)
+            return 1
+        saida.write(resultado + "\n")
+    saida.flush()
+    return 0
+
+def comando_ecc(args, entrada, saida):
+    from educasec.ecc import (
+        CURVES, build_pooled_keypair, deserialize_private_key, deserialize_public_key,
+        sign_message, verify_signature
+    )
+
+    if args.operacao == "gerar":
+        if args.curva not in CURVES:
+            print(f"Erro: curva inválida (use {', '.join(CURVES)}).", file=sys.stderr)
+            return 2
+        keypair = build_pooled_keypair(args.curva)
+        escrever_arquivo(args.privada, keypair.private_pem)
+        escrever_arquivo(args.publica, keypair.public_pem)
+        return 0
+
+    # A assinatura cobre a mensagem inteira, então aqui a entrada é lida de uma vez
+    mensagem = entrada.read()
+    try:
+        if args.operacao == "assinar":
+            saida.write(sign_message(deserialize_private_key(ler_arquivo(args.chave)), mensagem) + "\n")
+            return 0
+        valida = verify_signature(deserialize_public_key(ler_arquivo(args.chave)), mensagem, args.assinatura)
+    except (ValueError, TypeError) as erro:
+        print(f"Erro: chave inválida para esta operação ({erro})", file=sys.stderr)
+        return 2
+    saida.write("✅ Assinatura válida\n" if valida else "❌ Assinatura inválida\n")
+    return 0 if valida else 1
+
+def comando_frequencia(args, entrada, saida):
+    from educasec.frequencia import ALFABETO, Histogramas, analisar_fluxo
+
+    histogramas = Histogramas()
+    for histogramas in analisar_fluxo(entrada.buffer, args.bloco):
+        pass
+    total = histogramas.total
+    saida.write(f"Letras: {total}  Índice de coincidência: {histogramas.indice_coincidencia():.4f}\n")
+    for letra, frequencia in zip(ALFABETO, histogramas.frequencias()):
+        saida.write(f"{letra} {100 * frequencia:6.2f}%\n")
+    for tamanho, nome in ((2, "Bigramas"), (3, "Trigramas")):
+        comuns = histogramas.mais_comuns(tamanho, args.top)
+        saida.write(f"{nome}: " + " ".join(f"{ngrama}={contagem}" for ngrama, contagem in comuns) + "\n")
+    return 0
+
+def comando_quadgramas(args, entrada, saida):
+    from educasec.quadgram import construir_tabela, salvar_tabela, pontuador
+
+    if args.operacao == "construir":
+        salvar_tabela(construir_tabela(entrada.read()), args.saida)
+        return 0
+    try:
+        pontuacao = pontuador(args.idioma, args.tabela)
+    except (OSError, ValueError) as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 2
+    texto = entrada.read()
+    saida.write(f"{pontuacao.pontuar(texto):.2f} (média {pontuacao.media(texto):.3f} por quadgrama)\n")
+    return 0
+
+# --- Argumentos ---
+
+def criar_parser():
+    parser = argparse.ArgumentParser(
+        prog="educasec",
+        description="Aplica as cifras do EducaSec na entrada padrão e escreve o resultado na saída padrão."
+    )
+    parser.add_argument("--bloco", type=int, default=TAMANHO_BLOCO,
+                        help="Tamanho dos blocos lidos da entrada (caracteres)")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    cesar = comandos.add_parser("cesar", help="Cifra de César")
+    cesar.add_argument("--chave", type=int, required=True, help="Deslocamento (1 a 25)")
+    cesar.add_argument("--decifrar", action="store_true")
+    cesar.set_defaults(executar=comando_cesar)
+
+    vigenere = comandos.add_parser("vigenere", help="Cifra de Vigenère")
+    vigenere.add_argument("--chave", required=True, help="Palavra-chave")
+    vigenere.add_argument("--decifrar", action="store_true")
+    vigenere.set_defaults(executar=comando_vigenere)
+
+    enigma = comandos.add_parser("enigma", help="Máquina Enigma (cifrar e decifrar são a mesma operação)")
+    enigma.add_argument("--rotores", nargs=3, default=["III", "II", "I"], metavar=("ESQ", "MEIO", "DIR"))
+    enigma.add_argument("--posicoes", default="AAA", help="Posição inicial de cada rotor, da esquerda para a direita")
+    enigma.set_defaults(executar=comando_enigma)
+
+    hash_parser = comandos.add_parser("hash", help="Hash da entrada (lida em blocos binários)")
+    hash_parser.add_argument("--algoritmo", default="sha256", choices=ALGORITMOS)
+    hash_parser.set_defaults(executar=comando_hash)
+
+    xor = comandos.add_parser("xor", help="XOR com uma chave (cifrar e decifrar são a mesma operação)")
+    chave_xor = xor.add_mutually_exclusive_group(required=True)
+    chave_xor.add_argument("--chave-arquivo", help="Arquivo de chave (one-time pad, pelo menos do tamanho da entrada)")
+    chave_xor.add_argument("--chave", help="Texto repetido ao longo da entrada (inseguro, só para demonstração)")
+    xor.set_defaults(executar=comando_xor)
+
+    aes = comandos.add_parser("aes", help="AES nos modos CBC, CTR ou GCM (entrada lida em blocos binários)")
+    aes.add_argument("operacao", choices=("cifrar", "decifrar"))
+    aes.add_argument("--chave", required=True, help="Chave em hexadecimal (16, 24 ou 32 bytes)")
+    aes.add_argument("--modo", default="GCM", choices=("CBC", "CTR", "GCM"),
+                     help="Só o GCM detecta chave errada ou arquivo alterado")
+    aes.add_argument("--threads", type=int, default=1, help="Threads para o modo CTR")
+    aes.set_defaults(executar=comando_aes)
+
+    rsa = comandos.add_parser("rsa", help="RSA com OAEP (uma mensagem por linha)")
+    rsa.add_argument("operacao", choices=("gerar", "cifrar", "decifrar"))
+    rsa.add_argument("--bits", type=int, default=2048, choices=(1024, 2048, 4096))
+    rsa.add_argument("--chave", help="Chave PEM (pública para cifrar, privada para decifrar)")
+    rsa.add_argument("--privada", default="-", help="Arquivo da chave privada gerada")
+    rsa.add_argument("--publica", default="-", help="Arquivo da chave pública gerada")
+    rsa.set_defaults(executar=comando_rsa)
+
+    ecc = comandos.add_parser("ecc", help="Assinaturas com curvas elípticas")
+    ecc.add_argument("operacao", choices=("gerar", "assinar", "verificar"))
+    ecc.add_argument("--curva", default="SECP256R1")
+    ecc.add_argument("--chave", help="Chave PEM (privada para assinar, pública para verificar)")
+    ecc.add_argument("--assinatura", help="Assinatura em hexadecimal (para verificar)")
+    ecc.add_argument("--privada", default="-", help="Arquivo da chave privada gerada")
+    ecc.add_argument("--publica", default="-", help="Arquivo da chave pública gerada")
+    ecc.set_defaults(executar=comando_ecc)
+
+    frequencia = comandos.add_parser("frequencia", help="Frequência de letras, bigramas e trigramas (entrada lida em blocos)")
+    frequencia.add_argument("--top", type=int, default=10, help="Quantos bigramas e trigramas mostrar")
+    frequencia.set_defaults(executar=comando_frequencia)
+
+    quadgramas = comandos.add_parser("quadgramas", help="Tabela de quadgramas: construir a partir de um corpus ou pontuar um texto")
+    quadgramas.add_argument("operacao", choices=("construir", "pontuar"))
+    quadgramas.add_argument("--idioma", default="pt", help="Idioma do corpus de partida (pt ou en)")
+    quadgramas.add_argument("--tabela", help="Tabela .npy gerada com 'construir' (em vez do corpus de partida)")
+    quadgramas.add_argument("--saida", help="Arquivo .npy da tabela construída")
+    quadgramas.set_defaults(executar=comando_quadgramas)
+
+    return parser
+
+def main(argv=None):
+    parser = criar_parser()
+    args = parser.parse_args(argv)
+    if args.comando in ("rsa", "ecc") and args.operacao != "gerar" and not args.chave:
+        parser.error("--chave é obrigatória para esta operação")
+    if args.comando == "ecc" and args.operacao == "verificar" and not args.assinatura:
+        parser.error("--assinatura é obrigatória para verificar")
+    if args.comando == "quadgramas" and args.operacao == "construir" and not args.saida:
+        parser.error("--saida é obrigatória para construir")
+    if args.comando == "xor" and args.chave is not None and not args.chave:
+        parser.error("--chave não pode ser vazia")
+    if args.comando == "vigenere" and not args.chave.strip():
+        parser.error("--chave não pode ser vazia")
+
+    # UTF-8 e quebras de linha preservadas, em qualquer sistema operacional
+    sys.stdin.reconfigure(encoding="utf-8", errors="replace", newline="")
+    sys.stdout.reconfigure(encoding="utf-8", newline="")
+    try:
+        return args.executar(args, sys.stdin, sys.stdout)
+    except ImportError as erro:
+        print(f"Erro: dependência não instalada ({erro.name}). Veja requirements.txt.", file=sys.stderr)
+        return 2
+    except BrokenPipeError:
+        return 0
+    except ValueError as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 1
@@ -0,0 +1,338 @@
+# educasec/ecc.py
+# Criptografia de curvas elípticas com a biblioteca cryptography: curvas NIST
+# (ECDSA e ECDH), Ed25519 (assinaturas) e X25519 (troca de chaves).
+# Requer: pip install cryptography
+import hashlib
+import threading
+import time
+from collections import deque, namedtuple
+
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, x25519
+from cryptography.hazmat.primitives.asymmetric.utils import Prehashed
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.backends import default_backend
+from cryptography.exceptions import InvalidSignature
+
+from educasec import perf
+
+# --- Funções Auxiliares ---
+
+# Curvas disponíveis (nome -> função que gera a chave privada)
+CURVES = {
+    "SECP256R1": lambda: ec.generate_private_key(ec.SECP256R1(), default_backend()),
+    "SECP384R1": lambda: ec.generate_private_key(ec.SECP384R1(), default_backend()),
+    "SECP521R1": lambda: ec.generate_private_key(ec.SECP521R1(), default_backend()),
+    "Ed25519": ed25519.Ed25519PrivateKey.generate,
+    "X25519": x25519.X25519PrivateKey.generate
+}
+
+# Curvas que servem para assinatura e curvas que servem para troca de chaves (ECDH)
+SIGNING_CURVES = ["SECP256R1", "SECP384R1", "SECP521R1", "Ed25519"]
+ECDH_CURVES = ["SECP256R1", "SECP384R1", "SECP521R1", "X25519"]
+
+# Quantidade de pares de chaves mantidos prontos para cada curva
+KEY_POOL_DEPTH = 16
+
+def generate_ecc_keypair(curve_name="SECP256R1"):
+    """
+    Gera um par de chaves ECC (pública e privada).
+    """
+    generate_private_key = CURVES.get(curve_name, CURVES["SECP256R1"])
+    
+    # Gera a chave privada
+    private_key = generate_private_key()
+    
+    # Obtém a chave pública
+    public_key = private_key.public_key()
+    
+    return private_key, public_key
+
+# Par de chaves já serializado, pronto para ser entregue ao usuário
+PooledKeyPair = namedtuple(
+    "PooledKeyPair",
+    ["curve_name", "private_key", "public_key", "private_pem", "public_pem"]
+)
+
+def build_pooled_keypair(curve_name):
+    """
+    Gera um par de chaves e já faz a serialização PEM das duas chaves.
+    """
+    private_key, public_key = generate_ecc_keypair(curve_name)
+    return PooledKeyPair(
+        curve_name,
+        private_key,
+        public_key,
+        serialize_private_key(private_key),
+        serialize_public_key(public_key)
+    )
+
+class ECCKeyPool:
+    """
+    Mantém um estoque de pares de chaves por curva, reabastecido por uma
+    thread em segundo plano. Assim, o clique em "Gerar Par de Chaves" apenas
+    retira um par pronto em vez de gerar e serializar na hora.
+    """
+    def __init__(self, curve_names, depth=KEY_POOL_DEPTH):
+        self.depth = depth
+        self._pools = {name: deque() for name in curve_names}
+        self._cond = threading.Condition()
+        self._worker = None
+        self.served_from_pool = 0
+        self.served_inline = 0
+
+    def start(self):
+        """
+        Inicia a thread de reabastecimento (apenas uma vez por processo).
+        """
+        with self._cond:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._refill_forever,
+                    name="ecc-key-pool",
+                    daemon=True
+                )
+                self._worker.start()
+
+    def _next_curve_to_refill(self):
+        """
+        Retorna a curva com o estoque mais baixo, ou None se todas estão cheias.
+        """
+        name = min(self._pools, key=lambda n: len(self._pools[n]))
+        return name if len(self._pools[name]) < self.depth else None
+
+    def _refill_forever(self):
+        while True:
+            with self._cond:
+                curve_name = self._next_curve_to_refill()
+                while curve_name is None:
+                    self._cond.wait()
+                    curve_name = self._next_curve_to_refill()
+            # A geração acontece fora do lock para não bloquear quem retira chaves
+            entry = build_pooled_keypair(curve_name)
+            with self._cond:
+                self._pools[curve_name].append(entry)
+
+    def take(self, curve_name="SECP256R1"):
+        """
+        Retira um par de chaves pronto. Se o estoque da curva estiver vazio,
+        gera um par na hora.
+        """
+        if curve_name not in self._pools:
+            curve_name = "SECP256R1"
+        self.start()
+        with self._cond:
+            pool = self._pools[curve_name]
+            entry = pool.popleft() if pool else None
+            if entry is None:
+                self.served_inline += 1
+            else:
+                self.served_from_pool += 1
+            self._cond.notify()
+        if entry is None:
+            entry = build_pooled_keypair(curve_name)
+        return entry
+
+    def depths(self):
+        """
+        Retorna a quantidade de pares prontos em cada curva.
+        """
+        with self._cond:
+            return {name: len(pool) for name, pool in self._pools.items()}
+
+# Estoque compartilhado por todas as sessões deste processo
+KEY_POOL = ECCKeyPool(CURVES)
+
+def serialize_private_key(private_key):
+    """
+    Serializa a chave privada para formato PEM.
+    """
+    pem = private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption()
+    )
+    return pem.decode('utf-8')
+
+def serialize_public_key(public_key):
+    """
+    Serializa a chave pública para formato PEM.
+    """
+    pem = public_key.public_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return pem.decode('utf-8')
+
+def public_key_fingerprint(public_key):
+    """
+    Impressão digital da chave pública: SHA-256 da chave em formato DER,
+    em hexadecimal. Identifica quem assinou sem guardar a chave inteira.
+    """
+    der = public_key.public_bytes(
+        encoding=serialization.Encoding.DER,
+        format=serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    return hashlib.sha256(der).hexdigest()
+
+def deserialize_private_key(pem_string):
+    """
+    Deserializa uma chave privada do formato PEM.
+    """
+    return serialization.load_pem_private_key(
+        pem_string.encode('utf-8'),
+        password=None,
+        backend=default_backend()
+    )
+
+def deserialize_public_key(pem_string):
+    """
+    Deserializa uma chave pública do formato PEM.
+    """
+    return serialization.load_pem_public_key(
+        pem_string.encode('utf-8'),
+        backend=default_backend()
+    )
+
+def key_curve_name(key):
+    """
+    Retorna o nome da curva de uma chave (privada ou pública).
+    """
+    if isinstance(key, (ed25519.Ed25519PrivateKey, ed25519.Ed25519PublicKey)):
+        return "Ed25519"
+    if isinstance(key, (x25519.X25519PrivateKey, x25519.X25519PublicKey)):
+        return "X25519"
+    return key.curve.name.upper()
+
+def signature_algorithm_for_curve(curve_name):
+    """
+    Retorna o nome do algoritmo de assinatura usado com a curva.
+    """
+    if curve_name == "Ed25519":
+        return "Ed25519"
+    if curve_name == "X25519":
+        return "X25519 (somente ECDH)"
+    return "ECDSA-SHA256"
+
+def signature_algorithm(key):
+    """
+    Retorna o nome do algoritmo de assinatura usado com a chave.
+    """
+    return signature_algorithm_for_curve(key_curve_name(key))
+
+@perf.medido("ecc.assinar")
+def sign_message(private_key, message):
+    """
+    Assina uma mensagem usando a chave privada ECC (ECDSA ou Ed25519).
+    """
+    if isinstance(private_key, x25519.X25519PrivateKey):
+        raise ValueError("Chaves X25519 servem para troca de chaves (ECDH), não para assinaturas. Use Ed25519 ou uma curva NIST.")
+    
+    if isinstance(private_key, ed25519.Ed25519PrivateKey):
+        # Ed25519 já define o hash internamente (SHA-512) e é determinístico
+        signature = private_key.sign(message.encode('utf-8'))
+    else:
+        signature = private_key.sign(
+            message.encode('utf-8'),
+            ec.ECDSA(hashes.SHA256())
+        )
+    return signature.hex()
+
+@perf.medido("ecc.verificar")
+def verify_signature(public_key, message, signature_hex):
+    """
+    Verifica a assinatura de uma mensagem usando a chave pública ECC.
+    """
+    try:
+        signature = bytes.fromhex(signature_hex)
+        if isinstance(public_key, ed25519.Ed25519PublicKey):
+            public_key.verify(signature, message.encode('utf-8'))
+        else:
+            public_key.verify(
+                signature,
+                message.encode('utf-8'),
+                ec.ECDSA(hashes.SHA256())
+            )
+        return True
+    except InvalidSignature:
+        return False
+    except Exception:
+        return False
+
+def verify_signature_digest(public_key, digest_hex, signature_hex):
+    """
+    Verifica uma assinatura ECDSA-SHA256 a partir só do hash SHA-256 da
+    mensagem (em hexadecimal), sem a mensagem. O Ed25519 assina a mensagem
+    inteira e não pode ser verificado assim: ValueError nesse caso.
+    """
+    if not isinstance(public_key, ec.EllipticCurvePublicKey):
+        raise ValueError("Assinaturas Ed25519 só podem ser verificadas com o documento inteiro.")
+    try:
+        public_key.verify(
+            bytes.fromhex(signature_hex),
+            bytes.fromhex(digest_hex),
+            ec.ECDSA(Prehashed(hashes.SHA256()))
+        )
+        return True
+    except InvalidSignature:
+        return False
+    except Exception:
+        return False
+
+def derive_shared_secret(private_key, peer_public_key):
+    """
+    Calcula o segredo compartilhado (ECDH) entre a chave privada e a chave
+    pública da outra parte.
+    """
+    if isinstance(private_key, x25519.X25519PrivateKey):
+        shared = private_key.exchange(peer_public_key)
+    elif isinstance(private_key, ec.EllipticCurvePrivateKey):
+        shared = private_key.exchange(ec.ECDH(), peer_public_key)
+    else:
+        raise ValueError("Chaves Ed25519 servem para assinaturas, não para troca de chaves. Use X25519 ou uma curva NIST.")
+    return shared.hex()
+
+def hash_message(message):
+    """
+    Gera o hash SHA-256 de uma mensagem.
+    """
+    return hashlib.sha256(message.encode('utf-8')).hexdigest()
+
+def _ops_per_second(operation, min_time=0.1):
+    """
+    Executa a operação repetidamente por pelo menos `min_time` segundos e
+    retorna quantas operações por segundo foram feitas.
+    """
+    count = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        operation()
+        count += 1
+        elapsed = time.perf_counter() - start
+    return count / elapsed
+
+def benchmark_curves():
+    """
+    Mede (em operações por segundo) a geração de chaves, assinatura,
+    verificação e troca de chaves em cada curva.
+    """
+    message = "Mensagem de teste para medir o desempenho das curvas."
+    # Versões sem instrumentação, para não encher o buffer de medições (perf)
+    sign = sign_message.__wrapped__
+    verify = verify_signature.__wrapped__
+    results = {}
+    for curve_name in CURVES:
+        private_key, public_key = generate_ecc_keypair(curve_name)
+        row = {"Gerar chaves": _ops_per_second(lambda: generate_ecc_keypair(curve_name))}
+        
+        if curve_name in SIGNING_CURVES:
+            signature = sign(private_key, message)
+            row["Assinar"] = _ops_per_second(lambda: sign(private_key, message))
+            row["Verificar"] = _ops_per_second(lambda: verify(public_key, message, signature))
+        
+        if curve_name in ECDH_CURVES:
+            _, peer_public_key = generate_ecc_keypair(curve_name)
+            row["ECDH"] = _ops_per_second(lambda: derive_shared_secret(private_key, peer_public_key))
+        
+        results[curve_name] = row
+    return results
@@ -0,0 +1,134 @@
+# educasec/enigma.py
+# Simulação da máquina Enigma (três rotores e refletor B).
+from educasec import perf
+
+# Mapeamentos de fiação (wiring) para os rotores e o refletor
+# A-Z -> outro caractere
+ROTOR_WIRING = {
+    "I":   "EKMFLGDQVZNTOWYHXUSPAIBRCJ",
+    "II":  "AJDKSIRUXBLHWTMCQGZNPYFVOE",
+    "III": "BDFHJLCPRTXVZNYEIWGAKMUSQO",
+    "IV":  "ESOVPZJAYQUIRXHMCTPNFVWKBL",
+    "V":   "VZBRGITYUPSDNHLXAWMJQOFECK"
+}
+
+# A-Z -> outro caractere
+REFLECTOR_WIRING = {
+    "B": "YRUHQSLDPXNGOKMIEBFZCWVJAT"
+}
+
+# Posições dos entalhes (notch) para o movimento do próximo rotor
+# O rotor avança o próximo quando ele próprio atinge o entalhe
+ROTOR_NOTCHES = {
+    "I":   "Q",
+    "II":  "E",
+    "III": "V",
+    "IV":  "J",
+    "V":   "Z"
+}
+
+class Rotor:
+    """
+    Representa um rotor da máquina Enigma.
+    """
+    def __init__(self, wiring, notch, position):
+        self.wiring = wiring
+        self.notch = notch
+        self.position = ord(position.upper()) - ord('A')
+        self.forward_map = {chr(i + ord('A')): self.wiring[i] for i in range(26)}
+        self.backward_map = {self.wiring[i]: chr(i + ord('A')) for i in range(26)}
+
+    def rotate(self):
+        """
+        Gira o rotor em uma posição.
+        """
+        self.position = (self.position + 1) % 26
+        return self.position_char() == self.notch
+
+    def position_char(self):
+        """
+        Retorna a letra da posição atual do rotor.
+        """
+        return chr(self.position + ord('A'))
+
+    def encrypt_forward(self, char):
+        """
+        Criptografa um caractere na direção de entrada do rotor.
+        """
+        idx = (ord(char) - ord('A') + self.position) % 26
+        encrypted_char = self.forward_map[chr(idx + ord('A'))]
+        return chr((ord(encrypted_char) - ord('A') - self.position + 26) % 26 + ord('A'))
+
+    def encrypt_backward(self, char):
+        """
+        Criptografa um caractere na direção de saída do rotor.
+        """
+        idx = (ord(char) - ord('A') + self.position) % 26
+        encrypted_char = self.backward_map[chr(idx + ord('A'))]
+        return chr((ord(encrypted_char) - ord('A') - self.position + 26) % 26 + ord('A'))
+
+class Reflector:
+    """
+    Representa o refletor da máquina Enigma.
+    """
+    def __init__(self, wiring):
+        self.wiring = wiring
+        self.map = {chr(i + ord('A')): self.wiring[i] for i in range(26)}
+
+    def reflect(self, char):
+        """
+        Reflete um caractere.
+        """
+        return self.map[char]
+
+class EnigmaMachine:
+    """
+    Simula a máquina Enigma completa.
+    """
+    def __init__(self, rotor1_type, rotor2_type, rotor3_type, pos1, pos2, pos3):
+        self.rotor1 = Rotor(ROTOR_WIRING[rotor1_type], ROTOR_NOTCHES[rotor1_type], pos1)
+        self.rotor2 = Rotor(ROTOR_WIRING[rotor2_type], ROTOR_NOTCHES[rotor2_type], pos2)
+        self.rotor3 = Rotor(ROTOR_WIRING[rotor3_type], ROTOR_NOTCHES[rotor3_type], pos3)
+        self.reflector = Reflector(REFLECTOR_WIRING["B"])
+
+    def encrypt_char(self, char):
+        """
+        Criptografa um único caractere.
+        """
+        # Rotaciona os rotores
+        # O rotor 1 sempre gira
+        should_rotate2 = self.rotor1.rotate()
+        # O rotor 2 gira se o rotor 1 atingir o entalhe
+        should_rotate3 = should_rotate2 and self.rotor2.rotate()
+        # O rotor 3 gira se o rotor 2 atingir o entalhe
+        if should_rotate3:
+            self.rotor3.rotate()
+        
+        # O sinal passa pelos rotores (da direita para a esquerda)
+        encrypted = self.rotor1.encrypt_forward(char)
+        encrypted = self.rotor2.encrypt_forward(encrypted)
+        encrypted = self.rotor3.encrypt_forward(encrypted)
+
+        # O sinal é refletido
+        encrypted = self.reflector.reflect(encrypted)
+
+        # O sinal volta pelos rotores (da esquerda para a direita)
+        encrypted = self.rotor3.encrypt_backward(encrypted)
+        encrypted = self.rotor2.encrypt_backward(encrypted)
+        encrypted = self.rotor1.encrypt_backward(encrypted)
+        
+        return encrypted
+
+def limpar_texto(texto):
+    """
+    Converte para maiúsculas e remove os caracteres não alfabéticos.
+    """
+    return ''.join(filter(str.isalpha, texto.upper()))
+
+@perf.medido("enigma.criptografar")
+def criptografar_enigma(maquina, texto):
+    """
+    Passa o texto (já limpo) pela máquina. Os rotores continuam de onde
+    pararam, então um texto longo pode ser enviado em vários blocos.
+    """
+    return ''.join(map(maquina.encrypt_char, texto))
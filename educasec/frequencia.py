@@ -0,0 +1,175 @@
+# educasec/frequencia.py
+# Análise de frequência de letras, pares (bigramas) e trios (trigramas).
+#
+# O texto é processado em blocos: cada bloco vira um vetor uint8 de letras
+# 0-25 e as contagens são somadas com np.bincount. As duas últimas letras de
+# um bloco ficam guardadas para formar os pares e trios que atravessam a
+# fronteira com o bloco seguinte, então o resultado é o mesmo que processar o
+# texto inteiro de uma vez. A memória usada é constante (26 + 26² + 26³
+# contadores), qualquer que seja o tamanho do texto.
+#
+#   from educasec.frequencia import Histogramas
+#
+#   histogramas = Histogramas()
+#   for bloco in iter(lambda: arquivo.read(1 << 20), b""):
+#       histogramas.adicionar(bloco)
+#   histogramas.frequencias()  # frequência relativa de cada letra
+import os
+import string
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+
+from educasec.quadgram import IDIOMAS, PASTA_CORPORA
+
+ALFABETO = string.ascii_uppercase
+
+# Tamanho dos blocos lidos de arquivos
+TAMANHO_BLOCO = 1 << 20
+
+# Byte -> letra (0-25); 255 para o que não é letra A-Z/a-z. Letras acentuadas
+# (vários bytes em UTF-8) são ignoradas, como nas cifras clássicas.
+_CODIGO = np.full(256, 255, dtype=np.uint8)
+_CODIGO[65:91] = np.arange(26)
+_CODIGO[97:123] = np.arange(26)
+
+def codigos_letras(bloco):
+    """
+    Letras A-Z/a-z de um bloco (bytes ou str) como vetor uint8 de 0 a 25.
+    """
+    if isinstance(bloco, str):
+        bloco = bloco.encode("utf-8", "surrogatepass")
+    codigos = _CODIGO[np.frombuffer(bloco, dtype=np.uint8)]
+    return codigos[codigos < 26]
+
+class Histogramas:
+    """
+    Contagens de letras, bigramas e trigramas, atualizadas bloco a bloco.
+    """
+    def __init__(self):
+        self.letras = np.zeros(26, dtype=np.int64)
+        self.bigramas = np.zeros(26 ** 2, dtype=np.int64)
+        self.trigramas = np.zeros(26 ** 3, dtype=np.int64)
+        # Últimas letras do bloco anterior (até duas)
+        self.cauda = np.zeros(0, dtype=np.uint8)
+        self.bytes_lidos = 0
+
+    @property
+    def total(self):
+        return int(self.letras.sum())
+
+    def adicionar(self, bloco):
+        """
+        Soma as contagens de mais um bloco do texto.
+        """
+        self.bytes_lidos += len(bloco)
+        novos = codigos_letras(bloco)
+        if novos.size == 0:
+            return
+        self.letras += np.bincount(novos, minlength=26)
+
+        # Junta as últimas letras do bloco anterior. Os índices cabem em uint16
+        # (26³ < 65536), o que poupa memória e tempo nas contas.
+        codigos = np.concatenate((self.cauda, novos)).astype(np.uint16)
+        if codigos.size >= 2:
+            pares = codigos[:-1] * 26 + codigos[1:]
+            # O par formado pelas duas letras da cauda já foi contado
+            self.bigramas += np.bincount(pares[1:] if self.cauda.size == 2 else pares, minlength=26 ** 2)
+            if codigos.size >= 3:
+                self.trigramas += np.bincount(pares[:-1] * 26 + codigos[2:], minlength=26 ** 3)
+        self.cauda = codigos[-2:].astype(np.uint8)
+
+    def mesclar(self, outro):
+        """
+        Soma as contagens de outro Histogramas, calculado à parte sobre o
+        trecho seguinte do texto (os até dois pares e trios que atravessam a
+        divisa entre os trechos não são contados).
+        """
+        self.letras += outro.letras
+        self.bigramas += outro.bigramas
+        self.trigramas += outro.trigramas
+        self.bytes_lidos += outro.bytes_lidos
+        if outro.total:
+            self.cauda = outro.cauda
+        return self
+
+    def frequencias(self):
+        """
+        Frequência relativa (0 a 1) de cada letra de A a Z.
+        """
+        total = self.total
+        return self.letras / total if total else np.zeros(26)
+
+    def mais_comuns(self, tamanho, quantidade=10):
+        """
+        Os `quantidade` n-gramas mais comuns (tamanho 1, 2 ou 3): lista de
+        (n-grama, contagem).
+        """
+        contagens = {1: self.letras, 2: self.bigramas, 3: self.trigramas}[tamanho]
+        indices = np.argsort(contagens)[::-1][:quantidade]
+        return [
+            (nome_ngrama(int(indice), tamanho), int(contagens[indice]))
+            for indice in indices if contagens[indice]
+        ]
+
+    def indice_coincidencia(self):
+        """
+        Chance de duas letras sorteadas do texto serem iguais. Perto de 0,072
+        (português) ou 0,066 (inglês) em textos comuns ou cifrados por
+        substituição simples; perto de 0,038 (letras ao acaso) em cifras
+        polialfabéticas como a de Vigenère e a Enigma.
+        """
+        total = self.total
+        if total < 2:
+            return 0.0
+        return float((self.letras * (self.letras - 1)).sum() / (total * (total - 1)))
+
+def nome_ngrama(indice, tamanho):
+    """
+    Converte o índice de um n-grama (base 26) nas suas letras.
+    """
+    letras = []
+    for _ in range(tamanho):
+        indice, resto = divmod(indice, 26)
+        letras.append(ALFABETO[resto])
+    return "".join(reversed(letras))
+
+def analisar_fluxo(arquivo, tamanho_bloco=TAMANHO_BLOCO, histogramas=None):
+    """
+    Lê um arquivo binário em blocos e devolve os histogramas, a cada bloco
+    (um gerador: quem chama pode mostrar o progresso no meio do caminho).
+    """
+    histogramas = histogramas or Histogramas()
+    for bloco in iter(lambda: arquivo.read(tamanho_bloco), b""):
+        histogramas.adicionar(bloco)
+        yield histogramas
+
+@lru_cache(maxsize=None)
+def referencia(idioma="pt"):
+    """
+    Histogramas do corpus de partida do idioma (educasec/corpora), usados
+    como frequências de referência.
+    """
+    if idioma not in IDIOMAS:
+        raise ValueError(f"Idioma desconhecido: {idioma} (use {', '.join(IDIOMAS)}).")
+    with open(os.path.join(PASTA_CORPORA, f"{idioma}.txt"), encoding="utf-8") as f:
+        # No corpus os acentos contam como a letra sem acento (ã -> a)
+        texto = unicodedata.normalize("NFKD", f.read())
+    histogramas = Histogramas()
+    histogramas.adicionar(texto)
+    return histogramas
+
+def deslocamento_provavel(histogramas, idioma="pt"):
+    """
+    Deslocamento de César que melhor alinha as letras do texto com as do
+    idioma (menor qui-quadrado). Devolve (deslocamento, qui-quadrado).
+    """
+    esperado = referencia(idioma).frequencias() * histogramas.total
+    esperado[esperado == 0] = 1e-9
+    resultados = [
+        (float((((np.roll(histogramas.letras, -deslocamento) - esperado) ** 2) / esperado).sum()), deslocamento)
+        for deslocamento in range(26)
+    ]
+    qui_quadrado, deslocamento = min(resultados)
+    return deslocamento, qui_quadrado
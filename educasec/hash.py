@@ -0,0 +1,25 @@
+# educasec/hash.py
+# Funções de hash criptográficas (hashlib), para textos e para fluxos de bytes.
+import hashlib
+
+# Algoritmos oferecidos pelo aplicativo
+ALGORITMOS = ("md5", "sha1", "sha256", "sha512")
+
+# Tamanho dos blocos lidos de arquivos e da entrada padrão
+TAMANHO_BLOCO = 1 << 20
+
+def gerar_hash(texto, algoritmo="sha256"):
+    """
+    Calcula o hash (em hexadecimal) de um texto codificado em UTF-8.
+    """
+    return hashlib.new(algoritmo, texto.encode('utf-8')).hexdigest()
+
+def gerar_hash_fluxo(arquivo, algoritmo="sha256", tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Calcula o hash de um arquivo binário lendo-o em blocos, sem carregar o
+    conteúdo inteiro na memória.
+    """
+    hash_object = hashlib.new(algoritmo)
+    for bloco in iter(lambda: arquivo.read(tamanho_bloco), b""):
+        hash_object.update(bloco)
+    return hash_object.hexdigest()
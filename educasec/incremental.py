@@ -0,0 +1,159 @@
+# educasec/incremental.py
+# Cifragem incremental para o modo "ao vivo" das cifras de César e Vigenère.
+#
+# Quando o aluno edita um texto longo, quase tudo continua igual: só o trecho
+# entre o prefixo comum e o sufixo comum mudou. Este módulo guarda o texto e o
+# texto cifrado da edição anterior e recifra apenas esse trecho.
+#
+# Na cifra de César cada letra depende só dela mesma, então o resto do texto
+# cifrado é reaproveitado como está. Na de Vigenère a letra da chave usada em
+# cada posição depende de quantas letras vieram antes; essa contagem fica
+# guardada a cada BLOCO caracteres (pontos de controle), então a posição da
+# chave no ponto da edição é encontrada sem percorrer o texto inteiro. O
+# sufixo só precisa ser recifrado se a edição mudou a quantidade de letras
+# por um valor que não seja múltiplo do tamanho da chave.
+#
+#   from educasec.incremental import CifraIncremental, cifra_cesar, cifra_vigenere
+#
+#   viva = CifraIncremental(*cifra_vigenere("LIMAO"))
+#   viva.atualizar(texto)       # primeira vez: cifra tudo
+#   viva.atualizar(texto + "a") # depois: só o que mudou
+from string import ascii_letters
+
+from educasec.cesar import criptografar_cesar
+from educasec.vigenere import criptografar_vigenere
+
+# Tamanho dos blocos usados nas comparações e nos pontos de controle
+BLOCO = 4096
+
+# Tabela que apaga as letras A-Z e a-z (as únicas que consomem a chave)
+_SEM_LETRAS = str.maketrans("", "", ascii_letters)
+
+def contar_letras(texto):
+    """
+    Quantidade de letras A-Z/a-z no texto (contada em C, com str.translate).
+    """
+    return len(texto) - len(texto.translate(_SEM_LETRAS))
+
+def prefixo_comum(a, b, bloco=BLOCO):
+    """
+    Tamanho do maior prefixo comum: compara blocos inteiros e, no primeiro
+    bloco diferente, faz uma busca binária.
+    """
+    limite = min(len(a), len(b))
+    inicio = 0
+    while inicio + bloco <= limite and a[inicio:inicio + bloco] == b[inicio:inicio + bloco]:
+        inicio += bloco
+    baixo, alto = inicio, min(inicio + bloco, limite)
+    while baixo < alto:
+        meio = (baixo + alto + 1) // 2
+        if a[inicio:meio] == b[inicio:meio]:
+            baixo = meio
+        else:
+            alto = meio - 1
+    return baixo
+
+def sufixo_comum(a, b, limite, bloco=BLOCO):
+    """
+    Tamanho do maior sufixo comum, sem passar de `limite` caracteres.
+    """
+    limite = min(limite, len(a), len(b))
+    fim_a, fim_b = len(a), len(b)
+    tamanho = 0
+    while tamanho + bloco <= limite and \
+            a[fim_a - tamanho - bloco:fim_a - tamanho] == b[fim_b - tamanho - bloco:fim_b - tamanho]:
+        tamanho += bloco
+    baixo, alto = tamanho, min(tamanho + bloco, limite)
+    while baixo < alto:
+        meio = (baixo + alto + 1) // 2
+        if a[fim_a - meio:fim_a - tamanho] == b[fim_b - meio:fim_b - tamanho]:
+            baixo = meio
+        else:
+            alto = meio - 1
+    return baixo
+
+def cifra_cesar(chave):
+    """
+    (função de trecho, período) para a cifra de César: o período 1 indica que
+    a posição no texto não importa.
+    """
+    return (lambda trecho, fase: (criptografar_cesar(trecho, chave), 0)), 1
+
+def cifra_vigenere(chave, sentido=1):
+    """
+    (função de trecho, período) para a cifra de Vigenère: a fase é a posição
+    da chave onde o trecho começa.
+    """
+    if not chave:
+        raise ValueError("A chave não pode ser vazia.")
+    return (lambda trecho, fase: criptografar_vigenere(trecho, chave, fase, sentido)), len(chave)
+
+class CifraIncremental:
+    """
+    Mantém o texto cifrado de um documento que é editado aos poucos.
+
+    `cifrar_trecho(trecho, fase)` cifra um pedaço do texto a partir da fase
+    (posição da chave) e devolve (cifrado, fase seguinte); `periodo` é o
+    tamanho da chave.
+    """
+    def __init__(self, cifrar_trecho, periodo, bloco=BLOCO):
+        self.cifrar_trecho = cifrar_trecho
+        self.periodo = periodo
+        self.bloco = bloco
+        self.texto = ""
+        self.cifrado = ""
+        # marcas[k] = letras em texto[:k * bloco]
+        self.marcas = [0]
+        # Caracteres recifrados na última atualização
+        self.recifrados = 0
+
+    def letras_ate(self, posicao):
+        """
+        Letras antes de `posicao`, a partir do ponto de controle mais próximo.
+        """
+        k = posicao // self.bloco
+        return self.marcas[k] + contar_letras(self.texto[k * self.bloco:posicao])
+
+    def _atualizar_marcas(self, desde):
+        """
+        Refaz os pontos de controle a partir da posição `desde` do texto atual.
+        """
+        k = desde // self.bloco
+        del self.marcas[k + 1:]
+        for k in range(k + 1, len(self.texto) // self.bloco + 1):
+            self.marcas.append(self.marcas[k - 1] + contar_letras(self.texto[(k - 1) * self.bloco:k * self.bloco]))
+
+    def atualizar(self, novo):
+        """
+        Troca o texto por `novo` e devolve o texto cifrado, recifrando só o
+        trecho que mudou (e, na Vigenère, o sufixo se a fase dele mudou).
+        """
+        antigo = self.texto
+        if novo == antigo:
+            self.recifrados = 0
+            return self.cifrado
+
+        inicio = prefixo_comum(antigo, novo, self.bloco)
+        sufixo = sufixo_comum(antigo, novo, min(len(antigo), len(novo)) - inicio, self.bloco)
+        fim_antigo, fim_novo = len(antigo) - sufixo, len(novo) - sufixo
+
+        # Fases calculadas no texto antigo, antes de trocá-lo (com período 1
+        # a fase é sempre zero e os pontos de controle não são usados)
+        fase = fase_sufixo_antigo = 0
+        if self.periodo > 1:
+            fase = self.letras_ate(inicio) % self.periodo
+            fase_sufixo_antigo = self.letras_ate(fim_antigo) % self.periodo
+
+        meio, fase = self.cifrar_trecho(novo[inicio:fim_novo], fase)
+        self.recifrados = fim_novo - inicio
+        if fase == fase_sufixo_antigo:
+            resto = self.cifrado[fim_antigo:]
+        else:
+            resto, _ = self.cifrar_trecho(novo[fim_novo:], fase)
+            self.recifrados += sufixo
+
+        self.cifrado = self.cifrado[:inicio] + meio + resto
+        self.texto = novo
+        if self.periodo > 1:
+            self._atualizar_marcas(inicio)
+        return self.cifrado
@@ -0,0 +1,145 @@
+# educasec/memo.py
+# Memorização de resultados entre execuções do script.
+#
+# O Streamlit executa a página inteira a cada interação: mexer em qualquer
+# controle faz a cifra de César, a de Vigenère ou o hash serem recalculados
+# sobre o mesmo texto. Este módulo guarda os resultados recentes, indexados por
+# (operação, parâmetros, resumo da entrada), e os compartilha entre todas as
+# sessões do processo. Quando a memória usada passa do limite, os resultados
+# usados há mais tempo são descartados (LRU).
+#
+#   from educasec import memo
+#
+#   cifrado = memo.memorizar("cesar", criptografar_cesar, texto, chave)
+#
+# Limite configurável pela variável de ambiente EDUCASEC_MEMO_LIMITE_KB
+# (padrão 16384 KB).
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+LIMITE_MEMO = int(os.environ.get("EDUCASEC_MEMO_LIMITE_KB", 16384)) * 1024
+
+# Resultados maiores que esta fração do limite não são guardados, para que um
+# único texto enorme não expulse todos os outros
+FRACAO_MAXIMA = 4
+
+# Custo fixo aproximado de cada entrada (chave, nó da lista, contadores)
+CUSTO_ENTRADA = 256
+
+def resumo_entrada(entrada):
+    """
+    Resumo (BLAKE2b de 128 bits) de um texto ou bloco de bytes. A chave do
+    cache guarda só o resumo, não o texto inteiro.
+    """
+    if isinstance(entrada, str):
+        entrada = entrada.encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(entrada, digest_size=16).digest()
+
+def tamanho_resultado(valor):
+    """
+    Tamanho aproximado (bytes) de um resultado: textos, bytes, números e
+    tuplas/listas deles.
+    """
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(tamanho_resultado(item) for item in valor)
+    return sys.getsizeof(valor)
+
+class Memo:
+    """
+    Cache LRU limitado pela memória, seguro para várias threads (cada sessão
+    do Streamlit roda em uma thread própria).
+    """
+    def __init__(self, limite_bytes=LIMITE_MEMO):
+        self.limite_bytes = limite_bytes
+        self.trava = threading.Lock()
+        self.entradas = OrderedDict()
+        self.bytes_usados = 0
+        self.contadores = {}
+
+    def _contar(self, operacao, campo, quantidade=1):
+        contadores = self.contadores.setdefault(
+            operacao, {"acertos": 0, "faltas": 0, "descartes": 0, "entradas": 0, "bytes": 0}
+        )
+        contadores[campo] += quantidade
+
+    def obter_ou_calcular(self, operacao, funcao, entrada, *parametros):
+        """
+        Devolve funcao(entrada, *parametros), reaproveitando o resultado se a
+        mesma operação já foi feita com a mesma entrada e os mesmos parâmetros.
+        """
+        chave = (operacao, parametros, resumo_entrada(entrada))
+        with self.trava:
+            encontrado = self.entradas.get(chave)
+            if encontrado is not None:
+                self.entradas.move_to_end(chave)
+                self._contar(operacao, "acertos")
+                return encontrado[0]
+            self._contar(operacao, "faltas")
+
+        # O cálculo fica fora da trava para não bloquear as outras sessões
+        resultado = funcao(entrada, *parametros)
+        tamanho = tamanho_resultado(resultado) + CUSTO_ENTRADA
+        if tamanho > self.limite_bytes // FRACAO_MAXIMA:
+            return resultado
+
+        with self.trava:
+            if chave in self.entradas:
+                return resultado
+            self.entradas[chave] = (resultado, tamanho)
+            self.bytes_usados += tamanho
+            self._contar(operacao, "entradas")
+            self._contar(operacao, "bytes", tamanho)
+            while self.bytes_usados > self.limite_bytes:
+                (antiga, _, _), (_, tamanho_antigo) = self.entradas.popitem(last=False)
+                self.bytes_usados -= tamanho_antigo
+                self._contar(antiga, "descartes")
+                self._contar(antiga, "entradas", -1)
+                self._contar(antiga, "bytes", -tamanho_antigo)
+        return resultado
+
+    def estatisticas(self):
+        """
+        Por operação: acertos, faltas, taxa de acerto, descartes, entradas
+        guardadas e memória usada.
+        """
+        with self.trava:
+            copia = {operacao: dict(contadores) for operacao, contadores in self.contadores.items()}
+        linhas = []
+        for operacao, contadores in sorted(copia.items()):
+            chamadas = contadores["acertos"] + contadores["faltas"]
+            linhas.append({
+                "operacao": operacao,
+                **contadores,
+                "taxa_acerto": contadores["acertos"] / chamadas if chamadas else 0.0,
+            })
+        return linhas
+
+    def limpar(self):
+        with self.trava:
+            self.entradas.clear()
+            self.bytes_usados = 0
+            self.contadores.clear()
+
+# Cache único do processo, compartilhado por todas as sessões
+_memo = Memo()
+
+def memorizar(operacao, funcao, entrada, *parametros):
+    """
+    Atalho para o cache do processo (veja Memo.obter_ou_calcular).
+    """
+    return _memo.obter_ou_calcular(operacao, funcao, entrada, *parametros)
+
+def estatisticas():
+    return _memo.estatisticas()
+
+def uso():
+    """
+    Memória usada e limite do cache do processo (bytes).
+    """
+    return _memo.bytes_usados, _memo.limite_bytes
+
+def limpar():
+    _memo.limpar()
@@ -0,0 +1,186 @@
+# educasec/perf.py
+# Instrumentação leve de desempenho: mede quanto tempo cada página e cada
+# operação importante (gerar chaves, assinar, processar texto...) levou.
+#
+# As medições ficam em um buffer circular (só as mais recentes são mantidas)
+# e podem ser exportadas em JSON lines. Desligada, a instrumentação custa só
+# um teste de uma variável por chamada.
+#
+#   from educasec import perf
+#
+#   @perf.medido("rsa.gerar_chaves")
+#   def generate_key_pair(bits): ...
+#
+#   with perf.medir("nuvem.spacy"):
+#       doc = nlp(texto)
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import statistics
+import threading
+import time
+from collections import deque
+
+# Quantas medições ficam guardadas no buffer
+TAMANHO_BUFFER = 2000
+
+# Ligada por padrão só se a variável de ambiente pedir (EDUCASEC_PERF=1)
+_ativo = os.environ.get("EDUCASEC_PERF") == "1"
+_buffer = deque(maxlen=TAMANHO_BUFFER)
+_NULO = contextlib.nullcontext()
+
+# Em que thread cada medição aconteceu: cada sessão do Streamlit roda o script
+# na sua própria thread, então isso separa as medições de alunos diferentes
+_contexto = threading.local()
+
+def ativar(ligado=True):
+    """
+    Liga ou desliga a instrumentação (vale para o processo inteiro).
+    """
+    global _ativo
+    _ativo = bool(ligado)
+
+def ativo():
+    return _ativo
+
+def definir_rotulo(rotulo):
+    """
+    Rótulo gravado junto com as medições feitas nesta thread a partir de agora
+    (por exemplo, o número do rerun da sessão).
+    """
+    _contexto.rotulo = rotulo
+
+def propagar(funcao):
+    """
+    Devolve uma versão da função que roda com o rótulo da thread que chamou
+    propagar(). Para trabalho enviado a um pool de threads: sem isso, as
+    medições feitas lá ficariam sem rótulo e sumiriam do filtro "Só esta
+    sessão" do painel.
+    """
+    rotulo = getattr(_contexto, "rotulo", None)
+
+    @functools.wraps(funcao)
+    def envoltorio(*args, **kwargs):
+        anterior = getattr(_contexto, "rotulo", None)
+        _contexto.rotulo = rotulo
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            _contexto.rotulo = anterior
+    return envoltorio
+
+def registrar(operacao, duracao):
+    """
+    Guarda uma medição (duração em segundos) no buffer.
+    """
+    _buffer.append({
+        "operacao": operacao,
+        "ms": duracao * 1000,
+        "quando": time.time(),
+        "rotulo": getattr(_contexto, "rotulo", None),
+    })
+
+class _Medicao:
+    """
+    Bloco `with` que mede o tempo até o fim, mesmo se houver exceção (o
+    Streamlit usa exceções para st.stop() e st.rerun()).
+    """
+    __slots__ = ("operacao", "inicio")
+
+    def __init__(self, operacao):
+        self.operacao = operacao
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        registrar(self.operacao, time.perf_counter() - self.inicio)
+        return False
+
+def medir(operacao):
+    """
+    Mede o bloco `with`. Desligada, devolve um contexto vazio compartilhado.
+    """
+    return _Medicao(operacao) if _ativo else _NULO
+
+def medido(operacao):
+    """
+    Decorador que mede cada chamada da função.
+    """
+    def decorador(funcao):
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            if not _ativo:
+                return funcao(*args, **kwargs)
+            inicio = time.perf_counter()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                registrar(operacao, time.perf_counter() - inicio)
+        return envoltorio
+    return decorador
+
+# --- Consulta ---
+
+def registros():
+    """
+    Cópia das medições guardadas, da mais antiga para a mais recente.
+    """
+    return list(_buffer)
+
+def limpar():
+    _buffer.clear()
+
+def resumo(medicoes=None):
+    """
+    Estatísticas por operação: quantidade, média, mediana, p95 e máximo (ms).
+    """
+    por_operacao = {}
+    for medicao in registros() if medicoes is None else medicoes:
+        por_operacao.setdefault(medicao["operacao"], []).append(medicao["ms"])
+    linhas = []
+    for operacao, tempos in sorted(por_operacao.items()):
+        tempos.sort()
+        linhas.append({
+            "operacao": operacao,
+            "chamadas": len(tempos),
+            "media_ms": statistics.fmean(tempos),
+            "p50_ms": tempos[len(tempos) // 2],
+            "p95_ms": tempos[min(len(tempos) - 1, int(len(tempos) * 0.95))],
+            "max_ms": tempos[-1],
+        })
+    return linhas
+
+def exportar_jsonl(medicoes=None):
+    """
+    Medições em JSON lines (um objeto JSON por linha).
+    """
+    return "".join(
+        json.dumps(medicao, ensure_ascii=False) + "\n"
+        for medicao in (registros() if medicoes is None else medicoes)
+    )
+
+def perfilar(funcao, *args, limite=30, **kwargs):
+    """
+    Executa a função uma vez sob o cProfile e devolve (resultado, relatório),
+    com as `limite` funções de maior tempo acumulado. Se a função terminar
+    com exceção, o relatório é anexado a ela no atributo `relatorio_perfil`.
+    """
+    perfil = cProfile.Profile()
+    resultado = None
+    try:
+        resultado = perfil.runcall(funcao, *args, **kwargs)
+    except BaseException as excecao:
+        excecao.relatorio_perfil = _relatorio(perfil, limite)
+        raise
+    return resultado, _relatorio(perfil, limite)
+
+def _relatorio(perfil, limite):
+    saida = io.StringIO()
+    pstats.Stats(perfil, stream=saida).strip_dirs().sort_stats("cumulative").print_stats(limite)
+    return saida.getvalue()
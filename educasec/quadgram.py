@@ -0,0 +1,180 @@
+# educasec/quadgram.py
+# Pontuação de "quanto um texto parece português (ou inglês)" por quadgramas.
+#
+# Um quadgrama é uma sequência de quatro letras seguidas ("CRIP", "RIPT"...).
+# A partir de um corpus, contamos quantas vezes cada um dos 26⁴ quadgramas
+# aparece e guardamos o log10 da probabilidade de cada um em um vetor float32
+# (26⁴ posições, cerca de 1,8 MB). A pontuação de um texto é a soma dos
+# log-probabilidades dos seus quadgramas: quanto maior (menos negativa), mais
+# o texto se parece com a língua. A nota serve para ordenar tentativas de
+# decifração; hoje quem a usa é o solucionador da cifra de substituição
+# (educasec.substituicao), no refinamento final da chave.
+#
+# O vetor é construído uma vez a partir do corpus, gravado em disco (.npy) e,
+# nas próximas vezes, aberto como memmap: o sistema operacional carrega só as
+# páginas usadas e as compartilha entre processos.
+#
+#   from educasec.quadgram import pontuador
+#
+#   nota = pontuador("pt").pontuar("Atacar ao amanhecer")
+#
+# Corpora de partida em educasec/corpora/<idioma>.txt. São pequenos (cerca de
+# 9 KB, uns 4 500 quadgramas distintos): quase todas as 26⁴ posições ficam
+# com CONTAGEM_AUSENTE. Basta para separar um texto na língua de um texto
+# embaralhado, mas não para distinguir bem candidatos parecidos. Para isso,
+# construa uma tabela com um corpus maior (construir_tabela() ou
+# "python -m educasec quadgramas construir --saida pt.npy < corpus.txt") e
+# use-a com pontuador(tabela=caminho). A pasta dos vetores gerados pode ser
+# trocada pela variável de ambiente EDUCASEC_CACHE.
+import hashlib
+import os
+import unicodedata
+from functools import lru_cache
+
+import numpy as np
+
+# Número de quadgramas possíveis com as letras A-Z
+TOTAL_QUADGRAMAS = 26 ** 4
+
+# Idiomas com corpus de partida
+IDIOMAS = {"pt": "Português", "en": "Inglês"}
+
+PASTA_CORPORA = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpora")
+PASTA_CACHE = os.environ.get(
+    "EDUCASEC_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "educasec")
+)
+
+# Contagem atribuída aos quadgramas que não aparecem no corpus (suavização)
+CONTAGEM_AUSENTE = 0.01
+
+def letras(texto):
+    """
+    Letras do texto como vetor uint8 de 0 (A) a 25 (Z). Acentos são removidos
+    (ç -> C, ã -> A) e os demais caracteres são ignorados.
+    """
+    sem_acentos = unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").upper()
+    codigos = np.frombuffer(sem_acentos, dtype=np.uint8)
+    return codigos[(codigos >= 65) & (codigos <= 90)] - 65
+
+def indices_quadgramas(codigos):
+    """
+    Índice (0 a 26⁴-1) de cada quadgrama de um vetor de letras 0-25. Com uma
+    matriz (uma tentativa por linha), devolve os índices de cada linha.
+    """
+    codigos = np.asarray(codigos, dtype=np.int32)
+    return (
+        codigos[..., :-3] * 17576
+        + codigos[..., 1:-2] * 676
+        + codigos[..., 2:-1] * 26
+        + codigos[..., 3:]
+    )
+
+def construir_tabela(texto):
+    """
+    Vetor float32 com o log10 da probabilidade de cada quadgrama no texto.
+    """
+    indices = indices_quadgramas(letras(texto))
+    if indices.size == 0:
+        raise ValueError("O corpus precisa ter pelo menos quatro letras.")
+    contagens = np.bincount(indices, minlength=TOTAL_QUADGRAMAS).astype(np.float64)
+    contagens[contagens == 0] = CONTAGEM_AUSENTE
+    return np.log10(contagens / indices.size).astype(np.float32)
+
+def salvar_tabela(tabela, caminho):
+    """
+    Grava o vetor em .npy. A gravação vai para um arquivo temporário que
+    depois substitui o destino, para que outro processo nunca abra um
+    arquivo pela metade.
+    """
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    with open(temporario, "wb") as f:
+        np.save(f, tabela)
+    os.replace(temporario, caminho)
+
+def abrir_tabela(caminho):
+    """
+    Abre um vetor gravado com salvar_tabela() como memmap (somente leitura).
+    """
+    tabela = np.load(caminho, mmap_mode="r")
+    if tabela.shape != (TOTAL_QUADGRAMAS,) or tabela.dtype != np.float32:
+        raise ValueError(f"{caminho} não é uma tabela de quadgramas.")
+    return tabela
+
+class PontuadorQuadgramas:
+    """
+    Dá uma nota a textos candidatos usando uma tabela de quadgramas.
+    """
+    def __init__(self, tabela):
+        self.tabela = tabela
+        # Nota de um quadgrama que nunca aparece no corpus
+        self.piso = float(tabela.min())
+
+    def pontuar_letras(self, codigos):
+        """
+        Nota de um texto já convertido com letras() (um único gather no vetor).
+        """
+        if len(codigos) < 4:
+            return 0.0
+        return float(self.tabela[indices_quadgramas(codigos)].sum(dtype=np.float64))
+
+    def pontuar(self, texto):
+        """
+        Nota do texto: soma dos log10 das probabilidades dos seus quadgramas.
+        """
+        return self.pontuar_letras(letras(texto))
+
+    def pontuar_lote(self, candidatos):
+        """
+        Notas de várias tentativas do mesmo tamanho de uma só vez: `candidatos`
+        é uma matriz (tentativas x letras) de valores 0-25.
+        """
+        candidatos = np.asarray(candidatos)
+        if candidatos.shape[-1] < 4:
+            return np.zeros(candidatos.shape[:-1], dtype=np.float32)
+        return self.tabela[indices_quadgramas(candidatos)].sum(axis=-1, dtype=np.float32)
+
+    def media(self, texto):
+        """
+        Nota média por quadgrama, para comparar textos de tamanhos diferentes.
+        """
+        codigos = letras(texto)
+        if len(codigos) < 4:
+            return self.piso
+        return self.pontuar_letras(codigos) / (len(codigos) - 3)
+
+def caminho_tabela(idioma):
+    """
+    Arquivo .npy da tabela do idioma. O nome inclui um resumo do corpus, então
+    um corpus alterado gera uma tabela nova.
+    """
+    with open(os.path.join(PASTA_CORPORA, f"{idioma}.txt"), "rb") as f:
+        resumo = hashlib.sha1(f.read()).hexdigest()[:10]
+    return os.path.join(PASTA_CACHE, f"quadgramas-{idioma}-{resumo}.npy")
+
+@lru_cache(maxsize=None)
+def pontuador(idioma="pt", tabela=None):
+    """
+    Pontuador do idioma, compartilhado pelo processo. Na primeira vez, a
+    tabela é construída a partir do corpus de partida e gravada em disco; se a
+    pasta não puder ser gravada, a tabela fica só na memória. `tabela` usa um
+    .npy gerado a partir de outro corpus (python -m educasec quadgramas construir).
+    """
+    if tabela is not None:
+        return PontuadorQuadgramas(abrir_tabela(tabela))
+    if idioma not in IDIOMAS:
+        raise ValueError(f"Idioma desconhecido: {idioma} (use {', '.join(IDIOMAS)}).")
+    caminho = caminho_tabela(idioma)
+    try:
+        return PontuadorQuadgramas(abrir_tabela(caminho))
+    except (OSError, ValueError):
+        pass
+
+    with open(os.path.join(PASTA_CORPORA, f"{idioma}.txt"), encoding="utf-8") as f:
+        tabela = construir_tabela(f.read())
+    try:
+        salvar_tabela(tabela, caminho)
+        tabela = abrir_tabela(caminho)
+    except OSError:
+        pass
+    return PontuadorQuadgramas(tabela)
@@ -0,0 +1,177 @@
+# educasec/registro.py
+# Registro local (SQLite) dos documentos assinados com ECC.
+#
+# Guarda só o necessário para responder "este arquivo foi assinado? por
+# quem?": o hash SHA-256 do documento, a assinatura, a impressão digital da
+# chave pública de quem assinou e o momento da assinatura. O documento em si
+# não é guardado. As chaves públicas ficam em uma tabela à parte, uma linha
+# por chave, para não repetir o PEM em cada assinatura.
+#
+# Há índices no hash e na impressão digital: cada consulta é uma única busca
+# no índice, qualquer que seja o tamanho do registro. Inserções em lote
+# usam executemany() em transações de tamanho fixo.
+#
+#   from educasec.registro import RegistroAssinaturas
+#
+#   registro = RegistroAssinaturas("assinaturas.sqlite3")
+#   registro.registrar(hash_documento, assinatura, impressao, chave_publica=pem)
+#   registro.buscar_por_hash(hash_documento)
+import os
+import sqlite3
+import threading
+from collections import namedtuple
+from datetime import datetime
+from itertools import islice
+
+# Mesma pasta de cache das tabelas de quadgramas (educasec.quadgram)
+PASTA_CACHE = os.environ.get("EDUCASEC_CACHE", os.path.join(os.path.expanduser("~"), ".cache", "educasec"))
+CAMINHO_PADRAO = os.environ.get("EDUCASEC_REGISTRO", os.path.join(PASTA_CACHE, "assinaturas.sqlite3"))
+
+# Registros por transação nas inserções em lote
+TAMANHO_LOTE = 5000
+
+Registro = namedtuple(
+    "Registro", ["hash", "assinatura", "impressao", "momento", "arquivo", "algoritmo", "chave_publica"]
+)
+# Campos opcionais: momento (o atual, se faltar), arquivo, algoritmo e chave_publica
+Registro.__new__.__defaults__ = (None, None, None, None)
+
+ESQUEMA = """
+CREATE TABLE IF NOT EXISTS chaves (
+    impressao TEXT PRIMARY KEY,
+    chave_publica TEXT,
+    algoritmo TEXT
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS assinaturas (
+    id INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    assinatura TEXT NOT NULL,
+    impressao TEXT NOT NULL REFERENCES chaves (impressao),
+    momento TEXT NOT NULL,
+    arquivo TEXT,
+    -- Evita registrar a mesma assinatura duas vezes e também serve de índice
+    -- para a busca pelo hash (é a primeira coluna)
+    UNIQUE (hash, impressao, assinatura)
+);
+
+CREATE INDEX IF NOT EXISTS assinaturas_por_impressao ON assinaturas (impressao, momento);
+"""
+
+# A chave pública e o algoritmo vêm da tabela de chaves
+_CONSULTA = """
+SELECT a.hash, a.assinatura, a.impressao, a.momento, a.arquivo, c.algoritmo, c.chave_publica
+FROM assinaturas AS a JOIN chaves AS c ON c.impressao = a.impressao
+"""
+
+def _momento_atual():
+    return datetime.now().isoformat(timespec="seconds")
+
+class RegistroAssinaturas:
+    """
+    Registro de assinaturas em um arquivo SQLite. Uma conexão por objeto,
+    protegida por uma trava: o mesmo objeto pode ser usado por várias
+    threads (sessões do Streamlit).
+    """
+    def __init__(self, caminho=CAMINHO_PADRAO):
+        if caminho != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(caminho)), exist_ok=True)
+        self.caminho = caminho
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        self._trava = threading.Lock()
+        with self._trava, self._conexao:
+            # WAL: leituras não esperam as gravações; NORMAL basta com WAL
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+            self._conexao.execute("PRAGMA synchronous=NORMAL")
+            # Os índices recebem hashes aleatórios: um cache maior (32 MB) evita
+            # reler as mesmas páginas a cada lote
+            self._conexao.execute("PRAGMA cache_size=-32768")
+            self._conexao.executescript(ESQUEMA)
+
+    def fechar(self):
+        with self._trava:
+            self._conexao.close()
+
+    def registrar(self, hash_documento, assinatura, impressao, momento=None, arquivo=None,
+                  algoritmo=None, chave_publica=None):
+        """
+        Registra uma assinatura. Devolve True se ela ainda não estava registrada.
+        """
+        registro = Registro(hash_documento, assinatura, impressao, momento or _momento_atual(),
+                            arquivo, algoritmo, chave_publica)
+        return self.registrar_lote([registro]) == 1
+
+    def registrar_lote(self, registros, tamanho_lote=TAMANHO_LOTE):
+        """
+        Registra muitas assinaturas (Registro ou tuplas na mesma ordem), em
+        transações de `tamanho_lote` registros: cada transação é um único
+        executemany() para as chaves e outro para as assinaturas. Assinaturas
+        já registradas são ignoradas. Devolve quantas foram inseridas.
+        """
+        registros = iter(registros)
+        inseridos = 0
+        while True:
+            lote = [Registro(*registro) for registro in islice(registros, tamanho_lote)]
+            if not lote:
+                return inseridos
+            # Cada chave entra uma vez por lote (várias assinaturas costumam ter a mesma)
+            chaves = {}
+            for r in lote:
+                anterior = chaves.get(r.impressao, (None, None))
+                chaves[r.impressao] = (r.chave_publica or anterior[0], r.algoritmo or anterior[1])
+            with self._trava, self._conexao:
+                # Uma chave sem PEM não apaga o PEM já guardado
+                self._conexao.executemany(
+                    "INSERT INTO chaves (impressao, chave_publica, algoritmo) VALUES (?, ?, ?) "
+                    "ON CONFLICT (impressao) DO UPDATE SET "
+                    "chave_publica = coalesce(excluded.chave_publica, chave_publica), "
+                    "algoritmo = coalesce(excluded.algoritmo, algoritmo)",
+                    [(impressao, pem, algoritmo) for impressao, (pem, algoritmo) in chaves.items()]
+                )
+                meio = self._conexao.total_changes
+                self._conexao.executemany(
+                    "INSERT OR IGNORE INTO assinaturas (hash, assinatura, impressao, momento, arquivo) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [(r.hash, r.assinatura, r.impressao, r.momento or _momento_atual(), r.arquivo) for r in lote]
+                )
+                inseridos += self._conexao.total_changes - meio
+
+    def _consultar(self, onde, parametros):
+        with self._trava:
+            linhas = self._conexao.execute(_CONSULTA + onde, parametros).fetchall()
+        return [Registro(*linha) for linha in linhas]
+
+    def buscar_por_hash(self, hash_documento):
+        """
+        Todas as assinaturas de um documento (pelo hash SHA-256), da mais
+        recente para a mais antiga.
+        """
+        return self._consultar("WHERE a.hash = ? ORDER BY a.momento DESC", (hash_documento,))
+
+    def buscar_por_impressao(self, impressao, limite=100):
+        """
+        As assinaturas mais recentes feitas com uma chave.
+        """
+        return self._consultar("WHERE a.impressao = ? ORDER BY a.momento DESC LIMIT ?", (impressao, limite))
+
+    def plano_consulta(self, coluna="hash"):
+        """
+        Como o SQLite executa a busca por "hash" ou "impressao" (EXPLAIN
+        QUERY PLAN), para mostrar que ela usa o índice.
+        """
+        if coluna not in ("hash", "impressao"):
+            raise ValueError("Use 'hash' ou 'impressao'.")
+        with self._trava:
+            linhas = self._conexao.execute(
+                f"EXPLAIN QUERY PLAN {_CONSULTA} WHERE a.{coluna} = ?", ("",)
+            ).fetchall()
+        return [linha[-1] for linha in linhas]
+
+    def contar(self):
+        """
+        Quantidade de assinaturas e de chaves registradas.
+        """
+        with self._trava:
+            assinaturas = self._conexao.execute("SELECT count(*) FROM assinaturas").fetchone()[0]
+            chaves = self._conexao.execute("SELECT count(*) FROM chaves").fetchone()[0]
+        return assinaturas, chaves
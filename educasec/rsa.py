@@ -0,0 +1,78 @@
+# educasec/rsa.py
+# Criptografia RSA com PyCryptodome (PKCS#1 OAEP).
+# Requer: pip install pycryptodome
+import base64
+
+from educasec import perf
+
+from Crypto.PublicKey import RSA as CryptoRSA
+from Crypto.Cipher import PKCS1_OAEP
+
+# --- Funções de Ajuda ---
+@perf.medido("rsa.gerar_chaves")
+def generate_key_pair(bits):
+    """
+    Gera um par de chaves RSA (pública e privada) usando PyCryptodome.
+    """
+    key = CryptoRSA.generate(bits)
+    
+    public_key = key.publickey()
+    
+    # Extrai os componentes
+    n = key.n
+    e = key.e
+    d = key.d
+    
+    return key, public_key, (e, n, d)
+
+def key_to_pem(key, is_private=True):
+    """
+    Converte a chave para formato PEM.
+    """
+    if is_private:
+        return key.export_key().decode('utf-8')
+    else:
+        return key.export_key().decode('utf-8')
+
+def max_message_size(public_key):
+    """
+    Tamanho máximo (em bytes) de uma mensagem cifrada com PKCS1_OAEP (SHA-1).
+    """
+    return public_key.size_in_bytes() - 2 * 20 - 2
+
+def oaep_cipher(key_pem):
+    """
+    Cria o objeto PKCS1_OAEP de uma chave PEM, para cifrar ou decifrar
+    várias mensagens sem importar a chave de novo a cada uma.
+    """
+    key = CryptoRSA.import_key(key_pem)
+    return key, PKCS1_OAEP.new(key)
+
+@perf.medido("rsa.criptografar")
+def encrypt_message(public_key_pem, plaintext):
+    """
+    Criptografa uma mensagem usando PKCS1_OAEP (seguro).
+    """
+    public_key, cipher = oaep_cipher(public_key_pem)
+    
+    # Divide a mensagem em blocos se necessário
+    message_bytes = plaintext.encode('utf-8')
+    max_chunk_size = max_message_size(public_key)  # Para OAEP com SHA-1
+    
+    if len(message_bytes) > max_chunk_size:
+        raise ValueError(f"Mensagem muito longa! Máximo: {max_chunk_size} bytes ({max_chunk_size} caracteres)")
+    
+    ciphertext = cipher.encrypt(message_bytes)
+    return base64.b64encode(ciphertext).decode('utf-8')
+
+@perf.medido("rsa.descriptografar")
+def decrypt_message(private_key_pem, ciphertext_b64):
+    """
+    Descriptografa uma mensagem usando PKCS1_OAEP.
+    """
+    _, cipher = oaep_cipher(private_key_pem)
+    
+    ciphertext = base64.b64decode(ciphertext_b64)
+    plaintext_bytes = cipher.decrypt(ciphertext)
+    
+    return plaintext_bytes.decode('utf-8')
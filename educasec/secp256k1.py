@@ -0,0 +1,630 @@
+# educasec/secp256k1.py
+# Motor educacional da curva secp256k1 (a curva do Bitcoin e do Ethereum)
+# escrito em Python puro. Usado pelo Laboratório ECC (pages/1_ECC.py).
+#
+# Os pontos são manipulados em coordenadas jacobianas (X, Y, Z), que
+# representam o ponto afim (X/Z², Y/Z³). Assim, somas e dobros não precisam
+# de inversão modular; só invertemos uma vez, no final, para voltar ao ponto
+# afim. A multiplicação do ponto base G usa uma tabela fixa de múltiplos de G,
+# calculada uma única vez por processo.
+
+import hashlib
+import hmac
+import multiprocessing
+import secrets
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+# --- Parâmetros da Curva ---
+
+# y² = x³ + 7 sobre o corpo finito F_p
+P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+# Ordem do ponto base (quantidade de pontos gerados por G)
+N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+# Ponto base G
+G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8
+)
+
+# Ponto no infinito (elemento neutro) em coordenadas jacobianas
+INFINITY = (1, 1, 0)
+
+# Largura da janela (em bits) da tabela de múltiplos de G
+WINDOW_BITS = 8
+
+# Larguras da representação wNAF na multiplicação simultânea: G tem tabela
+# fixa (maior), os demais pontos ganham uma tabela pequena a cada chamada
+WNAF_WIDTH_G = 8
+WNAF_WIDTH = 5
+
+# --- Aritmética em Coordenadas Jacobianas ---
+
+def to_jacobian(point):
+    """
+    Converte um ponto afim (x, y) para coordenadas jacobianas.
+    """
+    if point is None:
+        return INFINITY
+    return (point[0], point[1], 1)
+
+def from_jacobian(point):
+    """
+    Converte um ponto jacobiano para afim (uma única inversão modular).
+    Retorna None para o ponto no infinito.
+    """
+    X, Y, Z = point
+    if Z == 0:
+        return None
+    z_inv = pow(Z, -1, P)
+    z_inv2 = z_inv * z_inv % P
+    return (X * z_inv2 % P, Y * z_inv2 * z_inv % P)
+
+def batch_from_jacobian(points):
+    """
+    Converte vários pontos jacobianos para afim com uma única inversão
+    modular (truque de Montgomery).
+    """
+    # Produtos acumulados dos Z (pulando o ponto no infinito)
+    prefix = []
+    acc = 1
+    for X, Y, Z in points:
+        prefix.append(acc)
+        if Z != 0:
+            acc = acc * Z % P
+
+    inv = pow(acc, -1, P)
+    result = [None] * len(points)
+    for i in range(len(points) - 1, -1, -1):
+        X, Y, Z = points[i]
+        if Z == 0:
+            continue
+        # inv é o inverso do produto dos Z até i; z_inv isola o Z deste ponto
+        z_inv = inv * prefix[i] % P
+        inv = inv * Z % P
+        z_inv2 = z_inv * z_inv % P
+        result[i] = (X * z_inv2 % P, Y * z_inv2 * z_inv % P)
+    return result
+
+def jacobian_double(point):
+    """
+    Dobra um ponto jacobiano (2P). Fórmula para curvas com a = 0.
+    """
+    X1, Y1, Z1 = point
+    if Z1 == 0 or Y1 == 0:
+        return INFINITY
+    XX = X1 * X1 % P
+    YY = Y1 * Y1 % P
+    YYYY = YY * YY % P
+    S = 2 * ((X1 + YY) * (X1 + YY) - XX - YYYY) % P
+    M = 3 * XX % P
+    X3 = (M * M - 2 * S) % P
+    Y3 = (M * (S - X3) - 8 * YYYY) % P
+    Z3 = 2 * Y1 * Z1 % P
+    return (X3, Y3, Z3)
+
+def jacobian_add(p1, p2):
+    """
+    Soma dois pontos jacobianos (P1 + P2).
+    """
+    X1, Y1, Z1 = p1
+    X2, Y2, Z2 = p2
+    if Z1 == 0:
+        return p2
+    if Z2 == 0:
+        return p1
+    Z1Z1 = Z1 * Z1 % P
+    Z2Z2 = Z2 * Z2 % P
+    U1 = X1 * Z2Z2 % P
+    U2 = X2 * Z1Z1 % P
+    S1 = Y1 * Z2 * Z2Z2 % P
+    S2 = Y2 * Z1 * Z1Z1 % P
+    if U1 == U2:
+        if S1 != S2:
+            return INFINITY
+        return jacobian_double(p1)
+    H = (U2 - U1) % P
+    R = (S2 - S1) % P
+    HH = H * H % P
+    HHH = H * HH % P
+    V = U1 * HH % P
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - S1 * HHH) % P
+    Z3 = H * Z1 * Z2 % P
+    return (X3, Y3, Z3)
+
+def jacobian_add_affine(p1, p2):
+    """
+    Soma um ponto jacobiano com um ponto afim (soma "mista", mais barata
+    porque Z2 = 1).
+    """
+    if p2 is None:
+        return p1
+    X1, Y1, Z1 = p1
+    x2, y2 = p2
+    if Z1 == 0:
+        return (x2, y2, 1)
+    Z1Z1 = Z1 * Z1 % P
+    U2 = x2 * Z1Z1 % P
+    S2 = y2 * Z1 * Z1Z1 % P
+    if U2 == X1:
+        if S2 != Y1:
+            return INFINITY
+        return jacobian_double(p1)
+    H = (U2 - X1) % P
+    R = (S2 - Y1) % P
+    HH = H * H % P
+    HHH = H * HH % P
+    V = X1 * HH % P
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - Y1 * HHH) % P
+    Z3 = H * Z1 % P
+    return (X3, Y3, Z3)
+
+def negate(point):
+    """
+    Retorna o ponto oposto -P = (x, -y).
+    """
+    if point is None:
+        return None
+    return (point[0], -point[1] % P)
+
+def is_on_curve(point):
+    """
+    Verifica se um ponto afim satisfaz y² = x³ + 7 (mod p).
+    """
+    if point is None:
+        return True
+    x, y = point
+    return (y * y - x * x * x - 7) % P == 0
+
+# --- Multiplicação Escalar ---
+
+@lru_cache(maxsize=None)
+def base_point_table():
+    """
+    Tabela de múltiplos de G em janelas fixas: table[i][d] = d · 2^(8i) · G.
+    Calculada uma vez por processo; as chamadas seguintes reaproveitam a tabela.
+    """
+    window_size = 1 << WINDOW_BITS
+    num_windows = (N.bit_length() + WINDOW_BITS - 1) // WINDOW_BITS
+
+    jacobian_points = []
+    base = to_jacobian(G)
+    for _ in range(num_windows):
+        acc = INFINITY
+        for _ in range(1, window_size):
+            acc = jacobian_add(acc, base)
+            jacobian_points.append(acc)
+        # Próxima janela começa em 2^8 · base
+        base = jacobian_add(acc, base)
+
+    # Converte todos os pontos para afim com uma única inversão
+    affine_points = batch_from_jacobian(jacobian_points)
+
+    table = []
+    row_size = window_size - 1
+    for i in range(num_windows):
+        row = affine_points[i * row_size:(i + 1) * row_size]
+        table.append((None,) + tuple(row))
+    return tuple(table)
+
+def scalar_mult_base_jacobian(k):
+    """
+    Calcula k · G (em coordenadas jacobianas) somando uma entrada da tabela
+    por janela de 8 bits, sem nenhum dobro de ponto.
+    """
+    k %= N
+    mask = (1 << WINDOW_BITS) - 1
+    acc = INFINITY
+    for row in base_point_table():
+        digit = k & mask
+        if digit:
+            acc = jacobian_add_affine(acc, row[digit])
+        k >>= WINDOW_BITS
+        if not k:
+            break
+    return acc
+
+def scalar_mult_base(k):
+    """
+    Calcula k · G e retorna o ponto afim.
+    """
+    return from_jacobian(scalar_mult_base_jacobian(k))
+
+def scalar_mult(k, point):
+    """
+    Calcula k · P para um ponto afim qualquer (dobrar-e-somar em jacobianas).
+    """
+    k %= N
+    acc = INFINITY
+    for bit in bin(k)[2:]:
+        acc = jacobian_double(acc)
+        if bit == '1':
+            acc = jacobian_add_affine(acc, point)
+    return from_jacobian(acc)
+
+def wnaf(k, width):
+    """
+    Recodifica k na forma NAF com janela `width` (wNAF): dígitos ímpares em
+    (-2^(w-1), 2^(w-1)), separados por pelo menos w - 1 zeros. Retorna os
+    dígitos do menos para o mais significativo.
+    """
+    digits = []
+    modulus = 1 << width
+    half = 1 << (width - 1)
+    while k:
+        if k & 1:
+            digit = k & (modulus - 1)
+            if digit >= half:
+                digit -= modulus
+            k -= digit
+        else:
+            digit = 0
+        digits.append(digit)
+        k >>= 1
+    return digits
+
+def odd_multiples(point, width):
+    """
+    Calcula [P, 3P, 5P, ..., (2^(w-1) - 1)P] em coordenadas afins.
+    """
+    count = 1 << (width - 2)
+    jacobian_point = to_jacobian(point)
+    twice = jacobian_double(jacobian_point)
+    multiples = [jacobian_point]
+    for _ in range(count - 1):
+        multiples.append(jacobian_add(multiples[-1], twice))
+    return batch_from_jacobian(multiples)
+
+@lru_cache(maxsize=None)
+def base_point_odd_multiples():
+    """
+    Múltiplos ímpares de G usados no wNAF, calculados uma vez por processo.
+    """
+    return tuple(odd_multiples(G, WNAF_WIDTH_G))
+
+def multi_scalar_mult_jacobian(terms):
+    """
+    Calcula k1·P1 + k2·P2 + ... (truque de Shamir/Strauss). Todos os termos
+    compartilham uma única sequência de dobros, e cada escalar em wNAF
+    contribui com uma soma a cada ~w bits. Retorna o ponto jacobiano.
+    """
+    recoded = []
+    for k, point in terms:
+        k %= N
+        if k == 0 or point is None:
+            continue
+        if point == G:
+            recoded.append((wnaf(k, WNAF_WIDTH_G), base_point_odd_multiples()))
+        else:
+            recoded.append((wnaf(k, WNAF_WIDTH), odd_multiples(point, WNAF_WIDTH)))
+
+    acc = INFINITY
+    length = max((len(digits) for digits, _ in recoded), default=0)
+    for i in range(length - 1, -1, -1):
+        acc = jacobian_double(acc)
+        for digits, multiples in recoded:
+            if i < len(digits):
+                digit = digits[i]
+                if digit > 0:
+                    acc = jacobian_add_affine(acc, multiples[digit >> 1])
+                elif digit < 0:
+                    acc = jacobian_add_affine(acc, negate(multiples[-digit >> 1]))
+    return acc
+
+def multi_scalar_mult(terms):
+    """
+    Calcula k1·P1 + k2·P2 + ... e retorna o ponto afim.
+    """
+    return from_jacobian(multi_scalar_mult_jacobian(terms))
+
+# --- Chaves ---
+
+def generate_private_key():
+    """
+    Gera uma chave privada aleatória no intervalo [1, N - 1].
+    """
+    return secrets.randbelow(N - 1) + 1
+
+def public_key(private_key):
+    """
+    Calcula a chave pública Q = d · G.
+    """
+    return scalar_mult_base(private_key)
+
+def encode_public_key(point):
+    """
+    Codifica a chave pública no formato não comprimido (04 || x || y), em hex.
+    """
+    x, y = point
+    return f"04{x:064x}{y:064x}"
+
+def decode_public_key(public_key_hex):
+    """
+    Decodifica uma chave pública no formato não comprimido (04 || x || y).
+    """
+    if len(public_key_hex) != 130 or not public_key_hex.startswith("04"):
+        raise ValueError("Chave pública deve estar no formato não comprimido (04 || x || y).")
+    point = (int(public_key_hex[2:66], 16), int(public_key_hex[66:], 16))
+    if not is_on_curve(point):
+        raise ValueError("O ponto informado não está na curva secp256k1.")
+    return point
+
+def address(public_key_hex):
+    """
+    Endereço no estilo Ethereum: últimos 20 bytes do hash da chave pública.
+    (O Ethereum usa Keccak-256; aqui usamos SHA-256, disponível no hashlib.)
+    """
+    return '0x' + hashlib.sha256(public_key_hex.encode()).hexdigest()[-40:]
+
+# --- ECDSA ---
+
+def hash_to_int(message):
+    """
+    Calcula o SHA-256 da mensagem e o interpreta como inteiro.
+    """
+    if isinstance(message, str):
+        message = message.encode('utf-8')
+    return int.from_bytes(hashlib.sha256(message).digest(), 'big')
+
+def deterministic_nonces(private_key, z):
+    """
+    Gera os candidatos a nonce k de forma determinística (RFC 6979 com
+    HMAC-SHA256). Um nonce repetido ou previsível revelaria a chave privada.
+    """
+    x = private_key.to_bytes(32, 'big')
+    h = (z % N).to_bytes(32, 'big')
+    V = b'\x01' * 32
+    K = b'\x00' * 32
+    K = hmac.new(K, V + b'\x00' + x + h, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+    K = hmac.new(K, V + b'\x01' + x + h, hashlib.sha256).digest()
+    V = hmac.new(K, V, hashlib.sha256).digest()
+    while True:
+        V = hmac.new(K, V, hashlib.sha256).digest()
+        k = int.from_bytes(V, 'big')
+        if 1 <= k < N:
+            yield k
+        K = hmac.new(K, V + b'\x00', hashlib.sha256).digest()
+        V = hmac.new(K, V, hashlib.sha256).digest()
+
+def sign(private_key, message):
+    """
+    Assina a mensagem com ECDSA (SHA-256) e retorna (r, s, recovery_id).
+    O recovery_id indica a paridade de y do ponto R, como no Ethereum (v = 27 + id).
+    """
+    z = hash_to_int(message)
+    for k in deterministic_nonces(private_key, z):
+        R = scalar_mult_base(k)
+        r = R[0] % N
+        if r == 0:
+            continue
+        s = pow(k, -1, N) * (z + r * private_key) % N
+        if s == 0:
+            continue
+        recovery_id = (R[1] & 1) | (2 if R[0] >= N else 0)
+        # Usa sempre o menor s (regra "low-s" do Bitcoin/Ethereum)
+        if s > N // 2:
+            s = N - s
+            recovery_id ^= 1
+        return r, s, recovery_id
+
+def _jacobian_x_matches(point, r):
+    """
+    Testa se x(ponto) ≡ r (mod n) sem converter o ponto para afim:
+    x = X / Z², então basta comparar X com r · Z² (e com (r + n) · Z²).
+    """
+    X, _, Z = point
+    if Z == 0:
+        return False
+    zz = Z * Z % P
+    if X == r * zz % P:
+        return True
+    return r + N < P and X == (r + N) * zz % P
+
+def verify(public_point, message, r, s):
+    """
+    Verifica uma assinatura ECDSA: calcula u1·G + u2·Q com uma única
+    multiplicação simultânea (Shamir + wNAF) e compara a coordenada x com r.
+    """
+    if not (1 <= r < N and 1 <= s < N):
+        return False
+    z = hash_to_int(message)
+    w = pow(s, -1, N)
+    u1 = z * w % N
+    u2 = r * w % N
+    R = multi_scalar_mult_jacobian([(u1, G), (u2, public_point)])
+    return _jacobian_x_matches(R, r)
+
+def verify_naive(public_point, message, r, s):
+    """
+    Verifica uma assinatura ECDSA com duas multiplicações separadas por
+    dobrar-e-somar (versão de referência, mais lenta).
+    """
+    if not (1 <= r < N and 1 <= s < N):
+        return False
+    z = hash_to_int(message)
+    w = pow(s, -1, N)
+    R = jacobian_add_affine(
+        to_jacobian(scalar_mult(z * w % N, G)),
+        scalar_mult(r * w % N, public_point)
+    )
+    return _jacobian_x_matches(R, r)
+
+def recover_r_point(r, recovery_id):
+    """
+    Reconstrói o ponto R = k·G a partir de r e do recovery_id (paridade de y).
+    Retorna None se não existir ponto com essa coordenada x.
+    """
+    x = r + N if recovery_id & 2 else r
+    if x >= P:
+        return None
+    alpha = (x * x * x + 7) % P
+    # Como p ≡ 3 (mod 4), a raiz quadrada é alpha^((p + 1) / 4)
+    y = pow(alpha, (P + 1) // 4, P)
+    if y * y % P != alpha:
+        return None
+    if (y & 1) != (recovery_id & 1):
+        y = P - y
+    return (x, y)
+
+def batch_verify(signatures):
+    """
+    Verifica várias assinaturas de uma vez. Cada item é
+    (chave_publica, mensagem, r, s, recovery_id).
+
+    Para cada assinatura vale s·R = z·G + r·Q. Sorteamos pesos a_i de 128
+    bits e testamos uma única equação:
+        Σ(a_i·z_i)·G + Σ(a_i·r_i)·Q_i - Σ(a_i·s_i)·R_i = O
+    Se alguma assinatura for inválida, a soma só se anula com probabilidade
+    desprezível (≈ 2^-128). Os termos de um mesmo signatário são somados.
+    """
+    g_coefficient = 0
+    key_coefficients = {}
+    terms = []
+    for public_point, message, r, s, recovery_id in signatures:
+        if not (1 <= r < N and 1 <= s < N):
+            return False
+        R = recover_r_point(r, recovery_id)
+        if R is None:
+            return False
+        a = secrets.randbits(128) | 1
+        g_coefficient += a * hash_to_int(message)
+        key_coefficients[public_point] = key_coefficients.get(public_point, 0) + a * r
+        terms.append((-a * s, R))
+
+    terms.append((g_coefficient, G))
+    terms.extend((coefficient, point) for point, coefficient in key_coefficients.items())
+    return multi_scalar_mult_jacobian(terms)[2] == 0
+
+# --- Medição de Desempenho ---
+
+def sample_signatures(count, signers=None):
+    """
+    Gera `count` assinaturas de exemplo (chave_publica, mensagem, r, s,
+    recovery_id). Por padrão cada assinatura tem um signatário diferente.
+    """
+    signers = signers or count
+    private_keys = [generate_private_key() for _ in range(signers)]
+    public_points = [public_key(d) for d in private_keys]
+    signatures = []
+    for i in range(count):
+        d = private_keys[i % signers]
+        message = f"Mensagem de teste número {i}"
+        r, s, recovery_id = sign(d, message)
+        signatures.append((public_points[i % signers], message, r, s, recovery_id))
+    return signatures
+
+def benchmark_verification(signatures):
+    """
+    Mede o tempo para verificar as assinaturas de três formas: dobrar-e-somar
+    ingênuo, Shamir + wNAF (uma a uma) e verificação em lote.
+    Retorna {método: (segundos, todas_validas)}.
+    """
+    results = {}
+
+    start = time.perf_counter()
+    valid = all([verify_naive(Q, m, r, s) for Q, m, r, s, _ in signatures])
+    results["Ingênuo (dobrar-e-somar)"] = (time.perf_counter() - start, valid)
+
+    start = time.perf_counter()
+    valid = all([verify(Q, m, r, s) for Q, m, r, s, _ in signatures])
+    results["Shamir + wNAF"] = (time.perf_counter() - start, valid)
+
+    start = time.perf_counter()
+    valid = batch_verify(signatures)
+    results["Lote (combinação aleatória)"] = (time.perf_counter() - start, valid)
+
+    return results
+
+# --- Busca de Endereço Personalizado (vanity) ---
+
+def _vanity_worker(prefix, seconds, batch_size):
+    """
+    Executado em um processo separado: parte de um escalar aleatório d e
+    caminha pela curva somando G (P, P + G, P + 2G, ...), em vez de fazer uma
+    multiplicação escalar por candidato. Cada lote de pontos é convertido para
+    afim com uma única inversão e então tem seus endereços calculados.
+    Retorna (chave_privada_encontrada ou None, quantidade_testada, segundos).
+    """
+    sha256 = hashlib.sha256
+    # A tabela de G é construída antes de iniciar o cronômetro
+    base_point_table()
+    start = time.perf_counter()
+    deadline = start + seconds
+    start_scalar = generate_private_key()
+    point = scalar_mult_base_jacobian(start_scalar)
+    checked = 0
+    while time.perf_counter() < deadline:
+        batch = []
+        for _ in range(batch_size):
+            batch.append(point)
+            point = jacobian_add_affine(point, G)
+        for i, (x, y) in enumerate(batch_from_jacobian(batch)):
+            digest = sha256(f"04{x:064x}{y:064x}".encode()).hexdigest()
+            if digest.startswith(prefix, 24):
+                return (start_scalar + checked + i) % N, checked + i + 1, time.perf_counter() - start
+        checked += batch_size
+    return None, checked, time.perf_counter() - start
+
+def expected_attempts(prefix):
+    """
+    Quantidade média de chaves testadas até achar um endereço com o prefixo
+    (cada dígito hexadecimal multiplica o trabalho por 16).
+    """
+    return 16 ** len(prefix)
+
+def vanity_search(prefix, workers=2, max_seconds=30.0, round_seconds=0.5, batch_size=256):
+    """
+    Procura uma chave cujo endereço comece com `prefix` (hex, sem "0x"),
+    usando `workers` processos. A busca acontece em rodadas curtas para que
+    o progresso possa ser exibido; a cada rodada é produzido um dicionário
+    com chaves testadas, tempo, taxa (chaves/s) e a chave encontrada (se houver).
+    A taxa considera só o tempo de busca dos processos (sem a inicialização).
+    """
+    prefix = prefix.lower()
+    if prefix.startswith('0x'):
+        prefix = prefix[2:]
+    if not prefix or any(c not in '0123456789abcdef' for c in prefix):
+        raise ValueError("O prefixo deve conter apenas dígitos hexadecimais (0-9, a-f).")
+
+    checked = 0
+    rate = 0.0
+    start = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        while True:
+            futures = [
+                executor.submit(_vanity_worker, prefix, round_seconds, batch_size)
+                for _ in range(workers)
+            ]
+            found = None
+            round_rate = 0.0
+            for future in futures:
+                private_key, worker_checked, worker_seconds = future.result()
+                checked += worker_checked
+                if worker_seconds:
+                    round_rate += worker_checked / worker_seconds
+                if private_key is not None and found is None:
+                    found = private_key
+            # Rodadas interrompidas cedo (chave achada) medem mal a taxa
+            if found is None or not rate:
+                rate = round_rate
+
+            elapsed = time.perf_counter() - start
+            progress = {
+                "checked": checked,
+                "elapsed": elapsed,
+                "rate": rate,
+                "private_key": found
+            }
+            if found is not None:
+                public_key_hex = encode_public_key(public_key(found))
+                progress["public_key"] = public_key_hex
+                progress["address"] = address(public_key_hex)
+            yield progress
+
+            if found is not None or elapsed >= max_seconds:
+                return
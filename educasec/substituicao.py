@@ -0,0 +1,241 @@
+# educasec/substituicao.py
+# Cifra de substituição monoalfabética e um solucionador por subida de encosta.
+#
+# A chave é uma permutação do alfabeto: a letra A do texto vira a primeira
+# letra da chave, B vira a segunda e assim por diante. São 26! chaves
+# possíveis, então testar todas é impossível; o solucionador parte da ordem
+# de frequência das letras, com um pouco de ruído, e vai trocando pares de
+# letras, ficando com cada troca que deixa o texto decifrado mais parecido
+# com a língua.
+#
+# A nota de uma chave é a soma, sobre os pares de letras vizinhas do texto
+# cifrado, do log da probabilidade do par decifrado (bigramas). Como uma
+# troca de duas letras só muda os pares que envolvem essas letras, a
+# variação da nota é calculada só nessas linhas e colunas da tabela de pares,
+# sem decifrar o texto de novo. No fim, a chave é refinada com a nota de
+# quadgramas (educasec.quadgram), mais precisa.
+#
+# Cada recomeço (com o seu ruído) é independente dos outros e pode rodar em um
+# processo separado (veja quebrar_recomeco).
+import os
+import random
+import string
+from functools import lru_cache
+
+import numpy as np
+
+from educasec.quadgram import IDIOMAS, PASTA_CORPORA, letras, pontuador
+
+ALFABETO = string.ascii_uppercase
+
+# Trocas seguidas sem melhora antes de uma subida ser considerada encerrada
+TROCAS_SEM_MELHORA = 2000
+
+# Contagem atribuída aos pares que não aparecem no corpus (suavização)
+CONTAGEM_AUSENTE = 0.5
+
+# --- Cifra ---
+
+def gerar_chave(aleatorio=random):
+    """
+    Chave aleatória: uma permutação das 26 letras.
+    """
+    letras_chave = list(ALFABETO)
+    aleatorio.shuffle(letras_chave)
+    return "".join(letras_chave)
+
+def validar_chave(chave):
+    """
+    Normaliza a chave (maiúsculas) e confere se ela é uma permutação de A-Z.
+    """
+    chave = chave.strip().upper()
+    if sorted(chave) != list(ALFABETO):
+        raise ValueError("A chave deve ter as 26 letras de A a Z, cada uma uma única vez.")
+    return chave
+
+def _tabela(origem, destino):
+    return str.maketrans(origem + origem.lower(), destino + destino.lower())
+
+def criptografar_substituicao(texto, chave):
+    """
+    Troca cada letra pela letra correspondente da chave (maiúsculas e
+    minúsculas são preservadas; os demais caracteres ficam como estão).
+    """
+    return texto.translate(_tabela(ALFABETO, validar_chave(chave)))
+
+def decriptografar_substituicao(texto, chave):
+    """
+    Desfaz a substituição.
+    """
+    return texto.translate(_tabela(validar_chave(chave), ALFABETO))
+
+# --- Estatísticas do texto e da língua ---
+
+def letras_cifradas(texto):
+    """
+    Letras A-Z do texto cifrado como vetor 0-25. Letras acentuadas não são
+    trocadas pela cifra, então são ignoradas (não viram a letra sem acento).
+    """
+    codigos = np.frombuffer(texto.upper().encode("ascii", "ignore"), dtype=np.uint8)
+    return codigos[(codigos >= 65) & (codigos <= 90)] - 65
+
+@lru_cache(maxsize=None)
+def tabela_bigramas(idioma="pt"):
+    """
+    Matriz 26x26 com o log10 da probabilidade de cada par de letras no corpus
+    de partida do idioma (como listas, que são mais rápidas que o numpy para
+    ler um elemento de cada vez).
+    """
+    if idioma not in IDIOMAS:
+        raise ValueError(f"Idioma desconhecido: {idioma} (use {', '.join(IDIOMAS)}).")
+    with open(os.path.join(PASTA_CORPORA, f"{idioma}.txt"), encoding="utf-8") as f:
+        codigos = letras(f.read()).astype(np.int64)
+    contagens = np.bincount(codigos[:-1] * 26 + codigos[1:], minlength=26 * 26).astype(np.float64)
+    contagens[contagens == 0] = CONTAGEM_AUSENTE
+    return np.log10(contagens / contagens.sum()).reshape(26, 26).tolist()
+
+def pares_do_texto(codigos):
+    """
+    Pares de letras vizinhas do texto cifrado, só os que aparecem: para cada
+    letra, a lista (outra letra, contagem) na linha (a letra vem antes) e na
+    coluna (a letra vem depois), e as contagens completas.
+    """
+    codigos = np.asarray(codigos, dtype=np.int64)
+    contagens = np.bincount(codigos[:-1] * 26 + codigos[1:], minlength=26 * 26).reshape(26, 26)
+    linhas = [[(b, int(contagens[a, b])) for b in np.flatnonzero(contagens[a])] for a in range(26)]
+    colunas = [[(a, int(contagens[a, b])) for a in np.flatnonzero(contagens[:, b])] for b in range(26)]
+    return linhas, colunas, contagens.tolist()
+
+# --- Solucionador ---
+
+def nota_bigramas(decifra, contagens, logp):
+    """
+    Nota completa de um mapa cifrada -> clara (usada só no início de cada subida).
+    """
+    return sum(
+        contagens[a][b] * logp[decifra[a]][decifra[b]]
+        for a in range(26) for b in range(26) if contagens[a][b]
+    )
+
+def variacao_troca(x, y, decifra, linhas, colunas, contagens, logp):
+    """
+    Quanto a nota muda se as letras claras das letras cifradas x e y forem
+    trocadas. Só os pares que começam ou terminam em x ou y mudam.
+    """
+    px, py = decifra[x], decifra[y]
+    lx, ly = logp[px], logp[py]
+    variacao = 0.0
+    for b, n in linhas[x]:
+        if b != x and b != y:
+            pb = decifra[b]
+            variacao += n * (ly[pb] - lx[pb])
+    for b, n in linhas[y]:
+        if b != x and b != y:
+            pb = decifra[b]
+            variacao += n * (lx[pb] - ly[pb])
+    for a, n in colunas[x]:
+        if a != x and a != y:
+            la = logp[decifra[a]]
+            variacao += n * (la[py] - la[px])
+    for a, n in colunas[y]:
+        if a != x and a != y:
+            la = logp[decifra[a]]
+            variacao += n * (la[px] - la[py])
+    # Pares formados só por x e y
+    cx, cy = contagens[x], contagens[y]
+    variacao += (cx[x] - cy[y]) * (ly[py] - lx[px])
+    variacao += cx[y] * (ly[px] - lx[py]) + cy[x] * (lx[py] - ly[px])
+    return variacao
+
+def subir_bigramas(decifra, linhas, colunas, contagens, logp, aleatorio, trocas_sem_melhora=TROCAS_SEM_MELHORA):
+    """
+    Subida de encosta: troca pares de letras ao acaso e fica com as trocas que
+    melhoram a nota, até `trocas_sem_melhora` tentativas seguidas sem melhora.
+    Só as letras que aparecem no texto são trocadas entre si e com as demais.
+    """
+    presentes = [a for a in range(26) if linhas[a] or colunas[a]]
+    sem_melhora = 0
+    while sem_melhora < trocas_sem_melhora:
+        x = aleatorio.choice(presentes)
+        y = aleatorio.randrange(26)
+        if x == y or variacao_troca(x, y, decifra, linhas, colunas, contagens, logp) <= 0:
+            sem_melhora += 1
+            continue
+        decifra[x], decifra[y] = decifra[y], decifra[x]
+        sem_melhora = 0
+    return decifra
+
+def refinar_quadgramas(decifra, codigos, pontuacao):
+    """
+    Testa todas as trocas de pares com a nota de quadgramas (o texto inteiro
+    é decifrado de uma vez com o numpy) até nenhuma troca melhorar.
+    """
+    mapa = np.array(decifra, dtype=np.uint8)
+    melhor = pontuacao.pontuar_letras(mapa[codigos])
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for x in range(26):
+            for y in range(x + 1, 26):
+                mapa[x], mapa[y] = mapa[y], mapa[x]
+                nota = pontuacao.pontuar_letras(mapa[codigos])
+                if nota > melhor:
+                    melhor = nota
+                    melhorou = True
+                else:
+                    mapa[x], mapa[y] = mapa[y], mapa[x]
+    return mapa.tolist(), melhor
+
+def chave_de_decifra(decifra):
+    """
+    Converte o mapa cifrada -> clara na chave (clara -> cifrada).
+    """
+    chave = [""] * 26
+    for cifrada, clara in enumerate(decifra):
+        chave[clara] = ALFABETO[cifrada]
+    return "".join(chave)
+
+def quebrar_recomeco(texto_cifrado, idioma="pt", semente=None):
+    """
+    Um recomeço do solucionador: chave inicial pela ordem de frequência, com
+    ruído da `semente`, subida com a nota de bigramas e refinamento com
+    quadgramas. Devolve (nota, chave); a nota é
+    a de quadgramas, comparável entre recomeços do mesmo texto.
+
+    Roda em outros processos, cujas medições o painel não vê: o tempo é
+    medido na página, em volta da busca inteira (substituicao.quebrar).
+    """
+    codigos = letras_cifradas(texto_cifrado)
+    if len(codigos) < 4:
+        raise ValueError("O texto cifrado precisa ter pelo menos quatro letras.")
+    aleatorio = random.Random(semente)
+    logp = tabela_bigramas(idioma)
+    linhas, colunas, contagens = pares_do_texto(codigos)
+
+    # Começa da ordem de frequência: a letra cifrada mais comum vira a mais
+    # comum do idioma, e assim por diante, com um pouco de ruído
+    frequencias_texto = np.bincount(codigos, minlength=26)
+    frequencias_lingua = np.array([sum(10 ** p for p in linha) for linha in logp])
+    ordem_texto = sorted(range(26), key=lambda a: -frequencias_texto[a] + aleatorio.random() * 2)
+    ordem_lingua = sorted(range(26), key=lambda a: -frequencias_lingua[a])
+    decifra = [0] * 26
+    for cifrada, clara in zip(ordem_texto, ordem_lingua):
+        decifra[cifrada] = clara
+    for _ in range(aleatorio.randint(0, 6)):
+        x, y = aleatorio.randrange(26), aleatorio.randrange(26)
+        decifra[x], decifra[y] = decifra[y], decifra[x]
+
+    subir_bigramas(decifra, linhas, colunas, contagens, logp, aleatorio)
+    decifra, nota = refinar_quadgramas(decifra, codigos, pontuador(idioma))
+    return nota, chave_de_decifra(decifra)
+
+def quebrar_substituicao(texto_cifrado, idioma="pt", recomecos=8, semente=None):
+    """
+    Solucionador sem processos extras: vários recomeços seguidos, fica com a
+    chave de maior nota. Devolve (nota, chave).
+    """
+    aleatorio = random.Random(semente)
+    return max(
+        quebrar_recomeco(texto_cifrado, idioma, aleatorio.getrandbits(32))
+        for _ in range(recomecos)
+    )
@@ -0,0 +1,39 @@
+# educasec/vigenere.py
+# Cifra de Vigenère: cada letra é deslocada pela letra correspondente da chave,
+# que se repete ao longo do texto (só as letras do texto consomem a chave).
+
+def deslocamentos(chave):
+    """
+    Converte a chave em uma lista de deslocamentos (a=0, b=1, ..., z=25).
+    """
+    return [(ord(letra.lower()) - ord('a')) % 26 for letra in chave]
+
+def criptografar_vigenere(texto, chave, posicao=0, sentido=1):
+    """
+    Criptografa o texto com a chave. `posicao` indica qual letra da chave é
+    usada primeiro (útil para continuar um texto dividido em blocos) e
+    `sentido=-1` decriptografa.
+
+    Retorna o texto e a posição da chave onde o próximo bloco deve começar.
+    """
+    if not chave:
+        raise ValueError("A chave não pode ser vazia.")
+    shifts = [sentido * shift for shift in deslocamentos(chave)]
+    tamanho = len(shifts)
+    resultado = []
+    for char in texto:
+        if 'a' <= char <= 'z':
+            resultado.append(chr((ord(char) - ord('a') + shifts[posicao]) % 26 + ord('a')))
+            posicao = (posicao + 1) % tamanho
+        elif 'A' <= char <= 'Z':
+            resultado.append(chr((ord(char) - ord('A') + shifts[posicao]) % 26 + ord('A')))
+            posicao = (posicao + 1) % tamanho
+        else:
+            resultado.append(char)
+    return "".join(resultado), posicao
+
+def decriptografar_vigenere(texto, chave, posicao=0):
+    """
+    Desfaz a cifra de Vigenère. Retorna o texto e a próxima posição da chave.
+    """
+    return criptografar_vigenere(texto, chave, posicao, sentido=-1)
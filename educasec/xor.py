@@ -0,0 +1,137 @@
+# educasec/xor.py
+# Cifra XOR e one-time pad (cifra de uso único) para arquivos de qualquer tamanho.
+#
+# Cada byte da mensagem é combinado com um byte da chave pela operação XOR.
+# Com uma chave aleatória do tamanho da mensagem, usada uma única vez, a
+# cifra é perfeitamente segura (one-time pad); com uma chave curta repetida,
+# ou com a mesma chave usada em duas mensagens, ela é fácil de quebrar.
+#
+# Os arquivos são processados em blocos de tamanho fixo: os dados são lidos
+# com readinto() direto em um buffer reaproveitado, o XOR é feito no próprio
+# buffer (np.bitwise_xor com out=) e o resultado é escrito a partir de uma
+# memoryview, sem cópias intermediárias.
+#
+#   from educasec.xor import xor_fluxo
+#
+#   with open("foto.jpg", "rb") as dados, open("chave.bin", "rb") as chave, \
+#        open("foto.xor", "wb") as saida:
+#       xor_fluxo(dados, chave, saida)
+import os
+import string
+
+import numpy as np
+
+# Tamanho dos blocos lidos dos arquivos
+TAMANHO_BLOCO = 1 << 20
+
+# Caracteres considerados "legíveis" na demonstração de reuso da chave; entre
+# os trechos legíveis, os com mais letras e espaços aparecem primeiro
+LEGIVEIS = np.frombuffer((string.ascii_letters + string.digits + " .,;:!?'\"-()\n").encode(), dtype=np.uint8)
+LETRAS_ESPACO = np.frombuffer((string.ascii_letters + " ").encode(), dtype=np.uint8)
+
+def _ler_completo(arquivo, visao):
+    """
+    Preenche a memoryview com readinto(), repetindo a leitura se o arquivo
+    devolver menos bytes (pipes, sockets). Devolve quantos bytes foram lidos.
+    """
+    lidos = 0
+    while lidos < len(visao):
+        n = arquivo.readinto(visao[lidos:])
+        if not n:
+            break
+        lidos += n
+    return lidos
+
+def xor_fluxo(entrada, chave, saida, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Aplica o XOR da entrada com a chave e escreve na saída, bloco a bloco.
+
+    `chave` pode ser um arquivo binário (one-time pad: precisa ter pelo menos
+    o tamanho da entrada) ou bytes, que são repetidos ao longo da entrada.
+    Cifrar e decifrar são a mesma operação. Devolve o número de bytes
+    processados.
+    """
+    dados = bytearray(tamanho_bloco)
+    visao = memoryview(dados)
+    vetor = np.frombuffer(dados, dtype=np.uint8)
+
+    if isinstance(chave, (bytes, bytearray, memoryview)):
+        if not len(chave):
+            raise ValueError("A chave não pode ser vazia.")
+        # Chave repetida até cobrir um bloco inteiro em qualquer deslocamento:
+        # cada bloco usa uma fatia (sem cópia) deste vetor. Repetir os bytes é
+        # uma cópia de memória, bem mais rápido que np.resize.
+        repetida = np.frombuffer(bytes(chave) * (tamanho_bloco // len(chave) + 2), dtype=np.uint8)
+        periodo = len(chave)
+        arquivo_chave = None
+    else:
+        buffer_chave = bytearray(tamanho_bloco)
+        visao_chave = memoryview(buffer_chave)
+        vetor_chave = np.frombuffer(buffer_chave, dtype=np.uint8)
+        arquivo_chave = chave
+
+    total = 0
+    while True:
+        n = _ler_completo(entrada, visao)
+        if not n:
+            break
+        if arquivo_chave is None:
+            inicio = total % periodo
+            fatia_chave = repetida[inicio:inicio + n]
+        else:
+            if _ler_completo(arquivo_chave, visao_chave[:n]) < n:
+                raise ValueError("A chave é mais curta que a mensagem: um one-time pad precisa de "
+                                 "pelo menos um byte de chave para cada byte da mensagem.")
+            fatia_chave = vetor_chave[:n]
+        np.bitwise_xor(vetor[:n], fatia_chave, out=vetor[:n])
+        saida.write(visao[:n])
+        total += n
+    return total
+
+def gerar_chave_fluxo(saida, tamanho, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Escreve `tamanho` bytes aleatórios (os.urandom) na saída, em blocos.
+    """
+    restante = tamanho
+    while restante > 0:
+        n = min(tamanho_bloco, restante)
+        saida.write(os.urandom(n))
+        restante -= n
+
+def xor_bytes(dados, chave):
+    """
+    XOR de dois blocos de bytes na memória (a chave é repetida se for menor).
+    """
+    if not len(chave):
+        raise ValueError("A chave não pode ser vazia.")
+    vetor = np.frombuffer(dados, dtype=np.uint8)
+    vetor_chave = np.frombuffer(bytes(chave) * (len(vetor) // len(chave) + 1), dtype=np.uint8)[:len(vetor)]
+    return np.bitwise_xor(vetor, vetor_chave).tobytes()
+
+# --- Ataque ao reuso da chave ---
+
+def arrastar_palpite(xor_mensagens, palpite, minimo_legiveis=1.0):
+    """
+    "Arrasta" um palpite (uma palavra que deve estar em uma das mensagens)
+    por todas as posições do XOR das duas mensagens cifradas com a mesma
+    chave. Onde o palpite está certo, o resultado é um trecho legível da
+    outra mensagem. Devolve a lista de (posição, trecho revelado) cuja fração
+    de caracteres legíveis é pelo menos `minimo_legiveis`, dos trechos mais
+    parecidos com texto para os menos parecidos.
+    """
+    palpite = palpite.encode("utf-8") if isinstance(palpite, str) else palpite
+    tamanho = len(palpite)
+    if not tamanho or tamanho > len(xor_mensagens):
+        return []
+    xor = np.frombuffer(xor_mensagens, dtype=np.uint8)
+    # Todas as janelas do tamanho do palpite de uma vez (visão sem cópia)
+    janelas = np.lib.stride_tricks.sliding_window_view(xor, tamanho)
+    reveladas = np.bitwise_xor(janelas, np.frombuffer(palpite, dtype=np.uint8))
+    legiveis = np.isin(reveladas, LEGIVEIS).mean(axis=1)
+    parecidos = np.isin(reveladas, LETRAS_ESPACO).mean(axis=1)
+    posicoes = np.flatnonzero(legiveis >= minimo_legiveis)
+    posicoes = posicoes[np.argsort(-parecidos[posicoes], kind="stable")]
+    return [
+        (int(posicao), reveladas[posicao].tobytes().decode("utf-8", "replace"))
+        for posicao in posicoes
+    ]
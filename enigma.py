@@ -1,121 +1,7 @@
 import streamlit as st
 
-# Mapeamentos de fiação (wiring) para os rotores e o refletor
-# A-Z -> outro caractere
-ROTOR_WIRING = {
-    "I":   "EKMFLGDQVZNTOWYHXUSPAIBRCJ",
-    "II":  "AJDKSIRUXBLHWTMCQGZNPYFVOE",
-    "III": "BDFHJLCPRTXVZNYEIWGAKMUSQO",
-    "IV":  "ESOVPZJAYQUIRXHMCTPNFVWKBL",
-    "V":   "VZBRGITYUPSDNHLXAWMJQOFECK"
-}
-
-# A-Z -> outro caractere
-REFLECTOR_WIRING = {
-    "B": "YRUHQSLDPXNGOKMIEBFZCWVJAT"
-}
-
-# Posições dos entalhes (notch) para o movimento do próximo rotor
-# O rotor avança o próximo quando ele próprio atinge o entalhe
-ROTOR_NOTCHES = {
-    "I":   "Q",
-    "II":  "E",
-    "III": "V",
-    "IV":  "J",
-    "V":   "Z"
-}
-
-class Rotor:
-    """
-    Representa um rotor da máquina Enigma.
-    """
-    def __init__(self, wiring, notch, position):
-        self.wiring = wiring
-        self.notch = notch
-        self.position = ord(position.upper()) - ord('A')
-        self.forward_map = {chr(i + ord('A')): self.wiring[i] for i in range(26)}
-        self.backward_map = {self.wiring[i]: chr(i + ord('A')) for i in range(26)}
-
-    def rotate(self):
-        """
-        Gira o rotor em uma posição.
-        """
-        self.position = (self.position + 1) % 26
-        return self.position_char() == self.notch
-
-    def position_char(self):
-        """
-        Retorna a letra da posição atual do rotor.
-        """
-        return chr(self.position + ord('A'))
-
-    def encrypt_forward(self, char):
-        """
-        Criptografa um caractere na direção de entrada do rotor.
-        """
-        idx = (ord(char) - ord('A') + self.position) % 26
-        encrypted_char = self.forward_map[chr(idx + ord('A'))]
-        return chr((ord(encrypted_char) - ord('A') - self.position + 26) % 26 + ord('A'))
-
-    def encrypt_backward(self, char):
-        """
-        Criptografa um caractere na direção de saída do rotor.
-        """
-        idx = (ord(char) - ord('A') + self.position) % 26
-        encrypted_char = self.backward_map[chr(idx + ord('A'))]
-        return chr((ord(encrypted_char) - ord('A') - self.position + 26) % 26 + ord('A'))
-
-class Reflector:
-    """
-    Representa o refletor da máquina Enigma.
-    """
-    def __init__(self, wiring):
-        self.wiring = wiring
-        self.map = {chr(i + ord('A')): self.wiring[i] for i in range(26)}
-
-    def reflect(self, char):
-        """
-        Reflete um caractere.
-        """
-        return self.map[char]
-
-class EnigmaMachine:
-    """
-    Simula a máquina Enigma completa.
-    """
-    def __init__(self, rotor1_type, rotor2_type, rotor3_type, pos1, pos2, pos3):
-        self.rotor1 = Rotor(ROTOR_WIRING[rotor1_type], ROTOR_NOTCHES[rotor1_type], pos1)
-        self.rotor2 = Rotor(ROTOR_WIRING[rotor2_type], ROTOR_NOTCHES[rotor2_type], pos2)
-        self.rotor3 = Rotor(ROTOR_WIRING[rotor3_type], ROTOR_NOTCHES[rotor3_type], pos3)
-        self.reflector = Reflector(REFLECTOR_WIRING["B"])
-
-    def encrypt_char(self, char):
-        """
-        Criptografa um único caractere.
-        """
-        # Rotaciona os rotores
-        # O rotor 1 sempre gira
-        should_rotate2 = self.rotor1.rotate()
-        # O rotor 2 gira se o rotor 1 atingir o entalhe
-        should_rotate3 = should_rotate2 and self.rotor2.rotate()
-        # O rotor 3 gira se o rotor 2 atingir o entalhe
-        if should_rotate3:
-            self.rotor3.rotate()
-        
-        # O sinal passa pelos rotores (da direita para a esquerda)
-        encrypted = self.rotor1.encrypt_forward(char)
-        encrypted = self.rotor2.encrypt_forward(encrypted)
-        encrypted = self.rotor3.encrypt_forward(encrypted)
-
-        # O sinal é refletido
-        encrypted = self.reflector.reflect(encrypted)
-
-        # O sinal volta pelos rotores (da esquerda para a direita)
-        encrypted = self.rotor3.encrypt_backward(encrypted)
-        encrypted = self.rotor2.encrypt_backward(encrypted)
-        encrypted = self.rotor1.encrypt_backward(encrypted)
-        
-        return encrypted
+import sessao
+from educasec.enigma import ROTOR_WIRING, EnigmaMachine, limpar_texto, criptografar_enigma
 
 def app():
     """
@@ -166,7 +52,7 @@ def app():
     if st.button("Criptografar"):
         if texto_entrada:
             # Converte para maiúsculas e remove caracteres não alfabéticos
-            texto_limpo = ''.join(filter(str.isalpha, texto_entrada.upper()))
+            texto_limpo = limpar_texto(texto_entrada)
 
             if not texto_limpo:
                 st.warning("Por favor, digite pelo menos uma letra para criptografar.")
@@ -175,10 +61,12 @@ def app():
                     # Instancia a máquina Enigma com as configurações do usuário
                     enigma = EnigmaMachine(rotor1_choice, rotor2_choice, rotor3_choice, pos1_choice, pos2_choice, pos3_choice)
                     
-                    texto_saida = ""
-                    for char in texto_limpo:
-                        texto_saida += enigma.encrypt_char(char)
-                    
+                    texto_saida = criptografar_enigma(enigma, texto_limpo)
+
+                    # Disponível para a página de Análise de Frequência
+                    sessao.guardar("ultima_saida", texto_saida, descartavel=True)
+                    st.session_state["ultima_saida_origem"] = "Enigma"
+
                     st.subheader("Mensagem Criptografada")
                     st.success(texto_saida)
                 except KeyError:
@@ -0,0 +1,154 @@
+import streamlit as st
+
+import sessao
+from educasec import perf
+
+try:
+    from educasec.frequencia import (
+        ALFABETO, TAMANHO_BLOCO, Histogramas, analisar_fluxo, deslocamento_provavel, referencia
+    )
+    from educasec.quadgram import IDIOMAS
+except ImportError:
+    st.error("❌ Esta página requer o numpy. Instale com: pip install numpy")
+    st.stop()
+
+# Durante a leitura de um arquivo, o gráfico é redesenhado a cada tantos blocos
+BLOCOS_POR_ATUALIZACAO = 16
+
+FONTE_SAIDA = "📤 Saída da última cifra"
+FONTE_TEXTO = "⌨️ Digitar texto"
+FONTE_ARQUIVO = "📁 Enviar arquivo"
+
+def grafico_letras(histogramas, idioma):
+    """
+    Frequência de cada letra no texto comparada com a do idioma (em %).
+    """
+    st.bar_chart(
+        {
+            "Letra": list(ALFABETO),
+            "Texto": (histogramas.frequencias() * 100).round(2).tolist(),
+            IDIOMAS[idioma]: (referencia(idioma).frequencias() * 100).round(2).tolist(),
+        },
+        x="Letra",
+        y=["Texto", IDIOMAS[idioma]],
+        y_label="%",
+        stack=False,
+    )
+
+def tabela_ngramas(histogramas, idioma, tamanho):
+    """
+    Os n-gramas mais comuns do texto ao lado dos mais comuns do idioma.
+    """
+    do_texto = histogramas.mais_comuns(tamanho)
+    da_lingua = referencia(idioma).mais_comuns(tamanho)
+    total = max(1, histogramas.total - tamanho + 1)
+    st.dataframe(
+        [
+            {
+                "Texto": ngrama,
+                "%": round(100 * contagem / total, 2),
+                IDIOMAS[idioma]: da_lingua[i][0] if i < len(da_lingua) else "",
+            }
+            for i, (ngrama, contagem) in enumerate(do_texto)
+        ],
+        hide_index=True,
+        use_container_width=True
+    )
+
+def analisar_arquivo(arquivo, idioma):
+    """
+    Lê o arquivo em blocos, mostrando o progresso e o gráfico parcial. A
+    memória usada pela análise não depende do tamanho do arquivo.
+    """
+    progresso = st.progress(0.0, text="Analisando o arquivo...")
+    parcial = st.empty()
+    histogramas = Histogramas()
+    with perf.medir("frequencia.arquivo"):
+        for numero, histogramas in enumerate(analisar_fluxo(arquivo, TAMANHO_BLOCO), start=1):
+            lidos = histogramas.bytes_lidos
+            progresso.progress(min(1.0, lidos / max(1, arquivo.size)),
+                               text=f"Analisando o arquivo... {sessao.formatar_bytes(lidos)} de {sessao.formatar_bytes(arquivo.size)}")
+            if numero % BLOCOS_POR_ATUALIZACAO == 0:
+                with parcial.container():
+                    grafico_letras(histogramas, idioma)
+    progresso.empty()
+    parcial.empty()
+    return histogramas
+
+# O código para a análise de frequência deve estar dentro de uma função.
+# A função será importada pelo arquivo principal (app.py).
+def app():
+    """
+    Exibe a página de Análise de Frequência.
+    """
+    st.title("📊 Análise de Frequência")
+    st.write(
+        "Em qualquer língua, algumas letras aparecem muito mais do que outras. Comparando as "
+        "frequências de um texto cifrado com as da língua, dá para descobrir a chave de cifras "
+        "simples como a de César e perceber quando uma cifra (como a de Vigenère ou a Enigma) "
+        "esconde bem essas pistas."
+    )
+    st.markdown("---")
+
+    col1, col2 = st.columns([2, 1])
+    with col1:
+        fonte = st.radio("Texto a analisar:", (FONTE_SAIDA, FONTE_TEXTO, FONTE_ARQUIVO), horizontal=True)
+    with col2:
+        idioma = st.selectbox("Comparar com:", list(IDIOMAS), format_func=IDIOMAS.get)
+
+    histogramas = None
+    if fonte == FONTE_SAIDA:
+        texto = sessao.ler("ultima_saida", "")
+        if texto:
+            st.caption(f"Resultado mais recente da página **{st.session_state.get('ultima_saida_origem', '?')}** "
+                       f"({len(texto)} caracteres).")
+            histogramas = Histogramas()
+            histogramas.adicionar(texto)
+        else:
+            st.info("Criptografe um texto nas páginas César, Vigenère ou Enigma e volte aqui.")
+    elif fonte == FONTE_TEXTO:
+        texto = st.text_area("Digite ou cole o texto:", height=150)
+        if texto:
+            histogramas = Histogramas()
+            histogramas.adicionar(texto)
+    else:
+        arquivo = st.file_uploader("Arquivo de texto (qualquer tamanho até o limite do servidor):")
+        if arquivo is not None:
+            # O resultado fica guardado: mudar o idioma ou as abas não lê o arquivo de novo
+            guardado = st.session_state.get("frequencia_arquivo")
+            if guardado is None or guardado[0] != arquivo.file_id:
+                arquivo.seek(0)
+                guardado = (arquivo.file_id, analisar_arquivo(arquivo, idioma))
+                st.session_state["frequencia_arquivo"] = guardado
+            histogramas = guardado[1]
+        else:
+            st.session_state.pop("frequencia_arquivo", None)
+
+    if histogramas is None:
+        return
+    if histogramas.total == 0:
+        st.warning("O texto não tem letras de A a Z para analisar.")
+        return
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Letras analisadas", f"{histogramas.total:,}".replace(",", "."))
+    with col2:
+        st.metric(
+            "Índice de coincidência", f"{histogramas.indice_coincidencia():.4f}",
+            help=f"{IDIOMAS[idioma]}: {referencia(idioma).indice_coincidencia():.4f}. "
+                 "Letras ao acaso: 0,0385. Valores baixos indicam uma cifra polialfabética."
+        )
+    with col3:
+        deslocamento, _ = deslocamento_provavel(histogramas, idioma)
+        st.metric("Chave de César provável", deslocamento,
+                  help="Deslocamento que melhor alinha as letras do texto com as do idioma.")
+
+    st.subheader("Letras")
+    grafico_letras(histogramas, idioma)
+
+    aba_bigramas, aba_trigramas = st.tabs(["Bigramas", "Trigramas"])
+    with aba_bigramas:
+        tabela_ngramas(histogramas, idioma, 2)
+    with aba_trigramas:
+        tabela_ngramas(histogramas, idioma, 3)
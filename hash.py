@@ -1,5 +1,7 @@
 import streamlit as st
-import hashlib
+
+from educasec import memo
+from educasec.hash import ALGORITMOS, gerar_hash
 
 def app():
     """
@@ -34,20 +36,13 @@ def app():
     # Seleção do algoritmo de hash
     algoritmo_hash = st.selectbox(
         "Selecione o algoritmo de hash:",
-        ("md5", "sha1", "sha256", "sha512")
+        ALGORITMOS
     )
     
     if st.button("Gerar Hash"):
         if texto_entrada:
-            # Codifica o texto para bytes (obrigatório para a biblioteca hashlib)
-            texto_bytes = texto_entrada.encode('utf-8')
-            
-            # Cria o objeto de hash e atualiza-o com o texto
-            hash_object = hashlib.new(algoritmo_hash)
-            hash_object.update(texto_bytes)
-            
-            # Obtém o hash em formato hexadecimal
-            hash_gerado = hash_object.hexdigest()
+            # Calcula o hash do texto (codificado em UTF-8) em formato hexadecimal
+            hash_gerado = memo.memorizar("hash", gerar_hash, texto_entrada, algoritmo_hash)
             
             st.subheader(f"Hash ({algoritmo_hash.upper()}) Gerado:")
             st.code(hash_gerado, language='text')
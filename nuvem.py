@@ -2,18 +2,391 @@
 # Este aplicativo requer as seguintes bibliotecas:
 # streamlit
 # wordcloud
-# matplotlib
-# spacy
+# spacy (opcional: sem ele, só o modo rápido fica disponível)
 # spacy.load("pt_core_news_sm") (modelo de idioma)
-# pip install streamlit wordcloud matplotlib spacy
+# pip install streamlit wordcloud spacy
 # python -m spacy download pt_core_news_sm
 
 import streamlit as st
+import matplotlib
+# O wordcloud importa o matplotlib (para os mapas de cores); fixamos o backend
+# Agg, sem janelas nem figuras interativas no servidor
+matplotlib.use("Agg")
 from wordcloud import WordCloud
-import matplotlib.pyplot as plt
-import spacy
 import re
 import io
+import os
+import sys
+import time
+import heapq
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from educasec import perf
+
+try:
+    import spacy
+except ImportError:
+    spacy = None
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Componentes do pipeline que a nuvem de palavras não usa. Só precisamos das
+# classes gramaticais (tok2vec + morphologizer + attribute_ruler) e da lista
+# de stop words, que não depende do pipeline.
+COMPONENTES_EXCLUIDOS = ["parser", "ner", "lemmatizer", "senter"]
+
+# Classes gramaticais removidas da nuvem (verbos, conjunções, preposições e pronomes)
+CLASSES_IGNORADAS = frozenset(["VERB", "CCONJ", "SCONJ", "ADP", "PRON"])
+
+# Remove pontuação e caracteres especiais
+PONTUACAO = re.compile(r'[^\w\s]')
+
+# Tamanho (em caracteres) de cada bloco de texto enviado ao spaCy no modo corpus
+TAMANHO_BLOCO = 20_000
+
+# Quantidade máxima de palavras desenhadas na nuvem
+PALAVRAS_NA_NUVEM = 200
+
+# Modos de análise do texto
+MODO_RAPIDO = "⚡ Rápido"
+MODO_PRECISO = "🎯 Preciso (spaCy)"
+
+# Modo rápido: uma palavra é uma sequência de letras (qualquer alfabeto, com acentos)
+PALAVRA = re.compile(r'[^\W\d_]+')
+
+# Modo rápido: palavras comuns do português (artigos, preposições, pronomes,
+# conjunções, advérbios e formas dos verbos auxiliares)
+STOP_WORDS_PT = frozenset("""
+a à ao aos aquela aquelas aquele aqueles aquilo as às até com como contra da daquela
+daquele das de dela delas dele deles depois desde dessa desse desta deste do dos e é
+ela elas ele eles em embora enquanto entre era eram essa essas esse esses esta está
+estão estas estava estavam este estes estou eu foi fomos for foram fosse fossem fui
+há havia isso isto já la lá lhe lhes lo mais mas me mesma mesmo meu meus minha minhas
+muita muitas muito muitos na não nas nem nenhum nessa nesse nesta neste no nos nós
+nossa nossas nosso nossos num numa o onde os ou para pela pelas pelo pelos perante
+pois por porque porém qual quais quando quanto que quem se seja sejam sem sempre ser
+será seu seus si sido só sob sobre sua suas são também tão te tem têm tinha tinham
+toda todas todo todos tu tua tuas teu teus um uma umas uns vai vão você vocês vos
+aqui ali então ainda agora apenas cada outra outras outro outros tudo nada algo
+alguém algum alguma algumas alguns ter tenho temos sou somos vou vamos pode podem
+""".split())
+
+# Modo rápido: terminações típicas de verbos (infinitivo, gerúndio e tempos comuns)
+SUFIXOS_VERBAIS = (
+    "ando", "endo", "indo",
+    "aram", "eram", "iram", "avam", "iam",
+    "ariam", "eriam", "iriam", "aria", "eria", "iria",
+    "ava", "ou",
+    "ar", "er", "ir"
+)
+
+# Palavras e terminações que parecem verbos, mas quase sempre são nomes ou adjetivos
+NAO_VERBOS = frozenset([
+    "lugar", "mulher", "colher", "açúcar", "prazer", "poder", "dever", "olhar",
+    "jantar", "militar", "familiar", "quando", "comando", "lindo", "mundo",
+    "computador", "professor", "senhor", "valor", "amor", "exterior", "interior"
+])
+SUFIXOS_NAO_VERBAIS = ("ular", "iliar", "ilar")
+
+# Quantas nuvens podem ser desenhadas ao mesmo tempo no servidor; os demais
+# pedidos esperam na fila em vez de disputar a CPU
+TRABALHADORES_RENDERIZACAO = 2
+
+class SpaceSaving:
+    """
+    Contador aproximado das palavras mais frequentes (algoritmo Space-Saving).
+    Guarda no máximo `capacidade` palavras, então a memória não cresce com o
+    tamanho do corpus. Quando uma palavra nova chega e não há espaço, ela
+    substitui a menos frequente e herda a contagem dela (o erro máximo da
+    estimativa fica guardado em `erros`).
+    """
+    def __init__(self, capacidade):
+        self.capacidade = capacidade
+        self.contagens = {}
+        self.erros = {}
+        self.total = 0
+        # Heap de (contagem, palavra); entradas desatualizadas são descartadas ao sair
+        self._heap = []
+
+    def adicionar(self, palavra, quantidade=1):
+        """
+        Soma `quantidade` ocorrências da palavra.
+        """
+        self.total += quantidade
+        contagens = self.contagens
+        if palavra in contagens:
+            contagens[palavra] += quantidade
+        elif len(contagens) < self.capacidade:
+            contagens[palavra] = quantidade
+            self.erros[palavra] = 0
+        else:
+            menor_palavra, menor_contagem = self._retirar_menor()
+            del contagens[menor_palavra]
+            del self.erros[menor_palavra]
+            contagens[palavra] = menor_contagem + quantidade
+            self.erros[palavra] = menor_contagem
+        heapq.heappush(self._heap, (contagens[palavra], palavra))
+        if len(self._heap) > 4 * self.capacidade:
+            self._reconstruir_heap()
+
+    def atualizar(self, frequencias):
+        """
+        Soma uma tabela de frequências (por exemplo, a contagem de um bloco).
+        """
+        for palavra, quantidade in frequencias.items():
+            self.adicionar(palavra, quantidade)
+
+    def _retirar_menor(self):
+        while True:
+            contagem, palavra = heapq.heappop(self._heap)
+            if self.contagens.get(palavra) == contagem:
+                return palavra, contagem
+
+    def _reconstruir_heap(self):
+        self._heap = [(contagem, palavra) for palavra, contagem in self.contagens.items()]
+        heapq.heapify(self._heap)
+
+    def mais_frequentes(self, quantidade):
+        """
+        Retorna as `quantidade` palavras com maior contagem estimada.
+        """
+        return heapq.nlargest(quantidade, self.contagens.items(), key=lambda item: item[1])
+
+def memoria_residente_mb():
+    """
+    Retorna a memória residente (RSS) do processo em MB, ou None se não for
+    possível medir neste sistema.
+    """
+    try:
+        with open("/proc/self/statm") as f:
+            paginas = int(f.read().split()[1])
+        return paginas * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # Sem /proc, usa o pico de memória (ru_maxrss: bytes no macOS, KB nos demais)
+        pico = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return pico / (1024 * 1024) if sys.platform == "darwin" else pico / 1024
+    return None
+
+@st.cache_resource(show_spinner="Carregando o modelo de idioma. Isso pode levar alguns segundos...")
+def carregar_modelo():
+    """
+    Carrega o modelo 'pt_core_news_sm' uma única vez por processo do servidor.
+    O mesmo objeto é compartilhado (somente leitura) por todas as sessões.
+    Retorna (nlp, segundos_para_carregar, MB_de_memoria_adicionados).
+    """
+    memoria_antes = memoria_residente_mb()
+    inicio = time.perf_counter()
+    nlp = spacy.load("pt_core_news_sm", exclude=COMPONENTES_EXCLUIDOS)
+    tempo_carga = time.perf_counter() - inicio
+    memoria_depois = memoria_residente_mb()
+    memoria_modelo = None
+    if memoria_antes is not None and memoria_depois is not None:
+        memoria_modelo = memoria_depois - memoria_antes
+    return nlp, tempo_carga, memoria_modelo
+
+def contar_palavras(doc, stop_words):
+    """
+    Conta as palavras-chave diretamente nos tokens do Doc do spaCy, sem
+    juntar o texto de novo para o WordCloud tokenizar e contar outra vez.
+    """
+    return Counter(
+        token.text for token in doc
+        if token.pos_ not in CLASSES_IGNORADAS
+        and token.text not in stop_words
+        and len(token.text) > 2  # Remove palavras muito curtas
+    )
+
+@st.cache_resource
+def executor_renderizacao():
+    """
+    Fila de renderização compartilhada pelo processo, com um número fixo de
+    threads (TRABALHADORES_RENDERIZACAO).
+    """
+    return ThreadPoolExecutor(
+        max_workers=TRABALHADORES_RENDERIZACAO,
+        thread_name_prefix="nuvem-render"
+    )
+
+@perf.medido("nuvem.wordcloud")
+def gerar_png_nuvem(frequencias):
+    """
+    Desenha a nuvem e retorna os bytes PNG. Usa a imagem PIL do próprio
+    WordCloud, sem criar figuras do Matplotlib, e fecha a imagem logo após
+    salvar para liberar o buffer de pixels.
+    """
+    wordcloud = WordCloud(
+        width=800,
+        height=400,
+        background_color='white'
+    ).generate_from_frequencies(frequencias)
+
+    with io.BytesIO() as buf:
+        with wordcloud.to_image() as imagem:
+            imagem.save(buf, format="PNG")
+        return buf.getvalue()
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def renderizar_nuvem(frequencias):
+    """
+    Gera a imagem PNG da nuvem a partir da tabela de frequências
+    (tupla ordenada de pares (palavra, contagem)). O desenho roda na fila
+    de renderização; tabelas iguais reaproveitam a imagem já gerada.
+    """
+    # O desenho é medido na thread da fila, com o rótulo da sessão que pediu
+    return executor_renderizacao().submit(perf.propagar(gerar_png_nuvem), dict(frequencias)).result()
+
+def parece_verbo(palavra):
+    """
+    Heurística do modo rápido: decide pela terminação se a palavra é um verbo.
+    """
+    return (
+        len(palavra) > 3
+        and palavra.endswith(SUFIXOS_VERBAIS)
+        and not palavra.endswith(SUFIXOS_NAO_VERBAIS)
+        and palavra not in NAO_VERBOS
+    )
+
+@perf.medido("nuvem.contagem_rapida")
+def contar_palavras_rapido(texto):
+    """
+    Conta as palavras-chave sem o spaCy: expressão regular para separar as
+    palavras, lista fixa de stop words e heurística de sufixos para verbos.
+    """
+    return Counter(
+        palavra for palavra in PALAVRA.findall(texto.lower())
+        if len(palavra) > 2
+        and palavra not in STOP_WORDS_PT
+        and not parece_verbo(palavra)
+    )
+
+def normalizar_texto(texto):
+    """
+    Converte para minúsculas e remove caracteres especiais.
+    """
+    return PONTUACAO.sub('', texto.lower())
+
+def ler_blocos(arquivo, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê o arquivo enviado aos poucos e produz pares (bloco_normalizado, bytes_lidos).
+    Cada bloco termina no último fim de linha; se não houver um perto do fim
+    (arquivo sem quebras de linha), no último espaço; se nem isso, o texto é
+    cortado no tamanho do bloco. Assim nenhum bloco passa de 2 × tamanho_bloco
+    caracteres, qualquer que seja o arquivo.
+    """
+    texto = io.TextIOWrapper(arquivo, encoding='utf-8', errors='ignore')
+    resto = ''
+    while True:
+        parte = texto.read(tamanho_bloco)
+        if not parte:
+            break
+        bloco = resto + parte
+        # O que sobra para o próximo bloco nunca passa de tamanho_bloco
+        limite = max(0, len(bloco) - tamanho_bloco)
+        corte = bloco.rfind('\n', limite) + 1
+        if not corte:
+            corte = max(bloco.rfind(espaco, limite) for espaco in ' \t\r\f\v') + 1
+        if not corte:
+            corte = len(bloco)
+        bloco, resto = bloco[:corte], bloco[corte:]
+        yield normalizar_texto(bloco), arquivo.tell()
+    if resto:
+        yield normalizar_texto(resto), arquivo.tell()
+    texto.detach()
+
+def exibir_nuvem(frequencias):
+    """
+    Renderiza a nuvem a partir das frequências e mostra o botão de download.
+    """
+    with st.spinner("Gerando nuvem de palavras..."):
+        imagem_png = renderizar_nuvem(tuple(sorted(frequencias.items())))
+
+        st.subheader("Sua Nuvem de Palavras")
+        st.image(imagem_png, use_container_width=True)
+        
+        # Botão para baixar a imagem
+        st.download_button(
+            label="Baixar Nuvem de Palavras",
+            data=imagem_png,
+            file_name="nuvem_de_palavras.png",
+            mime="image/png"
+        )
+
+def nuvem_de_corpus(nlp):
+    """
+    Modo para textos grandes (livros, fóruns inteiros): o arquivo é lido em
+    blocos, processado em lote pelo spaCy (nlp.pipe) ou pelo modo rápido
+    (quando nlp é None) e as frequências são acumuladas em um contador de
+    tamanho fixo (Space-Saving).
+    """
+    st.write("""
+    Envie um arquivo de texto grande. Ele será processado em blocos, e apenas as palavras
+    mais frequentes ficam guardadas na memória, não importa o tamanho do arquivo.
+    """)
+
+    arquivo = st.file_uploader("Arquivo de texto (.txt):", type=['txt'])
+
+    col1, col2 = st.columns(2)
+    with col1:
+        processos = 1
+        if nlp is not None:
+            nucleos = os.cpu_count() or 1
+            processos = st.slider("Processos do spaCy:", min_value=1, max_value=max(nucleos, 2), value=1,
+                                  help="Mais processos aceleram arquivos grandes, mas cada um carrega uma cópia do modelo")
+    with col2:
+        capacidade = st.slider("Palavras acompanhadas (top-K):", min_value=500, max_value=20000, value=5000, step=500,
+                               help="Quantas palavras distintas o contador guarda ao mesmo tempo")
+
+    if st.button("Gerar Nuvem do Corpus"):
+        if arquivo is None:
+            st.warning("Por favor, envie um arquivo de texto.")
+            return
+
+        contador = SpaceSaving(capacidade)
+        barra = st.progress(0.0, text="Contando palavras...")
+        inicio = time.perf_counter()
+        tamanho_total = max(arquivo.size, 1)
+        arquivo.seek(0)
+
+        if nlp is not None:
+            docs = nlp.pipe(ler_blocos(arquivo), as_tuples=True, batch_size=8, n_process=processos)
+            contagens = (
+                (contar_palavras(doc, nlp.Defaults.stop_words), bytes_lidos)
+                for doc, bytes_lidos in docs
+            )
+        else:
+            contagens = (
+                (contar_palavras_rapido(bloco), bytes_lidos)
+                for bloco, bytes_lidos in ler_blocos(arquivo)
+            )
+
+        with perf.medir("nuvem.corpus"):
+            for frequencias_bloco, bytes_lidos in contagens:
+                contador.atualizar(frequencias_bloco)
+                barra.progress(
+                    min(bytes_lidos / tamanho_total, 1.0),
+                    text=f"Contando palavras... {bytes_lidos / (1024 * 1024):.1f} de {tamanho_total / (1024 * 1024):.1f} MB"
+                )
+
+        tempo = time.perf_counter() - inicio
+        barra.progress(1.0, text="Contagem concluída!")
+        st.info(
+            f"**{contador.total:,}** palavras-chave contadas em {tempo:.1f} s "
+            f"({tamanho_total / (1024 * 1024) / tempo:.2f} MB/s), "
+            f"acompanhando no máximo {capacidade:,} palavras distintas.".replace(",", ".")
+        )
+
+        frequencias = dict(contador.mais_frequentes(PALAVRAS_NA_NUVEM))
+        if not frequencias:
+            st.warning("O texto não contém palavras-chave suficientes para gerar uma nuvem.")
+            return
+
+        exibir_nuvem(frequencias)
 
 def app():
     """
@@ -31,20 +404,48 @@ def app():
     """)
     st.markdown("---")
 
-    # Carregar modelo spaCy
-    try:
-        nlp = st.session_state.get('nlp')
-        if not nlp:
-            st.info("Carregando o modelo de idioma. Isso pode levar alguns segundos...")
-            nlp = spacy.load("pt_core_news_sm")
-            st.session_state['nlp'] = nlp
-            st.success("Modelo de idioma carregado com sucesso!")
-    except OSError:
-        st.warning("""
-        O modelo de idioma 'pt_core_news_sm' não foi encontrado.
-        Por favor, instale-o usando o seguinte comando no seu terminal:
-        `python -m spacy download pt_core_news_sm`
-        """)
+    modo_analise = st.radio(
+        "Modo de análise:",
+        [MODO_RAPIDO, MODO_PRECISO],
+        index=1 if spacy is not None else 0,
+        horizontal=True,
+        help="O modo rápido usa regras simples (lista de palavras comuns e terminações de verbos). "
+             "O modo preciso usa o spaCy para identificar a classe gramatical de cada palavra."
+    )
+
+    # Carregar modelo spaCy (compartilhado por todas as sessões)
+    nlp = None
+    if modo_analise == MODO_PRECISO:
+        if spacy is None:
+            st.warning("A biblioteca `spacy` não está instalada. Usando o modo rápido.")
+        else:
+            try:
+                nlp, tempo_carga, memoria_modelo = carregar_modelo()
+            except OSError:
+                st.warning("""
+                O modelo de idioma 'pt_core_news_sm' não foi encontrado. Usando o modo rápido.
+                Para o modo preciso, instale-o usando o seguinte comando no seu terminal:
+                `python -m spacy download pt_core_news_sm`
+                """)
+
+    if nlp is not None:
+        memoria_atual = memoria_residente_mb()
+        detalhes_memoria = ""
+        if memoria_modelo is not None:
+            detalhes_memoria = f" · +{memoria_modelo:.0f} MB ao carregar · processo usa {memoria_atual:.0f} MB"
+        st.caption(
+            f"🧠 Modelo de idioma compartilhado pelo servidor, carregado em {tempo_carga:.2f} s"
+            f"{detalhes_memoria} · componentes ativos: {', '.join(nlp.pipe_names)}"
+        )
+
+    modo = st.radio(
+        "Fonte do texto:",
+        ["✍️ Colar texto", "📚 Arquivo grande (corpus)"],
+        horizontal=True
+    )
+
+    if modo == "📚 Arquivo grande (corpus)":
+        nuvem_de_corpus(nlp)
         return
 
     # Entrada de texto do usuário
@@ -68,51 +469,22 @@ def app():
         if num_palavras > 500:
             st.warning("O seu texto excede o limite de 500 palavras. A nuvem será gerada com todas as palavras, mas considere um texto menor para melhores resultados.")
 
-        # Normalizar texto (minúsculas e remoção de caracteres especiais)
-        texto_normalizado = texto_entrada.lower()
-        texto_normalizado = re.sub(r'[^\w\s]', '', texto_normalizado)
+        if nlp is not None:
+            # Normalizar texto (minúsculas e remoção de caracteres especiais)
+            texto_normalizado = normalizar_texto(texto_entrada)
 
-        # Processar com spaCy
-        doc = nlp(texto_normalizado)
+            # Processar com spaCy
+            with perf.medir("nuvem.spacy"):
+                doc = nlp(texto_normalizado)
 
-        # Filtrar palavras indesejadas
-        palavras_filtradas = [
-            token.text for token in doc
-            if token.pos_ not in ["VERB", "CCONJ", "SCONJ", "ADP", "PRON"]
-            and token.text not in nlp.Defaults.stop_words
-            and len(token.text) > 2  # Remove palavras muito curtas
-        ]
+            # Contar as palavras-chave direto nos tokens
+            frequencias = contar_palavras(doc, nlp.Defaults.stop_words)
+        else:
+            frequencias = contar_palavras_rapido(texto_entrada)
 
-        # Juntar as palavras filtradas para a nuvem
-        texto_filtrado = " ".join(palavras_filtradas)
-
-        if not texto_filtrado.strip():
+        if not frequencias:
             st.warning("O texto não contém palavras-chave suficientes para gerar uma nuvem.")
             return
 
         # Gerar e exibir a nuvem de palavras
-        with st.spinner("Gerando nuvem de palavras..."):
-            wordcloud = WordCloud(
-                width=800,
-                height=400,
-                background_color='white',
-                collocations=False
-            ).generate(texto_filtrado)
-
-            st.subheader("Sua Nuvem de Palavras")
-            
-            # Exibir a imagem usando Matplotlib
-            fig, ax = plt.subplots(figsize=(10, 5))
-            ax.imshow(wordcloud, interpolation='bilinear')
-            ax.axis("off")
-            st.pyplot(fig)
-            
-            # Botão para baixar a imagem
-            buf = io.BytesIO()
-            fig.savefig(buf, format="png")
-            st.download_button(
-                label="Baixar Nuvem de Palavras",
-                data=buf,
-                file_name="nuvem_de_palavras.png",
-                mime="image/png"
-            )
+        exibir_nuvem(frequencias)
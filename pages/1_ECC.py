@@ -1,8 +1,10 @@
 import streamlit as st
-import secrets
-import hashlib
+import os
+import time
 from datetime import datetime
 
+from educasec import secp256k1
+
 # ==================== CONFIGURAÇÃO DA PÁGINA ====================
 st.set_page_config(
     page_title="Laboratório ECC",
@@ -63,34 +65,66 @@ st.markdown("""
 # ==================== FUNÇÕES ====================
 
 def gerar_chave_privada():
-    """Gera uma chave privada aleatória de 256 bits"""
-    return secrets.token_hex(32)
+    """Gera uma chave privada aleatória de 256 bits (1 ≤ d < n)"""
+    return f"{secp256k1.generate_private_key():064x}"
 
 def gerar_chave_publica(chave_privada):
-    """Simula geração de chave pública (educacional)"""
-    # Em produção, usaria secp256k1 real
-    return '04' + hashlib.sha256((chave_privada + 'pubkey').encode()).hexdigest() + \
-           hashlib.sha256((chave_privada + 'pubkey2').encode()).hexdigest()
+    """Calcula a chave pública Q = d · G na curva secp256k1 (formato 04 || x || y)"""
+    ponto = secp256k1.public_key(int(chave_privada, 16))
+    return secp256k1.encode_public_key(ponto)
 
 def gerar_endereco(chave_publica):
     """Simula geração de endereço Ethereum"""
-    # Hash Keccak-256 da chave pública
-    hash_pub = hashlib.sha256(chave_publica.encode()).hexdigest()
-    return '0x' + hash_pub[-40:]
+    # Hash da chave pública (SHA-256 no lugar do Keccak-256)
+    return secp256k1.address(chave_publica)
+
+def formatar_duracao(segundos):
+    """Formata uma duração em segundos de forma legível"""
+    if segundos < 60:
+        return f"{segundos:.1f} s"
+    if segundos < 3600:
+        return f"{segundos / 60:.1f} min"
+    if segundos < 86400:
+        return f"{segundos / 3600:.1f} h"
+    if segundos < 86400 * 365:
+        return f"{segundos / 86400:.1f} dias"
+    anos = segundos / (86400 * 365)
+    if anos < 1000:
+        return f"{anos:.1f} anos"
+    return f"{anos:.2e} anos"
 
 def assinar_mensagem(mensagem, chave_privada):
-    """Simula assinatura ECDSA (educacional)"""
-    # Em produção, usaria ECDSA real
-    msg_hash = hashlib.sha256(mensagem.encode()).hexdigest()
-    
-    r = hashlib.sha256((chave_privada + msg_hash + 'r').encode()).hexdigest()
-    s = hashlib.sha256((chave_privada + msg_hash + 's').encode()).hexdigest()
-    v = 27 + (int(r[0], 16) % 2)
+    """Assina a mensagem com ECDSA real (SHA-256) na curva secp256k1"""
+    r, s, recovery_id = secp256k1.sign(int(chave_privada, 16), mensagem)
+    v = 27 + recovery_id
     
-    return f"r: 0x{r}\ns: 0x{s}\nv: {v}"
+    return f"r: 0x{r:064x}\ns: 0x{s:064x}\nv: {v}"
+
+def ler_assinatura(assinatura):
+    """Lê o texto "r: 0x...\ns: 0x...\nv: ..." e retorna (r, s, v)"""
+    campos = {}
+    for linha in assinatura.strip().splitlines():
+        nome, _, valor = linha.partition(':')
+        campos[nome.strip()] = int(valor.strip(), 0)
+    return campos['r'], campos['s'], campos['v']
+
+def verificar_assinatura(mensagem, assinatura, chave_publica):
+    """Verifica a assinatura ECDSA calculando u1·G + u2·Q de uma só vez (Shamir + wNAF)"""
+    r, s, _ = ler_assinatura(assinatura)
+    ponto = secp256k1.decode_public_key(chave_publica)
+    return secp256k1.verify(ponto, mensagem, r, s)
+
+@st.cache_resource(show_spinner="Preparando a tabela de múltiplos de G...")
+def preparar_tabela_ponto_base():
+    """Constrói (uma vez por processo) a tabela de múltiplos do ponto base G"""
+    inicio = time.perf_counter()
+    tabela = secp256k1.base_point_table()
+    return len(tabela) * (len(tabela[0]) - 1), time.perf_counter() - inicio
 
 # ==================== INICIALIZAÇÃO DO STATE ====================
 
+pontos_tabela, tempo_tabela = preparar_tabela_ponto_base()
+
 if 'chave_privada' not in st.session_state:
     st.session_state.chave_privada = ''
 if 'chave_publica' not in st.session_state:
@@ -105,6 +139,8 @@ if 'mensagem' not in st.session_state:
     st.session_state.mensagem = ''
 if 'assinatura' not in st.session_state:
     st.session_state.assinatura = ''
+if 'resultado_verificacao' not in st.session_state:
+    st.session_state.resultado_verificacao = None
 
 # ==================== HEADER ====================
 
@@ -181,8 +217,10 @@ with col2:
         st.info("⭕ **2. Assinar Mensagem**\n\nAguardando passo 1")
 
 with col3:
-    if st.session_state.passo >= 2:
-        st.success("✅ **3. Verificar**\n\nValidar autenticidade")
+    if st.session_state.passo >= 3:
+        st.success("✅ **3. Verificar**\n\nAutenticidade verificada")
+    elif st.session_state.passo >= 2:
+        st.info("⭕ **3. Verificar**\n\nValidar autenticidade")
     else:
         st.info("⭕ **3. Verificar**\n\nAguardando passos anteriores")
 
@@ -206,8 +244,10 @@ if st.session_state.passo == 0:
     with col2:
         if st.button("⚡ Gerar Par de Chaves ECC", type="primary", use_container_width=True):
             with st.spinner("Gerando chaves..."):
+                inicio = time.perf_counter()
                 st.session_state.chave_privada = gerar_chave_privada()
                 st.session_state.chave_publica = gerar_chave_publica(st.session_state.chave_privada)
+                st.session_state.tempo_chave_publica = time.perf_counter() - inicio
                 st.session_state.endereco = gerar_endereco(st.session_state.chave_publica)
                 st.session_state.passo = 1
                 st.rerun()
@@ -245,6 +285,11 @@ elif st.session_state.passo >= 1:
     """, unsafe_allow_html=True)
     st.code(st.session_state.chave_publica, language=None)
     st.success("✅ **Pode compartilhar.** Derivada matematicamente da chave privada usando ECC.")
+    if 'tempo_chave_publica' in st.session_state:
+        st.caption(
+            f"⚡ Q = d · G calculado em {st.session_state.tempo_chave_publica * 1000:.2f} ms "
+            f"(tabela com {pontos_tabela} múltiplos de G, construída em {tempo_tabela * 1000:.0f} ms)"
+        )
     
     st.markdown("<br>", unsafe_allow_html=True)
     
@@ -279,6 +324,7 @@ elif st.session_state.passo >= 1:
             if mensagem_input:
                 st.session_state.mensagem = mensagem_input
                 st.session_state.assinatura = assinar_mensagem(mensagem_input, st.session_state.chave_privada)
+                st.session_state.resultado_verificacao = None
                 st.session_state.passo = 2
                 st.rerun()
             else:
@@ -291,6 +337,7 @@ elif st.session_state.passo >= 1:
             st.session_state.endereco = ''
             st.session_state.mensagem = ''
             st.session_state.assinatura = ''
+            st.session_state.resultado_verificacao = None
             st.session_state.passo = 0
             st.session_state.mostrar_privada = False
             st.rerun()
@@ -304,6 +351,150 @@ elif st.session_state.passo >= 1:
         ✅ Esta assinatura prova que você possui a chave privada, sem revelá-la!
         Qualquer um pode verificar usando apenas sua chave pública.
         """)
+        
+        # ÁREA DE VERIFICAÇÃO
+        st.markdown("---")
+        st.markdown("""
+        <div class='key-box public-key'>
+            <h3>✅ Verificar Assinatura</h3>
+        </div>
+        """, unsafe_allow_html=True)
+        st.write("""
+        O verificador usa apenas a **chave pública**, a mensagem e a assinatura (r, s).
+        Ele calcula u1 = z/s e u2 = r/s e confere se a coordenada x de **u1·G + u2·Q** é igual a r.
+        Experimente alterar a mensagem abaixo para ver a verificação falhar!
+        """)
+        
+        mensagem_verificar = st.text_area(
+            "Mensagem recebida:",
+            value=st.session_state.mensagem,
+            height=100
+        )
+        
+        if st.button("🔍 Verificar com a Chave Pública", use_container_width=True):
+            inicio = time.perf_counter()
+            valida = verificar_assinatura(
+                mensagem_verificar,
+                st.session_state.assinatura,
+                st.session_state.chave_publica
+            )
+            st.session_state.resultado_verificacao = (valida, time.perf_counter() - inicio)
+            st.session_state.passo = 3
+            st.rerun()
+        
+        if st.session_state.resultado_verificacao is not None:
+            valida, tempo_verificacao = st.session_state.resultado_verificacao
+            if valida:
+                st.success("✅ **Assinatura válida!** A mensagem é autêntica e não foi alterada.")
+            else:
+                st.error("❌ **Assinatura inválida!** A mensagem foi alterada ou a assinatura não corresponde à chave pública.")
+            st.caption(f"⚡ Verificado em {tempo_verificacao * 1000:.2f} ms com multiplicação simultânea (Shamir + wNAF)")
+
+# ==================== DESEMPENHO DA VERIFICAÇÃO ====================
+
+st.markdown("---")
+with st.expander("⚡ Desempenho da Verificação: Shamir, wNAF e Verificação em Lote"):
+    st.markdown("""
+    - **Ingênuo**: calcula u1·G e u2·Q separadamente, bit a bit (dobrar-e-somar), e soma os dois pontos.
+    - **Shamir + wNAF**: calcula u1·G + u2·Q de uma vez, compartilhando os dobros; a forma wNAF
+      reduz o número de somas (dígitos ímpares espaçados).
+    - **Lote**: combina todas as assinaturas com pesos aleatórios em uma única equação.
+      Uma assinatura falsa faz a equação falhar com probabilidade praticamente 1.
+    """)
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        quantidade = st.slider("Quantidade de assinaturas:", min_value=10, max_value=200, value=50, step=10)
+    with col2:
+        corromper = st.checkbox("Corromper uma das assinaturas", value=False)
+    
+    if st.button("⏱️ Medir Desempenho"):
+        with st.spinner("Gerando e verificando assinaturas..."):
+            assinaturas = secp256k1.sample_signatures(quantidade)
+            if corromper:
+                chave, msg, r, s, v = assinaturas[quantidade // 2]
+                assinaturas[quantidade // 2] = (chave, msg + " (alterada)", r, s, v)
+            resultados = secp256k1.benchmark_verification(assinaturas)
+        
+        tempo_ingenuo = resultados["Ingênuo (dobrar-e-somar)"][0]
+        linhas = []
+        for metodo, (tempo, valido) in resultados.items():
+            linhas.append({
+                "Método": metodo,
+                "Tempo total (ms)": f"{tempo * 1000:.1f}",
+                "ms por assinatura": f"{tempo * 1000 / quantidade:.2f}",
+                "Aceleração": f"{tempo_ingenuo / tempo:.1f}x",
+                "Resultado": "✅ todas válidas" if valido else "❌ alguma inválida"
+            })
+        st.dataframe(linhas, hide_index=True, use_container_width=True)
+        
+        if corromper:
+            st.info("💡 O lote só diz que *alguma* assinatura é inválida; para achar qual, verificamos uma a uma.")
+
+# ==================== ENDEREÇO PERSONALIZADO (VANITY) ====================
+
+with st.expander("🎯 Experimento: Endereço Personalizado (Vanity Address)"):
+    st.markdown("""
+    Quer um endereço que comece com **0xcafe**? Não existe atalho: é preciso testar chaves
+    até achar uma cujo endereço tenha o prefixo desejado. Cada dígito hexadecimal a mais
+    multiplica o trabalho por **16**. É exatamente por isso que descobrir uma chave privada
+    a partir de um endereço (256 bits!) é impossível na prática.
+    
+    Cada processo parte de uma chave aleatória **d** e caminha pela curva somando G
+    (P, P + G, P + 2G, ...) — uma soma de pontos é muito mais barata que uma multiplicação escalar.
+    """)
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        prefixo = st.text_input("Prefixo desejado (hex):", value="abc", max_chars=8).strip().lower()
+        if prefixo.startswith("0x"):
+            prefixo = prefixo[2:]
+    with col2:
+        nucleos = os.cpu_count() or 1
+        processos = st.slider("Processos:", min_value=1, max_value=max(nucleos, 2), value=min(nucleos, 4))
+    with col3:
+        tempo_maximo = st.slider("Tempo máximo (s):", min_value=5, max_value=120, value=30, step=5)
+    
+    if prefixo:
+        tentativas = secp256k1.expected_attempts(prefixo)
+        st.caption(f"Em média são necessárias **{tentativas:,}** chaves para um prefixo de {len(prefixo)} dígitos.".replace(",", "."))
+    
+    if st.button("🚀 Iniciar Busca"):
+        try:
+            progresso_barra = st.progress(0.0)
+            progresso_info = st.empty()
+            resultado = None
+            for progresso in secp256k1.vanity_search(prefixo, workers=processos, max_seconds=tempo_maximo):
+                taxa = progresso["rate"]
+                tempo_esperado = tentativas / taxa if taxa else float("inf")
+                progresso_barra.progress(min(progresso["elapsed"] / tempo_maximo, 1.0))
+                progresso_info.markdown(
+                    f"🔎 **{progresso['checked']:,}** chaves testadas em {progresso['elapsed']:.1f} s · "
+                    f"**{taxa:,.0f} chaves/s** · tempo esperado: **{formatar_duracao(tempo_esperado)}**"
+                    .replace(",", ".")
+                )
+                resultado = progresso
+            
+            if resultado and resultado["private_key"] is not None:
+                progresso_barra.progress(1.0)
+                st.success(f"✅ Encontrado! Endereço: **{resultado['address']}**")
+                st.code(
+                    f"Chave privada: {resultado['private_key']:064x}\n"
+                    f"Chave pública: {resultado['public_key']}",
+                    language=None
+                )
+            else:
+                st.warning("⏱️ Tempo esgotado sem encontrar o prefixo. Tente um prefixo menor ou mais tempo.")
+            
+            # Extrapola para a força bruta de uma chave inteira de 256 bits
+            if resultado and resultado["rate"]:
+                st.info(
+                    f"💡 Nesse ritmo, um prefixo de 8 dígitos levaria "
+                    f"**{formatar_duracao(16 ** 8 / resultado['rate'])}**, e adivinhar uma chave privada "
+                    f"de 256 bits levaria **{formatar_duracao(2 ** 255 / resultado['rate'])}**."
+                )
+        except ValueError as e:
+            st.error(f"⚠️ {str(e)}")
 
 # ==================== CONCEITOS IMPORTANTES ====================
 
@@ -0,0 +1,61 @@
+# paginas.py
+# Registro das páginas do menu lateral.
+#
+# Cada página é importada só quando é escolhida pela primeira vez; depois o
+# módulo fica guardado e é reaproveitado em todas as execuções do script.
+# Assim, abrir a Cifra de César não carrega pycryptodome nem cryptography.
+import importlib
+import threading
+import time
+
+from educasec import perf
+
+# Nome exibido no menu -> módulo que contém a função app() da página
+PAGINAS = {
+    "Cifra de César": "cesar",
+    "Cifra de Vigenère": "vigenere",
+    "Substituição": "substituicao",
+    "Análise de Frequência": "frequencia",
+    "Enigma": "enigma",
+    "XOR / One-Time Pad": "xor",
+    "AES": "aes",
+    "RSA": "rsa",
+    "ECC": "ecc",
+    "Hash": "hash",
+}
+
+# Módulos já importados e quanto tempo cada importação levou (segundos)
+_modulos = {}
+_tempos_importacao = {}
+_trava = threading.Lock()
+
+def carregar_pagina(nome):
+    """
+    Devolve o módulo da página, importando-o na primeira vez que é pedido.
+    """
+    modulo = _modulos.get(nome)
+    if modulo is not None:
+        return modulo
+    with _trava:
+        if nome not in _modulos:
+            inicio = time.perf_counter()
+            _modulos[nome] = importlib.import_module(PAGINAS[nome])
+            _tempos_importacao[nome] = time.perf_counter() - inicio
+            if perf.ativo():
+                perf.registrar(f"importacao.{PAGINAS[nome]}", _tempos_importacao[nome])
+        return _modulos[nome]
+
+def exibir_pagina(nome):
+    """
+    Importa (se preciso) e executa a função app() da página escolhida,
+    medindo o tempo de execução quando a instrumentação está ligada.
+    """
+    modulo = carregar_pagina(nome)
+    with perf.medir(f"pagina.{PAGINAS[nome]}"):
+        modulo.app()
+
+def tempos_importacao():
+    """
+    Tempo de importação de cada página já carregada neste processo.
+    """
+    return dict(_tempos_importacao)
@@ -1,11 +1,8 @@
 import streamlit as st
-import base64
 
 # Verificação de bibliotecas
 try:
-    from Crypto.Util import number
-    from Crypto.PublicKey import RSA as CryptoRSA
-    from Crypto.Cipher import PKCS1_OAEP
+    from educasec.rsa import generate_key_pair, key_to_pem, encrypt_message, decrypt_message
 except ImportError:
     st.error("""
     ⚠️ A biblioteca `pycryptodome` não foi encontrada.
@@ -16,60 +13,6 @@ except ImportError:
     """)
     st.stop()
 
-# --- Funções de Ajuda ---
-def generate_key_pair(bits):
-    """
-    Gera um par de chaves RSA (pública e privada) usando PyCryptodome.
-    """
-    key = CryptoRSA.generate(bits)
-    
-    public_key = key.publickey()
-    
-    # Extrai os componentes
-    n = key.n
-    e = key.e
-    d = key.d
-    
-    return key, public_key, (e, n, d)
-
-def key_to_pem(key, is_private=True):
-    """
-    Converte a chave para formato PEM.
-    """
-    if is_private:
-        return key.export_key().decode('utf-8')
-    else:
-        return key.export_key().decode('utf-8')
-
-def encrypt_message(public_key_pem, plaintext):
-    """
-    Criptografa uma mensagem usando PKCS1_OAEP (seguro).
-    """
-    public_key = CryptoRSA.import_key(public_key_pem)
-    cipher = PKCS1_OAEP.new(public_key)
-    
-    # Divide a mensagem em blocos se necessário
-    message_bytes = plaintext.encode('utf-8')
-    max_chunk_size = (public_key.size_in_bytes() - 2 * 20 - 2)  # Para OAEP com SHA-1
-    
-    if len(message_bytes) > max_chunk_size:
-        raise ValueError(f"Mensagem muito longa! Máximo: {max_chunk_size} bytes ({max_chunk_size} caracteres)")
-    
-    ciphertext = cipher.encrypt(message_bytes)
-    return base64.b64encode(ciphertext).decode('utf-8')
-
-def decrypt_message(private_key_pem, ciphertext_b64):
-    """
-    Descriptografa uma mensagem usando PKCS1_OAEP.
-    """
-    private_key = CryptoRSA.import_key(private_key_pem)
-    cipher = PKCS1_OAEP.new(private_key)
-    
-    ciphertext = base64.b64decode(ciphertext_b64)
-    plaintext_bytes = cipher.decrypt(ciphertext)
-    
-    return plaintext_bytes.decode('utf-8')
-
 # --- Interface do Streamlit ---
 def app():
     st.set_page_config(page_title="RSA Criptografia", page_icon="🔐", layout="wide")
@@ -156,8 +99,6 @@ def app():
                 e, n, d = components
                 
                 # Armazena no session_state
-                st.session_state['private_key_obj'] = private_key
-                st.session_state['public_key_obj'] = public_key
                 st.session_state['private_key_pem'] = key_to_pem(private_key, True)
                 st.session_state['public_key_pem'] = key_to_pem(public_key, False)
                 st.session_state['components'] = (e, n, d)
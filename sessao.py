@@ -0,0 +1,260 @@
+# sessao.py
+# Controle de memória do st.session_state.
+#
+# Cada aluno conectado tem o seu próprio session_state, que fica na memória do
+# servidor até a sessão expirar. Este módulo:
+#   - mede o tamanho aproximado de cada chave e de cada sessão;
+#   - guarda valores grandes (documentos, textos) em arquivos temporários,
+#     deixando no session_state só uma referência pequena;
+#   - aplica um limite por sessão, movendo para o disco (ou descartando) as
+#     maiores chaves gerenciadas quando ele é ultrapassado;
+#   - soma os tamanhos de todas as sessões do servidor.
+#
+# Limites configuráveis por variáveis de ambiente:
+#   EDUCASEC_SESSAO_LIMITE_KB  limite de memória por sessão (padrão 2048 KB)
+#   EDUCASEC_BLOB_LIMITE_KB    valores maiores que isto vão para o disco (padrão 64 KB)
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import uuid
+import weakref
+
+import streamlit as st
+
+LIMITE_SESSAO = int(os.environ.get("EDUCASEC_SESSAO_LIMITE_KB", 2048)) * 1024
+LIMITE_BLOB = int(os.environ.get("EDUCASEC_BLOB_LIMITE_KB", 64)) * 1024
+
+# Sessões sem atividade há mais tempo que isto deixam de contar nos totais
+SESSAO_INATIVA = 30 * 60
+
+# Chaves onde o próprio gerenciador guarda o identificador da sessão e as
+# chaves gerenciadas (gravadas com guardar(); valor True = pode ser descartada)
+CHAVE_ID = "_sessao_id"
+CHAVE_GERENCIADAS = "_sessao_gerenciadas"
+
+# --- Medição ---
+
+def tamanho_aproximado(valor, vistos=None):
+    """
+    Tamanho aproximado (bytes) de um valor e de tudo o que ele contém.
+    """
+    if vistos is None:
+        vistos = set()
+    if id(valor) in vistos:
+        return 0
+    vistos.add(id(valor))
+
+    tamanho = sys.getsizeof(valor, 0)
+    if isinstance(valor, (str, bytes, bytearray, int, float, bool, type(None))):
+        return tamanho
+    if isinstance(valor, BlobEmDisco):
+        return tamanho
+    if isinstance(valor, dict):
+        return tamanho + sum(
+            tamanho_aproximado(k, vistos) + tamanho_aproximado(v, vistos) for k, v in valor.items()
+        )
+    if isinstance(valor, (list, tuple, set, frozenset)):
+        return tamanho + sum(tamanho_aproximado(item, vistos) for item in valor)
+    if hasattr(valor, "__dict__"):
+        return tamanho + tamanho_aproximado(vars(valor), vistos)
+    return tamanho
+
+# --- Armazém em disco ---
+
+class BlobEmDisco:
+    """
+    Referência para um texto ou bloco de bytes guardado em arquivo temporário.
+    O arquivo é apagado quando a referência deixa de existir (a chave foi
+    sobrescrita, removida ou a sessão expirou).
+    """
+    __slots__ = ("caminho", "tamanho", "texto", "__weakref__")
+
+    def __init__(self, caminho, tamanho, texto):
+        self.caminho = caminho
+        self.tamanho = tamanho
+        self.texto = texto
+        weakref.finalize(self, _apagar_arquivo, caminho)
+
+    def carregar(self):
+        modo = "r" if self.texto else "rb"
+        with open(self.caminho, modo, encoding="utf-8" if self.texto else None, newline="" if self.texto else None) as f:
+            return f.read()
+
+    def __repr__(self):
+        return f"BlobEmDisco({self.tamanho} bytes)"
+
+def _apagar_arquivo(caminho):
+    try:
+        os.remove(caminho)
+    except OSError:
+        pass
+
+@st.cache_resource
+def pasta_temporaria():
+    """
+    Pasta dos arquivos temporários, criada uma vez por processo e apagada
+    quando o servidor termina.
+    """
+    import atexit
+    pasta = tempfile.mkdtemp(prefix="educasec-sessoes-")
+    atexit.register(shutil.rmtree, pasta, True)
+    return pasta
+
+def para_disco(valor):
+    """
+    Grava um texto (str) ou bytes em um arquivo temporário e devolve a referência.
+    """
+    texto = isinstance(valor, str)
+    caminho = os.path.join(pasta_temporaria(), uuid.uuid4().hex)
+    dados = valor.encode("utf-8") if texto else bytes(valor)
+    with open(caminho, "wb") as f:
+        f.write(dados)
+    return BlobEmDisco(caminho, len(dados), texto)
+
+# --- Acesso ao session_state ---
+
+def guardar(chave, valor, descartavel=False):
+    """
+    Guarda um valor no session_state. Textos e bytes maiores que LIMITE_BLOB
+    vão para o disco. Chaves gravadas assim devem ser lidas com ler(), pois o
+    valor pode ser movido para o disco mais tarde; `descartavel=True` permite
+    apagá-la quando a sessão passar do limite (a página precisa saber recriá-la).
+    """
+    if isinstance(valor, (str, bytes, bytearray)) and tamanho_aproximado(valor) > LIMITE_BLOB:
+        valor = para_disco(valor)
+    st.session_state[chave] = valor
+    st.session_state.setdefault(CHAVE_GERENCIADAS, {})[chave] = descartavel
+
+def ler(chave, padrao=None):
+    """
+    Lê um valor do session_state, trazendo-o do disco se for preciso.
+    """
+    valor = st.session_state.get(chave, padrao)
+    if isinstance(valor, BlobEmDisco):
+        try:
+            return valor.carregar()
+        except OSError:
+            return padrao
+    return valor
+
+def medir_sessao():
+    """
+    Tamanho aproximado de cada chave do session_state desta sessão (bytes na
+    memória) e total guardado em disco.
+    """
+    em_memoria = {}
+    em_disco = 0
+    for chave in list(st.session_state.keys()):
+        valor = st.session_state[chave]
+        em_memoria[chave] = tamanho_aproximado(valor)
+        if isinstance(valor, BlobEmDisco):
+            em_disco += valor.tamanho
+    return em_memoria, em_disco
+
+# --- Limites e totais do servidor ---
+
+class _Registro:
+    """
+    Último tamanho medido de cada sessão do servidor.
+    """
+    def __init__(self):
+        self.trava = threading.Lock()
+        self.sessoes = {}
+
+    def atualizar(self, sessao_id, memoria, disco):
+        agora = time.time()
+        with self.trava:
+            self.sessoes[sessao_id] = (memoria, disco, agora)
+            for antiga in [s for s, (_, _, visto) in self.sessoes.items() if agora - visto > SESSAO_INATIVA]:
+                del self.sessoes[antiga]
+
+    def totais(self):
+        with self.trava:
+            valores = list(self.sessoes.values())
+        return {
+            "sessoes": len(valores),
+            "memoria": sum(memoria for memoria, _, _ in valores),
+            "disco": sum(disco for _, disco, _ in valores),
+            "maior_sessao": max((memoria for memoria, _, _ in valores), default=0),
+        }
+
+@st.cache_resource
+def registro_servidor():
+    return _Registro()
+
+def aplicar_limites():
+    """
+    Mede a sessão atual e, se ela passar de LIMITE_SESSAO, move para o disco
+    as maiores chaves gerenciadas de texto/bytes; se ainda não bastar, apaga
+    as maiores chaves descartáveis. Deve ser chamada no fim de cada execução
+    do script.
+    """
+    if CHAVE_ID not in st.session_state:
+        st.session_state[CHAVE_ID] = uuid.uuid4().hex
+    gerenciadas = st.session_state.get(CHAVE_GERENCIADAS, {})
+    em_memoria, em_disco = medir_sessao()
+    total = sum(em_memoria.values())
+
+    candidatas = sorted(
+        (chave for chave in gerenciadas if chave in em_memoria),
+        key=lambda chave: -em_memoria[chave]
+    )
+    for chave in candidatas:
+        if total <= LIMITE_SESSAO:
+            break
+        valor = st.session_state[chave]
+        if isinstance(valor, (str, bytes, bytearray)):
+            blob = para_disco(valor)
+            st.session_state[chave] = blob
+            total -= em_memoria[chave]
+            em_memoria[chave] = tamanho_aproximado(blob)
+            total += em_memoria[chave]
+            em_disco += blob.tamanho
+
+    for chave in candidatas:
+        if total <= LIMITE_SESSAO:
+            break
+        if gerenciadas[chave] and chave in st.session_state:
+            del st.session_state[chave]
+            del gerenciadas[chave]
+            total -= em_memoria.pop(chave)
+
+    registro_servidor().atualizar(st.session_state[CHAVE_ID], total, em_disco)
+    return em_memoria, em_disco
+
+def formatar_bytes(tamanho):
+    for unidade in ("B", "KB", "MB"):
+        if tamanho < 1024:
+            return f"{tamanho:.0f} {unidade}" if unidade == "B" else f"{tamanho:.1f} {unidade}"
+        tamanho /= 1024
+    return f"{tamanho:.1f} GB"
+
+def painel_memoria():
+    """
+    Aplica os limites da sessão e mostra o uso de memória na barra lateral.
+    """
+    em_memoria, em_disco = aplicar_limites()
+    totais = registro_servidor().totais()
+    with st.sidebar.expander("🧠 Memória das sessões"):
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("Esta sessão", formatar_bytes(sum(em_memoria.values())),
+                      help=f"Limite: {formatar_bytes(LIMITE_SESSAO)}")
+        with col2:
+            st.metric("Servidor", formatar_bytes(totais["memoria"]),
+                      help=f"{totais['sessoes']} sessões ativas nos últimos {SESSAO_INATIVA // 60} min")
+        st.caption(
+            f"Em disco: {formatar_bytes(em_disco)} nesta sessão, "
+            f"{formatar_bytes(totais['disco'])} no servidor · "
+            f"maior sessão: {formatar_bytes(totais['maior_sessao'])}"
+        )
+        maiores = sorted(em_memoria.items(), key=lambda item: -item[1])[:8]
+        if maiores:
+            st.dataframe(
+                [{"Chave": chave, "Tamanho": formatar_bytes(tamanho)} for chave, tamanho in maiores],
+                hide_index=True,
+                use_container_width=True
+            )
@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import streamlit as st
+
+from educasec import perf
+
+try:
+    from educasec.quadgram import IDIOMAS
+    from educasec.substituicao import (
+        criptografar_substituicao, decriptografar_substituicao, gerar_chave, quebrar_recomeco
+    )
+except ImportError:
+    st.error("❌ Esta página requer o numpy. Instale com: pip install numpy")
+    st.stop()
+
+@st.cache_resource
+def executor_solucionador():
+    """
+    Processos que rodam os recomeços do solucionador, compartilhados por todas
+    as sessões. Cada recomeço é independente, então eles rodam em paralelo.
+    """
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn")
+    )
+
+def mostrar_melhor(espaco, texto_cifrado, nota, chave, concluidos, total, inicio):
+    """
+    Mostra a melhor chave encontrada até agora e o texto decifrado com ela.
+    """
+    with espaco.container():
+        st.progress(concluidos / total, text=f"{concluidos} de {total} recomeços · {time.perf_counter() - inicio:.1f} s")
+        st.markdown(f"**Melhor chave até agora:** `{chave}` (nota {nota:.1f})")
+        st.success(decriptografar_substituicao(texto_cifrado, chave))
+
+# O código para a cifra de substituição deve estar dentro de uma função.
+# A função será importada pelo arquivo principal (app.py).
+def app():
+    """
+    Exibe a página da Cifra de Substituição e do solucionador.
+    """
+    st.title("🔀 Cifra de Substituição")
+    st.write(
+        "Cada letra do alfabeto é trocada por outra, sempre a mesma, de acordo com uma chave "
+        "que embaralha as 26 letras. São mais de 400 setilhões de chaves possíveis, mas a cifra "
+        "cai facilmente com um pouco de estatística."
+    )
+    st.markdown("---")
+
+    ## Criptografar
+    st.header("Criptografar")
+    if "substituicao_chave" not in st.session_state:
+        st.session_state["substituicao_chave"] = gerar_chave()
+    if st.button("🎲 Gerar chave aleatória"):
+        st.session_state["substituicao_chave"] = gerar_chave()
+
+    chave = st.text_input(
+        "Chave (as 26 letras, na ordem em que substituem A, B, C...):",
+        key="substituicao_chave"
+    )
+    st.caption("ABCDEFGHIJKLMNOPQRSTUVWXYZ ↓")
+
+    texto_original = st.text_area("Digite o texto:", height=150, key="substituicao_texto")
+    if texto_original:
+        try:
+            texto_criptografado = criptografar_substituicao(texto_original, chave)
+        except ValueError as erro:
+            st.error(f"❌ {erro}")
+        else:
+            st.subheader("Resultado")
+            st.success(f"Texto Criptografado: **{texto_criptografado}**")
+    st.markdown("---")
+
+    ## Quebrar a cifra
+    st.header("🕵️ Quebrar a Cifra")
+    st.write(
+        "O solucionador parte da ordem de frequência (a letra mais comum do texto cifrado vira a mais "
+        "comum da língua), com um pouco de acaso, e troca pares de letras, ficando com cada troca "
+        "que deixa o texto mais parecido com a língua escolhida. Como ele pode parar em uma chave "
+        "\"quase certa\", a busca recomeça várias vezes, em paralelo, e fica com a melhor chave. "
+        "Textos com 300 letras ou mais costumam ser quebrados em poucos segundos."
+    )
+    texto_cifrado = st.text_area("Cole o texto cifrado:", height=150, key="substituicao_cifrado")
+    col1, col2 = st.columns(2)
+    with col1:
+        idioma = st.selectbox("Idioma do texto original:", list(IDIOMAS), format_func=IDIOMAS.get)
+    with col2:
+        recomecos = st.slider("Recomeços:", min_value=4, max_value=64, value=16, step=4)
+
+    if st.button("🔓 Quebrar"):
+        if not texto_cifrado or sum(letra.isascii() and letra.isalpha() for letra in texto_cifrado) < 4:
+            st.warning("Por favor, cole um texto cifrado com pelo menos algumas palavras.")
+            return
+
+        espaco = st.empty()
+        inicio = time.perf_counter()
+        melhor = None
+        with perf.medir("substituicao.quebrar"):
+            executor = executor_solucionador()
+            futuros = []
+            try:
+                for _ in range(recomecos):
+                    futuros.append(executor.submit(quebrar_recomeco, texto_cifrado, idioma, random.getrandbits(32)))
+                for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+                    resultado = futuro.result()
+                    if melhor is None or resultado > melhor:
+                        melhor = resultado
+                    mostrar_melhor(espaco, texto_cifrado, *melhor, concluidos, recomecos, inicio)
+            except BrokenProcessPool:
+                # Um processo morreu e o pool não aceita mais tarefas: ele é
+                # descartado para que a próxima busca, de qualquer sessão, crie outro
+                executor.shutdown(wait=False, cancel_futures=True)
+                if executor_solucionador() is executor:
+                    executor_solucionador.clear()
+                st.error("❌ Um processo do solucionador foi encerrado inesperadamente. Tente de novo.")
+                return
+            finally:
+                # Se o script for interrompido (novo rerun, aba fechada), os
+                # recomeços que ainda não começaram não ocupam o pool compartilhado
+                for futuro in futuros:
+                    futuro.cancel()
+
+        st.info(f"✅ Busca concluída em {time.perf_counter() - inicio:.1f} s. "
+                "Se alguma letra ainda estiver trocada, tente mais recomeços ou um texto mais longo.")
@@ -1,5 +1,10 @@
 import streamlit as st
 
+import sessao
+from educasec import memo
+from educasec.incremental import CifraIncremental, cifra_vigenere
+from educasec.vigenere import criptografar_vigenere
+
 # O código para a cifra de Vigenère deve estar dentro de uma função.
 # A função será importada pelo arquivo principal (app.py).
 def app():
@@ -16,28 +21,27 @@ def app():
     # Entrada da chave
     chave = st.text_input("Digite a chave (uma palavra):").strip()
 
+    ao_vivo = st.toggle("⚡ Modo ao vivo", help="O resultado é atualizado a cada edição do texto (Ctrl+Enter ou ao sair da caixa), cifrando de novo só o trecho alterado.")
+    if not ao_vivo:
+        st.session_state.pop("vigenere_ao_vivo", None)
+
     # Processamento e exibição do resultado
     if texto_original and chave:
-        def criptografar_vigenere(texto, chave):
-            resultado = ""
-            chave_repetida = (chave * (len(texto) // len(chave) + 1))[:len(texto)]
-            chave_idx = 0
+        if ao_vivo:
+            # Guarda o texto cifrado da edição anterior; recomeça se a chave mudar
+            estado = st.session_state.get("vigenere_ao_vivo")
+            if estado is None or estado[0] != chave:
+                estado = (chave, CifraIncremental(*cifra_vigenere(chave)))
+                st.session_state["vigenere_ao_vivo"] = estado
+            texto_criptografado = estado[1].atualizar(texto_original)
+            st.caption(f"⚡ {estado[1].recifrados} de {len(texto_original)} caracteres cifrados nesta atualização")
+        else:
+            texto_criptografado, _ = memo.memorizar("vigenere", criptografar_vigenere, texto_original, chave)
 
-            for char in texto:
-                if 'a' <= char <= 'z':
-                    shift = ord(chave_repetida[chave_idx].lower()) - ord('a')
-                    resultado += chr((ord(char) - ord('a') + shift) % 26 + ord('a'))
-                    chave_idx = (chave_idx + 1) % len(chave)
-                elif 'A' <= char <= 'Z':
-                    shift = ord(chave_repetida[chave_idx].upper()) - ord('A')
-                    resultado += chr((ord(char) - ord('A') + shift) % 26 + ord('A'))
-                    chave_idx = (chave_idx + 1) % len(chave)
-                else:
-                    resultado += char
-            return resultado
+        # Disponível para a página de Análise de Frequência
+        sessao.guardar("ultima_saida", texto_criptografado, descartavel=True)
+        st.session_state["ultima_saida_origem"] = "Cifra de Vigenère"
 
-        texto_criptografado = criptografar_vigenere(texto_original, chave)
-        
         st.subheader("Resultado")
         st.success(f"Texto Criptografado: **{texto_criptografado}**")
     elif not chave and texto_original:
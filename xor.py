@@ -0,0 +1,153 @@
+import io
+import os
+import time
+
+import streamlit as st
+
+import sessao
+from desempenho import mostrar_vazao
+from educasec import perf
+
+try:
+    from educasec.xor import arrastar_palpite, gerar_chave_fluxo, xor_bytes, xor_fluxo
+except ImportError:
+    st.error("❌ Esta página requer o numpy. Instale com: pip install numpy")
+    st.stop()
+
+MENSAGEM_1 = "Encontro na biblioteca amanha as oito horas para estudar para a prova"
+MENSAGEM_2 = "A senha do servidor da escola nunca deve ser anotada em papel"
+
+def processar_envio(arquivo, arquivo_chave):
+    """
+    XOR de um arquivo enviado pelo navegador. Sem arquivo de chave, gera uma
+    chave aleatória do mesmo tamanho (one-time pad).
+    """
+    arquivo.seek(0)
+    chave_gerada = None
+    if arquivo_chave is None:
+        chave_gerada = io.BytesIO()
+        gerar_chave_fluxo(chave_gerada, arquivo.size)
+        chave_gerada.seek(0)
+    else:
+        arquivo_chave.seek(0)
+
+    saida = io.BytesIO()
+    inicio = time.perf_counter()
+    with perf.medir("xor.arquivo"):
+        total = xor_fluxo(arquivo, chave_gerada or arquivo_chave, saida)
+    segundos = time.perf_counter() - inicio
+
+    # Arquivos grandes vão para o disco até o download
+    sessao.guardar("xor_saida", saida.getvalue(), descartavel=True)
+    if chave_gerada is not None:
+        sessao.guardar("xor_chave_gerada", chave_gerada.getvalue(), descartavel=True)
+    else:
+        st.session_state.pop("xor_chave_gerada", None)
+    st.session_state["xor_resultado"] = (arquivo.name, total, segundos)
+
+# O código para a cifra XOR deve estar dentro de uma função.
+# A função será importada pelo arquivo principal (app.py).
+def app():
+    """
+    Exibe a página da cifra XOR / one-time pad.
+    """
+    st.title("➕ XOR e One-Time Pad")
+    st.write(
+        "A operação XOR combina cada bit da mensagem com um bit da chave. Aplicar a mesma chave "
+        "duas vezes devolve a mensagem original. Com uma chave **aleatória**, do **mesmo tamanho** "
+        "da mensagem e usada **uma única vez**, esta é a única cifra comprovadamente inquebrável: "
+        "o one-time pad."
+    )
+    st.markdown("---")
+
+    ## Texto
+    st.header("Cifrar um Texto")
+    texto = st.text_area("Digite a mensagem:", height=100, key="xor_texto")
+    if texto:
+        mensagem = texto.encode("utf-8")
+        nova_chave = st.button("🎲 Nova chave")
+        # A chave vale só para esta mensagem: editar o texto gera outra, senão
+        # cada versão seria cifrada com o mesmo pad (o erro mostrado abaixo)
+        mensagem_da_chave, chave = st.session_state.get("xor_chave_texto", (None, b""))
+        if nova_chave or mensagem_da_chave != mensagem:
+            chave = os.urandom(len(mensagem))
+            st.session_state["xor_chave_texto"] = (mensagem, chave)
+        cifrada = xor_bytes(mensagem, chave)
+        st.text("Chave (hex):")
+        st.code(chave.hex(" "), language="text")
+        st.text("Mensagem cifrada (hex):")
+        st.code(cifrada.hex(" "), language="text")
+        st.success(f"Decifrada com a mesma chave: **{xor_bytes(cifrada, chave).decode('utf-8')}**")
+    st.markdown("---")
+
+    ## Arquivos
+    st.header("Cifrar Arquivos")
+    st.write("Os arquivos são processados em blocos de 1 MB, sem cópias intermediárias. "
+             "Para decifrar, use o arquivo cifrado com a mesma chave. Para arquivos muito grandes, "
+             "use a linha de comando, que não precisa carregá-los na memória: "
+             "`python -m educasec xor --chave-arquivo chave.bin < entrada > saida`.")
+    col1, col2 = st.columns(2)
+    with col1:
+        arquivo = st.file_uploader("Arquivo a cifrar ou decifrar:", key="xor_arquivo")
+    with col2:
+        arquivo_chave = st.file_uploader("Chave (opcional; sem ela, uma chave aleatória é gerada):",
+                                         key="xor_arquivo_chave")
+    if arquivo is not None and st.button("⚙️ Processar arquivo"):
+        try:
+            processar_envio(arquivo, arquivo_chave)
+        except ValueError as erro:
+            st.error(f"❌ {erro}")
+
+    resultado = st.session_state.get("xor_resultado")
+    if resultado:
+        nome, total, segundos = resultado
+        mostrar_vazao(total, segundos)
+        col1, col2 = st.columns(2)
+        with col1:
+            st.download_button("📥 Baixar resultado", data=sessao.ler("xor_saida", b""),
+                               file_name=f"{nome}.xor", mime="application/octet-stream")
+        chave_gerada = sessao.ler("xor_chave_gerada")
+        if chave_gerada is not None:
+            with col2:
+                st.download_button("🔑 Baixar chave gerada", data=chave_gerada,
+                                   file_name=f"{nome}.chave", mime="application/octet-stream")
+    st.markdown("---")
+
+    ## Reuso da chave
+    st.header("⚠️ O Perigo de Reusar a Chave")
+    st.write(
+        "Se a mesma chave cifra duas mensagens, o XOR das duas mensagens cifradas **apaga a chave**: "
+        "C1 ⊕ C2 = (M1 ⊕ K) ⊕ (M2 ⊕ K) = M1 ⊕ M2. Aí basta adivinhar uma palavra de uma das "
+        "mensagens para ler o trecho correspondente da outra."
+    )
+    col1, col2 = st.columns(2)
+    with col1:
+        mensagem_1 = st.text_input("Mensagem 1:", MENSAGEM_1).encode("utf-8")
+    with col2:
+        mensagem_2 = st.text_input("Mensagem 2:", MENSAGEM_2).encode("utf-8")
+    if not mensagem_1 or not mensagem_2:
+        return
+
+    tamanho = min(len(mensagem_1), len(mensagem_2))
+    chave = st.session_state.get("xor_chave_reusada", b"")
+    if len(chave) < max(len(mensagem_1), len(mensagem_2)):
+        chave = os.urandom(max(len(mensagem_1), len(mensagem_2), 128))
+        st.session_state["xor_chave_reusada"] = chave
+    cifrada_1 = xor_bytes(mensagem_1, chave[:len(mensagem_1)])
+    cifrada_2 = xor_bytes(mensagem_2, chave[:len(mensagem_2)])
+    xor_cifradas = xor_bytes(cifrada_1[:tamanho], cifrada_2[:tamanho])
+
+    st.text("C1 ⊕ C2 (a chave sumiu; é igual a M1 ⊕ M2):")
+    st.code(xor_cifradas.hex(" "), language="text")
+    palpite = st.text_input("Palpite: uma palavra que pode estar em uma das mensagens (ex.: \" senha \"):")
+    if palpite:
+        revelados = arrastar_palpite(xor_cifradas, palpite)
+        if revelados:
+            st.write("Posições onde o palpite revela um texto legível na outra mensagem:")
+            st.dataframe(
+                [{"Posição": posicao, "Trecho revelado": trecho} for posicao, trecho in revelados[:10]],
+                hide_index=True,
+                use_container_width=True
+            )
+        else:
+            st.info("Nenhuma posição revelou um texto legível. Tente outra palavra.")